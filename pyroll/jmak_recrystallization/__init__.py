@@ -1,11 +1,45 @@
+import importlib
+
 from .material_data import (
     JMAKRecrystallizationParameters,
     JMAKGrainGrowthParameters,
+    JMAKMaterialParameters,
+    material_parameters,
+    MATERIALS,
 )
+from .config import Config, config_scope
+from .codes import RecrystallizationMechanism, RecrystallizationState
+from .kinetics import KineticsBackend, JMAKBackend, register_backend
+from .diagnostics import Diagnostics, collect_diagnostics
 
 __all__ = [
     "JMAKRecrystallizationParameters",
     "JMAKGrainGrowthParameters",
+    "JMAKMaterialParameters",
+    "material_parameters",
+    "MATERIALS",
+    "Config",
+    "config_scope",
+    "RecrystallizationMechanism",
+    "RecrystallizationState",
+    "KineticsBackend",
+    "JMAKBackend",
+    "register_backend",
+    "Diagnostics",
+    "collect_diagnostics",
+    "evaluate_microstructure",
+    "solve_concurrently",
+    "solve_lean",
+    "MicrostructureRecord",
+    "JMAKState",
+    "screen_materials",
+    "ThermomechanicalHistory",
+    "compile_schedule",
+    "ScheduleProgram",
+    "optimize_schedule",
+    "ParetoFront",
+    "ParticleFilter",
+    "ParticleEstimate",
     "VERSION",
 ]
 
@@ -13,6 +47,8 @@ from . import profile
 from . import unit
 from . import roll_pass
 from . import transport
+from . import deferred
+from .deferred import evaluate_microstructure
 
 from pyroll.core import root_hooks, Unit
 
@@ -20,3 +56,33 @@ root_hooks.add(Unit.OutProfile.recrystallized_fraction)
 root_hooks.add(Unit.OutProfile.grain_size)
 
 VERSION = "3.0.0"
+
+_LAZY_ATTRIBUTES = {
+    "solve_concurrently": ".parallel",
+    "solve_lean": ".lean",
+    "MicrostructureRecord": ".lean",
+    "JMAKState": ".checkpoint",
+    "screen_materials": ".screening",
+    "ThermomechanicalHistory": ".program",
+    "compile_schedule": ".program",
+    "ScheduleProgram": ".program",
+    "optimize_schedule": ".optimization",
+    "ParetoFront": ".optimization",
+    "ParticleFilter": ".estimation",
+    "ParticleEstimate": ".estimation",
+}
+"""Attributes of optional features imported on first access to keep them off the import path."""
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name, None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
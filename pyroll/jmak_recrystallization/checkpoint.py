@@ -0,0 +1,169 @@
+"""
+Snapshots of the microstructure state at unit boundaries to resume solutions from.
+
+A :py:class:`JMAKState` holds all values the model needs to continue at a unit boundary.
+It can be stored as plain dictionary, e.g. in JSON format, and applied to the incoming profile of a later solution,
+so that upstream units have to be solved only once.
+The thermal and geometrical state is not part of the snapshot, it is given by the profile the snapshot is applied to.
+"""
+
+import dataclasses
+from typing import Optional, Dict, Any
+
+from pyroll.core import Unit, Profile, BaseRollPass
+
+from .common import previous_strain_rate
+from .material_data import (
+    JMAKRecrystallizationParameters,
+    JMAKGrainGrowthParameters,
+    JMAKMaterialParameters,
+    DEFAULT_BACKEND,
+)
+
+STATE_VERSION = 1
+"""Version of the format of :py:meth:`JMAKState.to_dict`, increased on incompatible changes."""
+
+_PARAMETER_HOOKS = {
+    "dynamic": "jmak_dynamic_recrystallization_parameters",
+    "metadynamic": "jmak_metadynamic_recrystallization_parameters",
+    "static": "jmak_static_recrystallization_parameters",
+    "grain_growth": "jmak_grain_growth_parameters",
+}
+
+_STATE_HOOKS = {
+    "previous_recrystallization_mechanism",
+    "previous_strain_rate",
+    *_PARAMETER_HOOKS.values(),
+}
+"""Names of profile hooks only set by :py:meth:`JMAKState.apply`, which are dropped before applying another state."""
+
+
+@dataclasses.dataclass(frozen=True)
+class JMAKState:
+    """State of the microstructure at a unit boundary."""
+
+    recrystallized_fraction: float
+    """Recrystallized fraction of the outgoing profile."""
+
+    grain_size: float
+    """Grain size of the outgoing profile."""
+
+    strain: float
+    """Retained strain of the outgoing profile."""
+
+    previous_mechanism: str
+    """Recrystallization mechanism of the unit."""
+
+    previous_strain_rate: Optional[float]
+    """Strain rate of the last roll pass, ``None`` if there was none."""
+
+    parameters: JMAKMaterialParameters
+    """Parameter sets active in the outgoing profile."""
+
+    @classmethod
+    def from_unit(cls, unit: Unit) -> "JMAKState":
+        """Take the state at the exit of a solved unit."""
+        profile = unit.out_profile
+
+        if isinstance(unit, BaseRollPass):
+            strain_rate = unit.strain_rate
+        else:
+            try:
+                strain_rate = previous_strain_rate(unit)
+            except AttributeError:
+                strain_rate = None
+
+        return cls(
+            recrystallized_fraction=float(profile.recrystallized_fraction),
+            grain_size=float(profile.grain_size),
+            strain=float(profile.strain),
+            previous_mechanism=unit.recrystallization_mechanism,
+            previous_strain_rate=None if strain_rate is None else float(strain_rate),
+            parameters=JMAKMaterialParameters(
+                **{
+                    name: getattr(profile, hook) if profile.has_value(hook) else None
+                    for name, hook in _PARAMETER_HOOKS.items()
+                },
+                backend=profile.recrystallization_kinetics_backend,
+            ),
+        )
+
+    def apply(self, profile: Profile) -> Profile:
+        """
+        Return a copy of ``profile`` with the values of this state set, to be used as incoming profile.
+        Values of a state applied to ``profile`` before are dropped, so optional values missing in this state, like the
+        strain rate or parameter sets, do not leak from the former one and are determined by the hooks again.
+        """
+        values = {
+            k: v
+            for k, v in profile.__dict__.items()
+            if not k.startswith("_") and k not in _STATE_HOOKS
+        }
+        values.update(
+            recrystallized_fraction=self.recrystallized_fraction,
+            grain_size=self.grain_size,
+            strain=self.strain,
+            previous_recrystallization_mechanism=self.previous_mechanism,
+            recrystallization_kinetics_backend=self.parameters.backend,
+        )
+
+        if self.previous_strain_rate is not None:
+            values["previous_strain_rate"] = self.previous_strain_rate
+
+        for name, hook in _PARAMETER_HOOKS.items():
+            parameters = getattr(self.parameters, name)
+            if parameters is not None:
+                values[hook] = parameters
+
+        return Profile(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary of plain values, e.g. for storage as JSON."""
+        return {
+            "version": STATE_VERSION,
+            "recrystallized_fraction": self.recrystallized_fraction,
+            "grain_size": self.grain_size,
+            "strain": self.strain,
+            "previous_mechanism": self.previous_mechanism,
+            "previous_strain_rate": self.previous_strain_rate,
+            "parameters": {
+                name: None if p is None else dataclasses.asdict(p)
+                for name, p in self.parameters._asdict().items()
+                if name in _PARAMETER_HOOKS
+            },
+            "backend": self.parameters.backend,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JMAKState":
+        """
+        Restore from a dictionary created by :py:meth:`to_dict`.
+
+        :raises ValueError: if the version of the data is not supported
+        """
+        version = data.get("version", None)
+        if version != STATE_VERSION:
+            raise ValueError(
+                f"Unsupported version of JMAK state: {version}, expected {STATE_VERSION}."
+            )
+
+        parameters = data["parameters"]
+
+        def _parameters(name, parameters_type):
+            values = parameters.get(name, None)
+            return None if values is None else parameters_type(**values)
+
+        return cls(
+            recrystallized_fraction=data["recrystallized_fraction"],
+            grain_size=data["grain_size"],
+            strain=data["strain"],
+            previous_mechanism=data["previous_mechanism"],
+            previous_strain_rate=data["previous_strain_rate"],
+            parameters=JMAKMaterialParameters(
+                dynamic=_parameters("dynamic", JMAKRecrystallizationParameters),
+                metadynamic=_parameters("metadynamic", JMAKRecrystallizationParameters),
+                static=_parameters("static", JMAKRecrystallizationParameters),
+                grain_growth=_parameters("grain_growth", JMAKGrainGrowthParameters),
+                backend=data.get("backend", DEFAULT_BACKEND),
+            ),
+        )
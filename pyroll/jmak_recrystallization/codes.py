@@ -0,0 +1,84 @@
+"""
+Compact codes of the recrystallization mechanism and state.
+
+The members are strings equal to the values used by the hooks before, e.g. ``RecrystallizationMechanism.STATIC ==
+"static"``, so comparisons with strings and serialized values keep working.
+Each member has a small integer code, so arrays of mechanisms or states can be stored as ``numpy.int8`` and
+compared elementwise without string operations.
+"""
+
+import enum
+
+import numpy as np
+
+CODE_DTYPE = np.int8
+"""Type of arrays of codes."""
+
+
+class _CodedEnum(str, enum.Enum):
+    """String enumeration whose members are numbered in order of definition."""
+
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+    @property
+    def code(self) -> int:
+        """Integer code of the member."""
+        return type(self)._member_names_.index(self.name)
+
+    @classmethod
+    def from_code(cls, code: int):
+        """Member with the integer ``code``."""
+        return cls[cls._member_names_[code]]
+
+    @classmethod
+    def encode(cls, values) -> np.ndarray:
+        """
+        Array of codes of ``values``, given as strings, members or codes.
+
+        :raises ValueError: if a value is not one of the members
+        """
+        values = np.asarray(values)
+        if values.dtype.kind in "iu":
+            invalid = (values < 0) | (values >= len(cls))
+            if np.any(invalid):
+                unknown = sorted(set(values[invalid].tolist()))
+                raise ValueError(f"Unknown values of {cls.__name__}: {unknown}.")
+            return values.astype(CODE_DTYPE, copy=False)
+
+        codes = np.full(values.shape, -1, dtype=CODE_DTYPE)
+        for code, member in enumerate(cls):
+            codes[values == member.value] = code
+
+        if np.any(codes < 0):
+            unknown = sorted(set(values[codes < 0].astype(str).tolist()))
+            raise ValueError(f"Unknown values of {cls.__name__}: {unknown}.")
+        return codes
+
+    @classmethod
+    def decode(cls, codes) -> np.ndarray:
+        """Array of the string values of ``codes``."""
+        return np.array([m.value for m in cls])[np.asarray(codes)]
+
+    @classmethod
+    def mask(cls, codes, *members) -> np.ndarray:
+        """Boolean array marking where ``codes`` equal the code of one of ``members``."""
+        return np.isin(codes, [cls(m).code for m in members])
+
+
+class RecrystallizationMechanism(_CodedEnum):
+    """Primary recrystallization mechanism acting in a unit, see ``Unit.recrystallization_mechanism``."""
+
+    NONE = "none"
+    DYNAMIC = "dynamic"
+    METADYNAMIC = "metadynamic"
+    STATIC = "static"
+    GRAIN_GROWTH = "grain_growth"
+
+
+class RecrystallizationState(_CodedEnum):
+    """Recrystallization state of a profile, see ``Profile.recrystallization_state``."""
+
+    NONE = "none"
+    PARTIAL = "partial"
+    FULL = "full"
@@ -1,8 +1,19 @@
-import numpy as np
+from contextvars import ContextVar
 
-from .material_data import JMAKRecrystallizationParameters
-from pyroll.core import Unit, Config
-from .config import Config as LocalConfig
+from pyroll.core import Unit, BaseRollPass
+
+from . import kinetics
+from .config import Config
+
+evaluating_microstructure: ContextVar[bool] = ContextVar(
+    "pyroll_jmak_recrystallization_evaluating_microstructure", default=False
+)
+"""Whether the deferred evaluation pass is running in the current context."""
+
+
+def microstructure_deferred() -> bool:
+    """Whether the microstructure is currently deferred, i.e. deferred evaluation is enabled and not running."""
+    return Config.DEFERRED_MICROSTRUCTURE and not evaluating_microstructure.get()
 
 
 def average_temperature(unit: Unit):
@@ -10,31 +21,36 @@ def average_temperature(unit: Unit):
     return (unit.in_profile.temperature + unit.out_profile.temperature) / 2
 
 
+def previous_strain_rate(unit: Unit):
+    """Strain rate of the preceding roll pass, taken from the in profile if there is none in the sequence."""
+    try:
+        return unit.prev_of(BaseRollPass).strain_rate
+    except (IndexError, ValueError):
+        return unit.in_profile.previous_strain_rate
+
+
+def kinetics_backend(unit: Unit) -> kinetics.KineticsBackend:
+    """Kinetics backend selected for the material of the unit."""
+    return kinetics.get_backend(unit.in_profile.recrystallization_kinetics_backend)
+
+
 def critical_value_function(unit: Unit, strain_rate: float):
     p = unit.in_profile
-    parameters = unit.jmak_recrystallization_parameters
-
-    return (
-        parameters.a1
-        * (p.strain + LocalConfig.BASE_STRAIN) ** parameters.a2
-        * (strain_rate + LocalConfig.BASE_STRAIN_RATE) ** parameters.a3
-        * (p.grain_size * 1e6) ** parameters.a4
-        * np.exp(
-            parameters.qa / (Config.UNIVERSAL_GAS_CONSTANT * average_temperature(unit))
-        )
+    return kinetics_backend(unit).critical_value(
+        unit.jmak_recrystallization_parameters,
+        p.strain,
+        strain_rate,
+        p.grain_size,
+        average_temperature(unit),
     )
 
 
 def reference_value_function(unit: Unit, strain_rate: float):
     p = unit.in_profile
-    parameters = unit.jmak_recrystallization_parameters
-
-    return (
-        parameters.b1
-        * (p.strain + LocalConfig.BASE_STRAIN) ** parameters.b2
-        * (strain_rate + LocalConfig.BASE_STRAIN_RATE) ** parameters.b3
-        * (p.grain_size * 1e6) ** parameters.b4
-        * np.exp(
-            parameters.qb / (Config.UNIVERSAL_GAS_CONSTANT * average_temperature(unit))
-        )
+    return kinetics_backend(unit).reference_value(
+        unit.jmak_recrystallization_parameters,
+        p.strain,
+        strain_rate,
+        p.grain_size,
+        average_temperature(unit),
     )
@@ -1,6 +1,41 @@
-from pyroll.core import config
+from contextlib import contextmanager
+from contextvars import ContextVar
 
+from pyroll.core import config, ConfigValue
 
+_scoped_values: ContextVar[dict] = ContextVar(
+    "pyroll_jmak_recrystallization_scoped_config", default={}
+)
+
+
+class _ScopedConfigValue(ConfigValue):
+    """Config value descriptor preferring values set in the current :py:func:`config_scope`."""
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        scoped = _scoped_values.get()
+        if self.name in scoped:
+            return scoped[self.name]
+
+        return super().__get__(instance, owner)
+
+
+def _context_scoped(cls):
+    """Replace the config value descriptors of a config class with context-aware ones."""
+    meta = type(cls)
+    for name, value in list(vars(meta).items()):
+        if isinstance(value, ConfigValue):
+            scoped = _ScopedConfigValue(
+                value.default, env_var=value.env_var, parser=value.parser
+            )
+            scoped.__set_name__(meta, name)
+            setattr(meta, name, scoped)
+    return cls
+
+
+@_context_scoped
 @config("PYROLL_JMAK_RECRYSTALLIZATION")
 class Config:
     THRESHOLD = 0.05
@@ -8,3 +43,46 @@ class Config:
 
     BASE_STRAIN = 0.01
     BASE_STRAIN_RATE = 0.01
+
+    INCREMENTAL_DYNAMIC_RECRYSTALLIZATION = False
+    """Whether to integrate dynamic recrystallization over the disk elements of roll passes."""
+
+    DEFERRED_MICROSTRUCTURE = False
+    """Whether to skip the microstructure during solution and evaluate it afterwards in one pass or on first access."""
+
+
+SCOPE_SAFE_VALUES = frozenset(
+    [
+        "THRESHOLD",
+        "BASE_STRAIN",
+        "BASE_STRAIN_RATE",
+        "INCREMENTAL_DYNAMIC_RECRYSTALLIZATION",
+        "DEFERRED_MICROSTRUCTURE",
+    ]
+)
+"""
+Names of the config values read in the current context on each evaluation, which concurrent solutions may set
+distinctly.
+Values changing process-wide state when switched must not be added.
+"""
+
+
+@contextmanager
+def config_scope(**values):
+    """
+    Context manager overriding config values only within the current context (thread or asyncio task).
+    Values set this way take precedence over process-wide values set on :py:class:`Config`.
+    Scopes can be nested, inner values take precedence.
+
+    :param values: config values to override given as keyword arguments, e.g. ``THRESHOLD=0.1``
+    :raises AttributeError: if one of the names is not a config value
+    """
+    for name in values:
+        if not isinstance(vars(type(Config)).get(name, None), ConfigValue):
+            raise AttributeError(f"{Config} has no config value {name}")
+
+    token = _scoped_values.set(_scoped_values.get() | values)
+    try:
+        yield
+    finally:
+        _scoped_values.reset(token)
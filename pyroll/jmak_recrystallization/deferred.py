@@ -0,0 +1,196 @@
+"""
+Deferred evaluation of the microstructure, enabled by ``Config.DEFERRED_MICROSTRUCTURE``.
+
+By default, the outgoing recrystallized fraction and grain size are root hooks, so the JMAK chain is evaluated in
+every iteration of every unit.
+With deferred evaluation, these root hooks pass the incoming values through and the retained strain of transports is
+left to the default of PyRolL, so the solution does not evaluate any hook of this plugin.
+Once the outermost unit is solved, the values passed through are dropped and the microstructure is evaluated in one
+pass over the units of the sequence, either explicitly by :py:func:`evaluate_microstructure` or on first access of a
+hook of this plugin.
+
+The hook functions and processors are registered once on import and check ``Config.DEFERRED_MICROSTRUCTURE`` in the
+current context, so sequences may be solved concurrently in distinct modes, see :py:func:`config_scope`.
+"""
+
+from pyroll.core import Unit, BaseRollPass, Transport, PassSequence
+
+from .common import evaluating_microstructure, microstructure_deferred
+
+PROFILE_HOOKS = ["strain", "grain_size", "recrystallized_fraction"]
+"""Names of profile hooks set by the evaluation pass."""
+
+UNIT_HOOKS = [
+    Unit.recrystallization_mechanism,
+    Unit.recrystallized_fraction,
+    Unit.recrystallized_grain_size,
+    Unit.jmak_recrystallization_parameters,
+    BaseRollPass.recrystallization_critical_strain,
+    BaseRollPass.recrystallization_reference_strain,
+    BaseRollPass.incremental_dynamic_recrystallization,
+    Transport.recrystallization_critical_time,
+    Transport.recrystallization_reference_time,
+    Transport.recrystallization_finished_time,
+    Transport.recrystallization_curves,
+]
+"""Unit hooks of this plugin triggering the evaluation pass on first access."""
+
+ROOT_HOOKS = [Unit.OutProfile.recrystallized_fraction, Unit.OutProfile.grain_size]
+"""Root hooks of this plugin, passing the incoming values through while the evaluation is deferred."""
+
+_EVALUATED = "_jmak_microstructure_evaluated"
+"""Marker set on the incoming profile of evaluated units, which is created anew on each solution."""
+
+_SOLVING = "_jmak_microstructure_solving"
+"""Marker set on the outermost unit while it is solved with deferred evaluation."""
+
+
+def _evaluate_value(profile: Unit.Profile, name: str):
+    hook = getattr(type(profile), name)
+    value = hook.get_result(profile)
+    return value if value is not None else profile.root_hook_fallback(hook)
+
+
+def _evaluate(unit: Unit, previous: Unit):
+    """Evaluate ``unit`` and its units if it is a pass sequence, starting from the state after ``previous``."""
+    ip = unit.in_profile
+    if previous is not None:
+        for name in PROFILE_HOOKS:
+            ip.__dict__[name] = previous.out_profile.__dict__[name]
+    _clear(unit)
+
+    if isinstance(unit, PassSequence):
+        for u in unit:
+            previous = _evaluate(u, previous)
+        values = {name: previous.out_profile.__dict__[name] for name in PROFILE_HOOKS}
+    else:
+        values = {
+            name: _evaluate_value(unit.out_profile, name) for name in PROFILE_HOOKS
+        }
+
+    unit.out_profile.__dict__.update(values)
+    ip.__dict__[_EVALUATED] = True
+    return unit
+
+
+def evaluate_microstructure(sequence: Unit):
+    """
+    Evaluate the microstructure of a unit or pass sequence solved with deferred evaluation in one pass over its units.
+
+    The retained strain, recrystallized fraction and grain size are set explicitly on the profiles of the units,
+    the remaining hooks of this plugin are evaluated on access from these.
+    Disk elements and other subunits of roll passes or transports are not regarded.
+    """
+    token = evaluating_microstructure.set(True)
+    try:
+        _evaluate(sequence, None)
+    finally:
+        evaluating_microstructure.reset(token)
+
+
+def _clear(unit: Unit):
+    """Drop microstructure values of ``unit`` cached or set from a previous evaluation."""
+    for hook in UNIT_HOOKS:
+        unit.__cache__.pop(hook.name, None)
+
+    for profile in [unit.in_profile, unit.out_profile]:
+        if profile is not None:
+            profile.__cache__.clear()
+
+    if unit.out_profile is not None:
+        for name in PROFILE_HOOKS[1:]:
+            unit.out_profile.__dict__.pop(name, None)
+
+
+def _is_covered(unit: Unit) -> bool:
+    """Whether ``unit`` is regarded by :py:func:`evaluate_microstructure` of its sequence."""
+    return unit.parent is None or isinstance(unit.parent, PassSequence)
+
+
+def _root(unit: Unit) -> Unit:
+    while unit.parent is not None:
+        unit = unit.parent
+    return unit
+
+
+def _trigger(name: str):
+    """Create a hook function evaluating the microstructure on first access, if deferred."""
+
+    def deferred_microstructure_evaluation(self):
+        if not microstructure_deferred():
+            return None
+
+        unit = self if isinstance(self, Unit) else self.unit
+        if (
+            not _is_covered(unit)
+            or unit.in_profile is None
+            or unit.in_profile.__dict__.get(_EVALUATED, False)
+        ):
+            return None
+
+        evaluate_microstructure(_root(unit))
+        return self.__dict__.get(name, None)
+
+    return deferred_microstructure_evaluation
+
+
+def _pass_through(hook):
+    """
+    Create a root hook function passing the incoming value through while a deferred solution is running,
+    and evaluating the microstructure on first access afterwards, if deferred.
+    """
+    trigger = _trigger(hook.name)
+
+    def deferred_microstructure_pass_through(self: Unit.OutProfile):
+        if not microstructure_deferred():
+            return None
+
+        unit = self.unit
+        if not _is_covered(unit) or _root(unit).__dict__.get(_SOLVING, False):
+            return self.root_hook_fallback(hook)
+
+        return trigger(self)
+
+    return deferred_microstructure_pass_through
+
+
+def _clear_deferred(unit: Unit):
+    """Pre-processor factory dropping microstructure values of a previous evaluation, creates no pre-processor."""
+    if microstructure_deferred():
+        _clear(unit)
+        if unit.parent is None:
+            unit.__dict__[_SOLVING] = True
+    return None
+
+
+def _release_deferred(unit: Unit):
+    """
+    Post-processor factory dropping the values passed through the units once the outermost unit is solved,
+    so they are evaluated on first access, creates no post-processor.
+    """
+    if microstructure_deferred() and unit.parent is None:
+        unit.__dict__.pop(_SOLVING, None)
+        _release(unit)
+    return None
+
+
+def _release(unit: Unit):
+    for name in PROFILE_HOOKS[1:]:
+        unit.out_profile.__dict__.pop(name, None)
+
+    if isinstance(unit, PassSequence):
+        for u in unit:
+            _release(u)
+
+
+for _hook in UNIT_HOOKS + [
+    Unit.InProfile.grain_size,
+    Unit.InProfile.recrystallized_fraction,
+]:
+    _hook.add_function(_trigger(_hook.name), tryfirst=True)
+
+for _hook in ROOT_HOOKS:
+    _hook.add_function(_pass_through(_hook), tryfirst=True)
+
+Unit.pre_processors.append(_clear_deferred)
+Unit.post_processors.append(_release_deferred)
@@ -0,0 +1,151 @@
+import logging
+import threading
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Tuple, Union
+
+from pyroll.core import Unit
+
+METADYNAMIC_PARAMETERS_MISSING = "metadynamic_parameters_missing"
+"""Conditions for metadynamic recrystallization met, but no parameters available."""
+
+STATIC_PARAMETERS_MISSING = "static_parameters_missing"
+"""No parameters for static recrystallization available."""
+
+GRAIN_GROWTH_PARAMETERS_MISSING = "grain_growth_parameters_missing"
+"""No parameters for grain growth available."""
+
+MESSAGES = {
+    METADYNAMIC_PARAMETERS_MISSING: "Conditions for metadynamic recrystallization met, but no coefficients available. "
+    "Falling back to static recrystallization.",
+    STATIC_PARAMETERS_MISSING: "No static recrystallization parameters available. "
+    "Falling back to no recrystallization.",
+    GRAIN_GROWTH_PARAMETERS_MISSING: "No grain growth parameters available. "
+    "Falling back to no recrystallization.",
+}
+"""Human-readable messages of the fallback conditions."""
+
+_current: ContextVar[Optional["Diagnostics"]] = ContextVar(
+    "pyroll_jmak_recrystallization_diagnostics", default=None
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _unit_key(unit: Unit) -> Tuple[str, int]:
+    """Key of a unit, its name and its identity, as distinct units may have equal names."""
+    return str(unit), id(unit)
+
+
+class Diagnostics:
+    """Collector counting the occurrences of fallback conditions per unit."""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        """Counts of occurrences keyed by tuples of condition and unit key (tuple of name and id of the unit)."""
+
+        self._reported = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def record(self, condition: str, unit: Unit):
+        """Count an occurrence of ``condition`` in ``unit``."""
+        with self._lock:
+            self.counts[(condition, _unit_key(unit))] += 1
+
+    def first_report(self, condition: str, unit: Unit) -> bool:
+        """Whether ``condition`` is reported for ``unit`` the first time to this collector, marking it as reported."""
+        with self._lock:
+            conditions = self._reported.setdefault(unit, set())
+            if condition in conditions:
+                return False
+            conditions.add(condition)
+            return True
+
+    def count(
+        self, condition: Optional[str] = None, unit: Union[None, str, Unit] = None
+    ) -> int:
+        """Total count of occurrences, optionally filtered by condition and unit, given as instance or name."""
+        return sum(
+            n
+            for (c, u), n in self.counts.items()
+            if (condition is None or c == condition)
+            and (
+                unit is None
+                or (u[0] == unit if isinstance(unit, str) else u[1] == id(unit))
+            )
+        )
+
+    def by_condition(self) -> Dict[str, int]:
+        """Counts of occurrences per condition."""
+        result = Counter()
+        for (c, _), n in self.counts.items():
+            result[c] += n
+        return dict(result)
+
+    def by_unit(self) -> Dict[str, Dict[str, int]]:
+        """Counts of occurrences per name of unit and condition, units of equal name are summed up."""
+        result = {}
+        for (c, (u, _)), n in self.counts.items():
+            conditions = result.setdefault(u, {})
+            conditions[c] = conditions.get(c, 0) + n
+        return result
+
+    def summary(self) -> str:
+        """Multiline summary of all fallback conditions occurred."""
+        lines = []
+        for c, n in self.by_condition().items():
+            units = sorted(u for (c2, u) in self.counts if c2 == c)
+            names = ", ".join(name for name, _ in units)
+            lines.append(
+                f"{MESSAGES.get(c, c)} Occurred {n} times in {len(units)} units: {names}."
+            )
+        return "\n".join(lines)
+
+    def clear(self):
+        """Reset all counts."""
+        with self._lock:
+            self.counts.clear()
+            self._reported.clear()
+
+    def __bool__(self):
+        return bool(self.counts)
+
+
+_default = Diagnostics()
+"""Collector tracking the conditions already logged while no collector is active."""
+
+
+@contextmanager
+def collect_diagnostics(emit_summary: bool = True):
+    """
+    Context manager collecting fallback conditions in a :py:class:`Diagnostics` instance instead of logging each one.
+    Collection is scoped to the current context (thread or asyncio task).
+
+    :param emit_summary: whether to log a single summary warning on exit if any fallback condition occurred
+    """
+    diagnostics = Diagnostics()
+    token = _current.set(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        _current.reset(token)
+        if emit_summary and diagnostics:
+            logger.warning(
+                "Fallbacks in JMAK recrystallization model:\n%s", diagnostics.summary()
+            )
+
+
+def report(unit: Unit, condition: str):
+    """
+    Report the occurrence of a fallback condition in ``unit``.
+    Counted by the active collector, if any, otherwise logged once per unit and condition.
+    """
+    diagnostics = _current.get()
+    if diagnostics is not None:
+        diagnostics.record(condition, unit)
+        return
+
+    if _default.first_report(condition, unit):
+        unit.logger.warning("%s: %s", unit, MESSAGES.get(condition, condition))
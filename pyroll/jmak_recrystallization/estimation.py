@@ -0,0 +1,250 @@
+"""
+Estimation of the microstructure state of a billet from plant measurements by a particle filter.
+
+An ensemble of particles, each a possible incoming state of the billet, is advanced unit by unit through the kinetics
+of a compiled :py:class:`ScheduleProgram`, all particles at once as arrays.
+Besides grain size, recrystallized fraction and strain, each particle carries an offset of the temperature against the
+history, drifting by a random walk from unit to unit, as the temperatures of the compiled solution are uncertain, too.
+Measurements of grain size or temperature weight the particles by their likelihood.
+If the weights degenerate, the particles are resampled and the grain sizes slightly jittered to keep the ensemble
+diverse.
+"""
+
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+from pyroll.core import Unit
+
+from .codes import RecrystallizationMechanism
+from .program import ScheduleProgram, compile_schedule
+
+
+class ParticleEstimate(NamedTuple):
+    """Weighted statistics of the particle ensemble after a unit."""
+
+    label: Optional[str]
+    """Label of the last unit advanced, ``None`` before the first one."""
+    grain_size: float
+    grain_size_deviation: float
+    recrystallized_fraction: float
+    recrystallized_fraction_deviation: float
+    strain: float
+    temperature_offset: float
+    """Mean offset of the temperatures against the history."""
+    effective_sample_size: float
+
+
+class ParticleFilter:
+    """
+    Particle filter tracking the microstructure of one billet through a compiled schedule.
+    Compile the schedule once and create a filter per billet.
+
+    :param schedule: a compiled schedule, or a solved pass sequence to compile
+    :param particles: count of particles
+    :param grain_size: mean incoming grain size, defaults to the one of the compiled sequence
+    :param grain_size_deviation: relative standard deviation of the incoming grain size
+    :param recrystallized_fraction: incoming recrystallized fraction, defaults to the one of the compiled sequence
+    :param recrystallized_fraction_deviation: standard deviation of the incoming recrystallized fraction
+    :param temperature_deviation: standard deviation of the initial temperature offset
+    :param temperature_drift: standard deviation of the change of the temperature offset per unit
+    :param jitter: relative standard deviation of the grain sizes added on resampling
+    :param resampling_threshold: fraction of the count of particles, resampling if the effective sample size drops below
+    :param seed: seed of the random number generator, see :py:func:`numpy.random.default_rng`
+    :param dtype: floating point type to evaluate in, see :py:func:`kinetics.roll_pass_kinetics`
+    """
+
+    def __init__(
+        self,
+        schedule: Union[ScheduleProgram, Unit],
+        particles: int = 1000,
+        grain_size: Optional[float] = None,
+        grain_size_deviation: float = 0.1,
+        recrystallized_fraction: Optional[float] = None,
+        recrystallized_fraction_deviation: float = 0,
+        temperature_deviation: float = 10,
+        temperature_drift: float = 2,
+        jitter: float = 0.01,
+        resampling_threshold: float = 0.5,
+        seed=None,
+        dtype=None,
+    ):
+        self.program = (
+            compile_schedule(schedule) if isinstance(schedule, Unit) else schedule
+        )
+        self.temperature_drift = temperature_drift
+        self.jitter = jitter
+        self.resampling_threshold = resampling_threshold
+        self.dtype = dtype
+        self.rng = np.random.default_rng(seed)
+
+        h = self.program.history
+        if grain_size is None:
+            grain_size = h.in_grain_size
+        if recrystallized_fraction is None:
+            recrystallized_fraction = h.in_recrystallized_fraction
+
+        self.position = 0
+        """Count of units advanced."""
+        self.grain_size = grain_size * np.exp(
+            self.rng.normal(0, grain_size_deviation, particles)
+        )
+        self.recrystallized_fraction = np.clip(
+            self.rng.normal(
+                recrystallized_fraction, recrystallized_fraction_deviation, particles
+            ),
+            0,
+            1,
+        )
+        self.strain = np.full(particles, h.in_strain)
+        self.mechanism = np.full(
+            particles,
+            RecrystallizationMechanism(h.in_previous_mechanism).code,
+            dtype=np.int8,
+        )
+        self.temperature_offset = self.rng.normal(0, temperature_deviation, particles)
+        self.log_weights = np.zeros(particles)
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Normalized weights of the particles."""
+        weights = np.exp(self.log_weights - self.log_weights.max())
+        return weights / weights.sum()
+
+    @property
+    def effective_sample_size(self) -> float:
+        """Count of particles equivalent to the weighted ensemble, dropping as the weights degenerate."""
+        return float(1 / np.sum(self.weights**2))
+
+    def advance(self, until: Optional[str] = None) -> ParticleEstimate:
+        """
+        Advance all particles through the next unit, or through all units up to the one labeled ``until`` inclusively.
+
+        :raises ValueError: if the unit is not part of the remaining schedule
+        """
+        labels = self.program.history.labels
+        end = self.position + 1
+        if until is not None:
+            if until not in labels[self.position :]:
+                raise ValueError(
+                    f"Unit {until!r} is not part of the remaining schedule."
+                )
+            end = labels.index(until, self.position) + 1
+        if end > len(labels):
+            raise ValueError("All units of the schedule have been advanced.")
+
+        for i in range(self.position, end):
+            self.temperature_offset = self.temperature_offset + self.rng.normal(
+                0, self.temperature_drift, len(self.temperature_offset)
+            )
+            result = self.program.evaluate_unit(
+                i,
+                self.strain,
+                self.grain_size,
+                self.recrystallized_fraction,
+                self.mechanism,
+                temperature=self.program.history.temperature[..., i]
+                + self.temperature_offset,
+                dtype=self.dtype,
+            )
+            self.mechanism = result.recrystallization_mechanism
+            self.strain = result.out_strain
+            self.grain_size = result.out_grain_size
+            self.recrystallized_fraction = result.out_recrystallized_fraction
+
+        self.position = end
+        return self.estimate()
+
+    def measure(
+        self,
+        grain_size: Optional[float] = None,
+        grain_size_deviation: float = 0.05,
+        temperature: Optional[float] = None,
+        temperature_deviation: float = 5,
+    ) -> ParticleEstimate:
+        """
+        Weight the particles by measurements after the last unit advanced and resample them if degenerated.
+
+        :param grain_size: measured grain size
+        :param grain_size_deviation: relative standard deviation of the grain size measurement
+        :param temperature: measured mean temperature of the last unit advanced
+        :param temperature_deviation: standard deviation of the temperature measurement
+        :raises ValueError: if a temperature is given before the first unit was advanced
+        """
+        if grain_size is not None:
+            self.log_weights = (
+                self.log_weights
+                - 0.5
+                * (
+                    (np.log(self.grain_size) - np.log(grain_size))
+                    / grain_size_deviation
+                )
+                ** 2
+            )
+
+        if temperature is not None:
+            if self.position == 0:
+                raise ValueError(
+                    "Temperatures can only be measured after a unit was advanced."
+                )
+            modeled = (
+                self.program.history.temperature[..., self.position - 1]
+                + self.temperature_offset
+            )
+            self.log_weights = (
+                self.log_weights
+                - 0.5 * ((modeled - temperature) / temperature_deviation) ** 2
+            )
+
+        self.log_weights = np.where(
+            np.isfinite(self.log_weights), self.log_weights, -np.inf
+        )
+        if not np.any(np.isfinite(self.log_weights)):
+            self.log_weights = np.zeros_like(self.log_weights)
+
+        if self.effective_sample_size < self.resampling_threshold * len(
+            self.log_weights
+        ):
+            self.resample()
+        return self.estimate()
+
+    def resample(self):
+        """Draw particles by systematic resampling according to their weights and reset the weights."""
+        count = len(self.log_weights)
+        positions = (self.rng.uniform() + np.arange(count)) / count
+        indices = np.minimum(
+            np.searchsorted(np.cumsum(self.weights), positions), count - 1
+        )
+
+        self.grain_size = self.grain_size[indices] * np.exp(
+            self.rng.normal(0, self.jitter, count)
+        )
+        self.recrystallized_fraction = self.recrystallized_fraction[indices]
+        self.strain = self.strain[indices]
+        self.mechanism = self.mechanism[indices]
+        self.temperature_offset = self.temperature_offset[indices]
+        self.log_weights = np.zeros(count)
+
+    def estimate(self) -> ParticleEstimate:
+        """Weighted mean and standard deviation of the state of the particles."""
+        weights = self.weights
+
+        def _mean(values):
+            return float(np.sum(weights * values))
+
+        def _deviation(values):
+            return float(np.sqrt(np.sum(weights * (values - _mean(values)) ** 2)))
+
+        return ParticleEstimate(
+            label=(
+                self.program.history.labels[self.position - 1]
+                if self.position
+                else None
+            ),
+            grain_size=_mean(self.grain_size),
+            grain_size_deviation=_deviation(self.grain_size),
+            recrystallized_fraction=_mean(self.recrystallized_fraction),
+            recrystallized_fraction_deviation=_deviation(self.recrystallized_fraction),
+            strain=_mean(self.strain),
+            temperature_offset=_mean(self.temperature_offset),
+            effective_sample_size=self.effective_sample_size,
+        )
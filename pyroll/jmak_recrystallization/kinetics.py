@@ -0,0 +1,960 @@
+"""
+Implementation of the JMAK equations working on plain numbers or numpy arrays.
+Used by the hook functions of this plugin and by the batch evaluators, so that both share the very same equations.
+
+Arrays of single precision are evaluated in single precision (reduced precision mode), except for the terms
+sensitive to rounding, which are evaluated in double precision and rounded afterwards:
+the products of coefficients and Arrhenius terms, which may exceed the range of single precision in intermediate
+steps, and ``log(1 - X)`` in the virtual time, which suffers from cancellation for small ``X``.
+See :py:data:`REDUCED_PRECISION_TOLERANCE` for the resulting accuracy.
+
+The batch evaluators decide the mechanisms on arrays of the integer codes of :py:mod:`.codes`,
+their results contain the strings of the mechanisms or, with ``codes=True``, these codes as ``numpy.int8``.
+
+The equations are evaluated through a :py:class:`KineticsBackend`, the JMAK equations of this module by default.
+Other formulations are registered by name with :py:func:`register_backend` and selected per material by the
+``Profile.recrystallization_kinetics_backend`` hook.
+"""
+
+import dataclasses
+from typing import NamedTuple, Optional, Sequence, Type, TypeVar, Union, Dict
+
+import numpy as np
+from pyroll.core import Config
+
+from .codes import RecrystallizationMechanism, RecrystallizationState
+from .config import Config as LocalConfig
+from .material_data import (
+    JMAKRecrystallizationParameters,
+    JMAKGrainGrowthParameters,
+    JMAKMaterialParameters,
+    DEFAULT_BACKEND,
+    material_parameters,
+)
+
+_DEFAULT_PARAMETERS = JMAKRecrystallizationParameters()
+
+P = TypeVar("P", JMAKRecrystallizationParameters, JMAKGrainGrowthParameters)
+
+REDUCED_PRECISION_TOLERANCE = 1e-3
+"""
+Bound of the deviation of results in reduced precision mode from double precision,
+relative for strains, times and grain sizes, absolute for recrystallized fractions.
+Checked over the parameter sets provided with this package for strains up to 2, strain rates of 0.1 to 100 1/s,
+grain sizes of 10 to 300 µm, temperatures of 800 to 1250 °C and durations of 1 ms to 100 s.
+Not valid where the equations themselves are ill-conditioned: for parameter sets whose critical and reference values
+are nearly equal, as the dynamic recrystallization of ``C-Mn``, and for the grain size after static recrystallization
+in transports whose duration is within 0.1 % of the finished time, where recrystallized grains start to grow from
+almost zero size.
+"""
+
+
+def _reduced(*values) -> bool:
+    """Whether values are given in single precision, selecting the reduced precision mode."""
+    return np.result_type(*values) == np.float32
+
+
+def _scaled_arrhenius_term(coefficient, activation_energy, temperature):
+    """Product of coefficient and Arrhenius term evaluated in double precision and rounded to single precision."""
+    return np.asarray(
+        np.asarray(coefficient, dtype=np.float64)
+        * arrhenius_term(activation_energy, np.asarray(temperature, dtype=np.float64)),
+        dtype=np.float32,
+    )
+
+
+def cast_parameters(parameters: Optional[P], dtype) -> Optional[P]:
+    """Parameter set with all fields converted to ``dtype``, e.g. for the reduced precision mode."""
+    if parameters is None:
+        return None
+    return type(parameters)(
+        **{
+            f.name: np.asarray(getattr(parameters, f.name), dtype=dtype)
+            for f in dataclasses.fields(parameters)
+        }
+    )
+
+
+def arrhenius_term(activation_energy, temperature):
+    """Arrhenius term of the power law equations."""
+    return np.exp(activation_energy / (Config.UNIVERSAL_GAS_CONSTANT * temperature))
+
+
+def _power_law(
+    coefficient,
+    strain_exponent,
+    strain_rate_exponent,
+    grain_size_exponent,
+    activation_energy,
+    strain,
+    strain_rate,
+    grain_size,
+    temperature,
+):
+    if _reduced(strain, strain_rate, grain_size, temperature):
+        return (
+            _scaled_arrhenius_term(coefficient, activation_energy, temperature)
+            * (strain + LocalConfig.BASE_STRAIN) ** strain_exponent
+            * (strain_rate + LocalConfig.BASE_STRAIN_RATE) ** strain_rate_exponent
+            * (grain_size * 1e6) ** grain_size_exponent
+        )
+
+    return (
+        coefficient
+        * (strain + LocalConfig.BASE_STRAIN) ** strain_exponent
+        * (strain_rate + LocalConfig.BASE_STRAIN_RATE) ** strain_rate_exponent
+        * (grain_size * 1e6) ** grain_size_exponent
+        * arrhenius_term(activation_energy, temperature)
+    )
+
+
+def critical_value(
+    parameters: JMAKRecrystallizationParameters,
+    strain,
+    strain_rate,
+    grain_size,
+    temperature,
+):
+    """Critical strain resp. time for the onset of recrystallization."""
+    p = parameters
+    return _power_law(
+        p.a1, p.a2, p.a3, p.a4, p.qa, strain, strain_rate, grain_size, temperature
+    )
+
+
+def reference_value(
+    parameters: JMAKRecrystallizationParameters,
+    strain,
+    strain_rate,
+    grain_size,
+    temperature,
+):
+    """Reference strain resp. time of recrystallization."""
+    p = parameters
+    return _power_law(
+        p.b1, p.b2, p.b3, p.b4, p.qb, strain, strain_rate, grain_size, temperature
+    )
+
+
+def recrystallized_grain_size(
+    parameters: JMAKRecrystallizationParameters,
+    strain,
+    strain_rate,
+    grain_size,
+    temperature,
+):
+    """Grain size of freshly recrystallized grains in meters."""
+    p = parameters
+    return (
+        _power_law(
+            p.c1, p.c2, p.c3, p.c4, p.qc, strain, strain_rate, grain_size, temperature
+        )
+        / 1e6
+    )
+
+
+def jmak_fraction(
+    parameters: JMAKRecrystallizationParameters, value, critical, reference
+):
+    """Recrystallized fraction according to the Avrami-term at strain resp. time ``value``."""
+    return 1 - np.exp(
+        parameters.k * ((value - critical) / (reference - critical)) ** parameters.n
+    )
+
+
+def cumulated_jmak_fraction(
+    parameters: JMAKRecrystallizationParameters, start, end, critical, reference
+):
+    """
+    Recrystallized fraction cumulated over successive strain increments from ``start`` to ``end`` (last axis).
+    The strain beyond the critical strain of each increment is normalized by its difference of reference and critical
+    strain and summed up (additivity rule) to the progress entering the Avrami-term.
+    """
+    beyond = np.clip(end - np.maximum(start, critical), 0, None)
+    progress = np.cumsum(
+        np.where(
+            (beyond > 0) & (critical <= reference), beyond / (reference - critical), 0.0
+        ),
+        axis=-1,
+    )
+    return jmak_fraction(parameters, progress, 0, 1)
+
+
+def virtual_time(
+    parameters: JMAKRecrystallizationParameters,
+    recrystallized_fraction,
+    critical,
+    reference,
+):
+    """Time needed to reach the given recrystallized fraction."""
+    if _reduced(recrystallized_fraction, critical, reference):
+        log = np.asarray(
+            np.log1p(-np.asarray(recrystallized_fraction, dtype=np.float64)),
+            dtype=np.float32,
+        )
+    else:
+        log = np.log(1 - recrystallized_fraction)
+
+    return (reference - critical) * (log / parameters.k) ** (
+        1 / parameters.n
+    ) + critical
+
+
+def finished_time(parameters: JMAKRecrystallizationParameters, reference):
+    """Time needed to reach a recrystallized fraction of ``1 - THRESHOLD``."""
+    log = np.log(LocalConfig.THRESHOLD)
+    if _reduced(reference):
+        log = np.float32(log)
+
+    return (log / parameters.k) ** (1 / parameters.n) * reference
+
+
+def grain_growth(
+    parameters: JMAKGrainGrowthParameters, grain_size, duration, temperature
+):
+    """Grain size in meters after grain growth of ``duration``."""
+    if _reduced(grain_size, duration, temperature):
+        growth = (
+            _scaled_arrhenius_term(parameters.d2, parameters.qd, temperature) * duration
+        )
+    else:
+        growth = parameters.d2 * duration * arrhenius_term(parameters.qd, temperature)
+
+    return (((grain_size * 1e6) ** parameters.d1 + growth) ** (1 / parameters.d1)) / 1e6
+
+
+class KineticsBackend:
+    """
+    Kinetic model of recrystallization and grain growth.
+
+    All methods must accept plain numbers as well as numpy arrays broadcast against each other,
+    so the same backend serves the hook functions and the batch evaluators.
+    The parameter sets are the ones resolved for the material, the meaning of their fields is up to the backend.
+    The arguments and results are in the units of the respective functions of this module.
+    """
+
+    def critical_value(
+        self,
+        parameters: JMAKRecrystallizationParameters,
+        strain,
+        strain_rate,
+        grain_size,
+        temperature,
+    ):
+        """Critical strain resp. time for the onset of recrystallization."""
+        raise NotImplementedError
+
+    def reference_value(
+        self,
+        parameters: JMAKRecrystallizationParameters,
+        strain,
+        strain_rate,
+        grain_size,
+        temperature,
+    ):
+        """Reference strain resp. time of recrystallization."""
+        raise NotImplementedError
+
+    def recrystallized_grain_size(
+        self,
+        parameters: JMAKRecrystallizationParameters,
+        strain,
+        strain_rate,
+        grain_size,
+        temperature,
+    ):
+        """Grain size of freshly recrystallized grains in meters."""
+        raise NotImplementedError
+
+    def recrystallized_fraction(
+        self, parameters: JMAKRecrystallizationParameters, value, critical, reference
+    ):
+        """Recrystallized fraction at strain resp. time ``value``."""
+        raise NotImplementedError
+
+    def cumulated_fraction(
+        self,
+        parameters: JMAKRecrystallizationParameters,
+        start,
+        end,
+        critical,
+        reference,
+    ):
+        """
+        Recrystallized fraction cumulated over successive strain increments from ``start`` to ``end`` (last axis)
+        with critical and reference strain per increment, the strain before the first increment being ``-inf``.
+        """
+        raise NotImplementedError
+
+    def virtual_time(
+        self,
+        parameters: JMAKRecrystallizationParameters,
+        recrystallized_fraction,
+        critical,
+        reference,
+    ):
+        """Time needed to reach the given recrystallized fraction, inverse of :py:meth:`recrystallized_fraction`."""
+        raise NotImplementedError
+
+    def finished_time(self, parameters: JMAKRecrystallizationParameters, reference):
+        """Time needed to reach a recrystallized fraction of ``1 - THRESHOLD``."""
+        raise NotImplementedError
+
+    def grain_growth(
+        self, parameters: JMAKGrainGrowthParameters, grain_size, duration, temperature
+    ):
+        """Grain size in meters after grain growth of ``duration``."""
+        raise NotImplementedError
+
+
+class JMAKBackend(KineticsBackend):
+    """JMAK equations with power law critical and reference values, the default backend."""
+
+    def critical_value(self, parameters, strain, strain_rate, grain_size, temperature):
+        return critical_value(parameters, strain, strain_rate, grain_size, temperature)
+
+    def reference_value(self, parameters, strain, strain_rate, grain_size, temperature):
+        return reference_value(parameters, strain, strain_rate, grain_size, temperature)
+
+    def recrystallized_grain_size(
+        self, parameters, strain, strain_rate, grain_size, temperature
+    ):
+        return recrystallized_grain_size(
+            parameters, strain, strain_rate, grain_size, temperature
+        )
+
+    def recrystallized_fraction(self, parameters, value, critical, reference):
+        return jmak_fraction(parameters, value, critical, reference)
+
+    def cumulated_fraction(self, parameters, start, end, critical, reference):
+        return cumulated_jmak_fraction(parameters, start, end, critical, reference)
+
+    def virtual_time(self, parameters, recrystallized_fraction, critical, reference):
+        return virtual_time(parameters, recrystallized_fraction, critical, reference)
+
+    def finished_time(self, parameters, reference):
+        return finished_time(parameters, reference)
+
+    def grain_growth(self, parameters, grain_size, duration, temperature):
+        return grain_growth(parameters, grain_size, duration, temperature)
+
+
+BACKENDS: Dict[str, KineticsBackend] = {DEFAULT_BACKEND: JMAKBackend()}
+"""Kinetics backends by name, as given by ``Profile.recrystallization_kinetics_backend``."""
+
+
+def register_backend(name: str, backend: KineticsBackend) -> KineticsBackend:
+    """Register ``backend`` to be selected by ``name``, replacing a backend of the same name."""
+    BACKENDS[name] = backend
+    return backend
+
+
+def get_backend(backend: Union[str, KineticsBackend, None] = None) -> KineticsBackend:
+    """
+    Resolve a backend given by name or instance, ``None`` for the default.
+
+    :raises ValueError: if no backend is registered by the name
+    """
+    if backend is None:
+        backend = DEFAULT_BACKEND
+    if isinstance(backend, KineticsBackend):
+        return backend
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown kinetics backend {backend!r}, registered are {sorted(BACKENDS)}."
+        ) from None
+
+
+def recrystallization_state_codes(recrystallized_fraction) -> np.ndarray:
+    """Codes of :py:class:`RecrystallizationState` classifying the recrystallized fraction."""
+    # the classes are consecutive codes, counting the thresholds exceeded
+    return (recrystallized_fraction > LocalConfig.THRESHOLD).astype(np.int8) + (
+        recrystallized_fraction > 1 - LocalConfig.THRESHOLD
+    )
+
+
+def recrystallization_state(recrystallized_fraction):
+    """Classification of the recrystallization state as in ``Profile.recrystallization_state``."""
+    return RecrystallizationState.decode(
+        recrystallization_state_codes(recrystallized_fraction)
+    )
+
+
+def _mechanisms(codes, as_codes: bool):
+    """Mechanisms of the batch results, as codes or strings."""
+    return codes if as_codes else RecrystallizationMechanism.decode(codes)
+
+
+def _dynamic_mechanisms(dynamic, as_codes: bool):
+    """Mechanisms of the batch results of roll passes, dynamic where ``dynamic`` is true."""
+    m = RecrystallizationMechanism
+    return _mechanisms(
+        np.where(dynamic, m.DYNAMIC.code, m.NONE.code).astype(np.int8), as_codes
+    )
+
+
+def available(
+    parameters: Optional[
+        Union[JMAKRecrystallizationParameters, JMAKGrainGrowthParameters]
+    ]
+):
+    """Whether a parameter set is available, elementwise for parameter sets created by :py:func:`stack_parameters`."""
+    if parameters is None:
+        return np.False_
+    return ~np.isnan(getattr(parameters, dataclasses.fields(parameters)[0].name))
+
+
+def stack_parameters(
+    parameter_sets: Sequence[Optional[P]], parameters_type: Type[P]
+) -> Optional[P]:
+    """
+    Stack parameter sets into one with array fields, e.g. to evaluate several materials at once.
+    Missing parameter sets are marked by NaN values, ``None`` is returned if all are missing.
+    """
+    if all(p is None for p in parameter_sets):
+        return None
+
+    return parameters_type(
+        **{
+            f.name: np.array(
+                [np.nan if p is None else getattr(p, f.name) for p in parameter_sets],
+                dtype=float,
+            )
+            for f in dataclasses.fields(parameters_type)
+        }
+    )
+
+
+def stack_material_parameters(
+    materials: Sequence[Union[str, Sequence[str]]]
+) -> JMAKMaterialParameters:
+    """
+    Resolve the parameter sets of several materials and stack them along the first axis.
+
+    :raises ValueError: if the materials use different kinetics backends
+    """
+    resolved = [material_parameters(m) for m in materials]
+    backends = {r.backend for r in resolved}
+    if len(backends) > 1:
+        raise ValueError(
+            f"Materials using different kinetics backends can not be stacked: {sorted(backends)}."
+        )
+
+    return JMAKMaterialParameters(
+        dynamic=stack_parameters(
+            [r.dynamic for r in resolved], JMAKRecrystallizationParameters
+        ),
+        metadynamic=stack_parameters(
+            [r.metadynamic for r in resolved], JMAKRecrystallizationParameters
+        ),
+        static=stack_parameters(
+            [r.static for r in resolved], JMAKRecrystallizationParameters
+        ),
+        grain_growth=stack_parameters(
+            [r.grain_growth for r in resolved], JMAKGrainGrowthParameters
+        ),
+        backend=backends.pop() if backends else DEFAULT_BACKEND,
+    )
+
+
+def _grown(
+    backend: KineticsBackend,
+    parameters: Optional[JMAKGrainGrowthParameters],
+    grain_size,
+    duration,
+    temperature,
+):
+    """Grain growth ignoring negative durations and missing parameters."""
+    if parameters is None:
+        return grain_size
+    return np.where(
+        (duration < 0) | ~available(parameters),
+        grain_size,
+        backend.grain_growth(parameters, grain_size, duration, temperature),
+    )
+
+
+def _select(
+    mask, a: JMAKRecrystallizationParameters, b: JMAKRecrystallizationParameters
+):
+    """Parameter set with field values chosen from ``a`` where ``mask`` is true, else from ``b``."""
+    return JMAKRecrystallizationParameters(
+        **{
+            f.name: np.where(mask, getattr(a, f.name), getattr(b, f.name))
+            for f in dataclasses.fields(JMAKRecrystallizationParameters)
+        }
+    )
+
+
+class RollPassKinetics(NamedTuple):
+    """Results of :py:func:`roll_pass_kinetics`, equivalent to the respective hooks of a roll pass."""
+
+    recrystallization_mechanism: np.ndarray
+    recrystallization_critical_strain: np.ndarray
+    recrystallization_reference_strain: np.ndarray
+    recrystallized_fraction: np.ndarray
+    recrystallized_grain_size: np.ndarray
+    out_recrystallized_fraction: np.ndarray
+    out_grain_size: np.ndarray
+    out_strain: np.ndarray
+
+
+class TransportKinetics(NamedTuple):
+    """Results of :py:func:`transport_kinetics`, equivalent to the respective hooks of a transport."""
+
+    recrystallization_mechanism: np.ndarray
+    recrystallization_critical_time: np.ndarray
+    recrystallization_reference_time: np.ndarray
+    recrystallization_finished_time: np.ndarray
+    recrystallized_fraction: np.ndarray
+    recrystallized_grain_size: np.ndarray
+    out_recrystallized_fraction: np.ndarray
+    out_grain_size: np.ndarray
+    out_strain: np.ndarray
+
+
+def roll_pass_kinetics(
+    dynamic_parameters: Optional[JMAKRecrystallizationParameters],
+    strain,
+    pass_strain,
+    strain_rate,
+    grain_size,
+    temperature,
+    dtype=None,
+    codes: bool = False,
+    backend: Union[str, KineticsBackend, None] = None,
+) -> RollPassKinetics:
+    """
+    Evaluate the kinetics of a roll pass for arrays of process conditions at once.
+    Parameter sets may be stacked by :py:func:`stack_parameters` to evaluate several materials at once.
+
+    :param dynamic_parameters: parameters of dynamic recrystallization, ``None`` if not available
+    :param strain: incoming strain
+    :param pass_strain: strain applied in the roll pass
+    :param strain_rate: mean strain rate of the roll pass
+    :param grain_size: incoming grain size
+    :param temperature: mean temperature of the roll pass
+    :param dtype: floating point type to evaluate in, ``numpy.float32`` selects the reduced precision mode,
+        by default the type of the given values
+    :param codes: whether to return the mechanisms as codes of :py:class:`RecrystallizationMechanism`
+    :param backend: kinetics backend or its name, the JMAK equations by default
+    """
+    backend = get_backend(backend)
+    strain, pass_strain, strain_rate, grain_size, temperature = np.broadcast_arrays(
+        *(
+            np.asarray(v, dtype=dtype)
+            for v in (strain, pass_strain, strain_rate, grain_size, temperature)
+        )
+    )
+    dynamic_available = available(dynamic_parameters)
+    p = dynamic_parameters if dynamic_parameters is not None else _DEFAULT_PARAMETERS
+    if dtype is not None:
+        p = cast_parameters(p, dtype)
+
+    with np.errstate(all="ignore"):
+        critical = backend.critical_value(
+            p, strain, strain_rate, grain_size, temperature
+        )
+        reference = backend.reference_value(
+            p, strain, strain_rate, grain_size, temperature
+        )
+        dynamic = dynamic_available & (strain + pass_strain > critical)
+
+        fraction = backend.recrystallized_fraction(
+            p, strain + pass_strain, critical, reference
+        )
+        fraction = np.where(
+            dynamic & (critical <= reference) & np.isfinite(fraction) & (fraction > 0),
+            fraction,
+            0.0,
+        )
+
+        rx_grain_size = backend.recrystallized_grain_size(
+            p, strain, strain_rate, grain_size, temperature
+        )
+        d = grain_size + (rx_grain_size - grain_size) * fraction
+        out_grain_size = np.where(dynamic_available & ~np.isclose(d, 0), d, grain_size)
+
+    return RollPassKinetics(
+        recrystallization_mechanism=_dynamic_mechanisms(dynamic, codes),
+        recrystallization_critical_strain=critical,
+        recrystallization_reference_strain=reference,
+        recrystallized_fraction=fraction,
+        recrystallized_grain_size=rx_grain_size,
+        out_recrystallized_fraction=np.zeros_like(fraction),
+        out_grain_size=out_grain_size,
+        out_strain=strain + pass_strain,
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class IncrementalDynamicKinetics:
+    """Results of :py:func:`incremental_dynamic_kinetics`, the last axis running over the disk elements."""
+
+    recrystallization_mechanism: np.ndarray
+    recrystallization_critical_strain: np.ndarray
+    recrystallization_reference_strain: np.ndarray
+    recrystallized_fraction: np.ndarray
+    """Cumulated recrystallized fraction at the end of each disk element."""
+    recrystallized_grain_size: np.ndarray
+    """Grain size of the grains recrystallized in each disk element."""
+    mean_recrystallized_grain_size: np.ndarray
+    """Mean grain size of all grains recrystallized, weighted by the fraction recrystallized per disk element."""
+
+
+def incremental_dynamic_kinetics(
+    parameters: JMAKRecrystallizationParameters,
+    strain,
+    strain_increments,
+    strain_rates,
+    grain_size,
+    temperatures,
+    codes: bool = False,
+    backend: Union[str, KineticsBackend, None] = None,
+) -> IncrementalDynamicKinetics:
+    """
+    Integrate dynamic recrystallization over the disk elements of roll passes in one sweep.
+
+    Critical and reference strain are evaluated per disk element with its own strain rate and temperature,
+    the backend cumulates the fraction over the elements, see :py:func:`cumulated_jmak_fraction`.
+    As in the evaluation over the whole roll pass, the incoming strain counts to the first disk element.
+    Under constant conditions, this equals the evaluation over the whole roll pass.
+
+    :param parameters: parameters of dynamic recrystallization
+    :param strain: incoming strain of the roll pass
+    :param strain_increments: strain applied in each disk element (last axis)
+    :param strain_rates: strain rate in each disk element (last axis)
+    :param grain_size: incoming grain size of the roll pass
+    :param temperatures: mean temperature of each disk element (last axis)
+    :param codes: whether to return the mechanism as codes of :py:class:`RecrystallizationMechanism`
+    :param backend: kinetics backend or its name, the JMAK equations by default
+    """
+    backend = get_backend(backend)
+    p = parameters
+    strain_increments, strain_rates, temperatures = np.broadcast_arrays(
+        *map(np.asarray, (strain_increments, strain_rates, temperatures))
+    )
+    strain = np.asarray(strain)[..., np.newaxis]
+    grain_size = np.asarray(grain_size)[..., np.newaxis]
+
+    with np.errstate(all="ignore"):
+        critical = backend.critical_value(
+            p, strain, strain_rates, grain_size, temperatures
+        )
+        reference = backend.reference_value(
+            p, strain, strain_rates, grain_size, temperatures
+        )
+
+        end = strain + np.cumsum(strain_increments, axis=-1)
+        start = end - strain_increments
+        start[..., 0] = -np.inf  # incoming strain counts to the first disk element
+
+        fraction = backend.cumulated_fraction(p, start, end, critical, reference)
+        fraction = np.where(np.isfinite(fraction) & (fraction > 0), fraction, 0.0)
+
+        rx_grain_size = backend.recrystallized_grain_size(
+            p, strain, strain_rates, grain_size, temperatures
+        )
+        total = fraction[..., -1]
+        mean_rx_grain_size = np.where(
+            total > 0,
+            np.sum(np.diff(fraction, axis=-1, prepend=0) * rx_grain_size, axis=-1)
+            / total,
+            rx_grain_size[..., -1],
+        )
+
+    return IncrementalDynamicKinetics(
+        recrystallization_mechanism=_dynamic_mechanisms(
+            np.any(end > critical, axis=-1), codes
+        ),
+        recrystallization_critical_strain=critical,
+        recrystallization_reference_strain=reference,
+        recrystallized_fraction=fraction,
+        recrystallized_grain_size=rx_grain_size,
+        mean_recrystallized_grain_size=mean_rx_grain_size,
+    )
+
+
+def transport_kinetics(
+    metadynamic_parameters: Optional[JMAKRecrystallizationParameters],
+    static_parameters: Optional[JMAKRecrystallizationParameters],
+    grain_growth_parameters: Optional[JMAKGrainGrowthParameters],
+    previous_mechanism,
+    strain,
+    strain_rate,
+    grain_size,
+    recrystallized_fraction,
+    duration,
+    temperature,
+    dtype=None,
+    codes: bool = False,
+    backend: Union[str, KineticsBackend, None] = None,
+) -> TransportKinetics:
+    """
+    Evaluate the kinetics of a transport for arrays of process conditions at once.
+    Parameter sets may be stacked by :py:func:`stack_parameters` to evaluate several materials at once.
+
+    :param metadynamic_parameters: parameters of metadynamic recrystallization, ``None`` if not available
+    :param static_parameters: parameters of static recrystallization, ``None`` if not available
+    :param grain_growth_parameters: parameters of grain growth, ``None`` if not available
+    :param previous_mechanism: recrystallization mechanism of the preceding unit, as strings or codes
+    :param strain: incoming strain
+    :param strain_rate: strain rate of the preceding roll pass
+    :param grain_size: incoming grain size
+    :param recrystallized_fraction: incoming recrystallized fraction
+    :param duration: duration of the transport
+    :param temperature: mean temperature of the transport
+    :param dtype: floating point type to evaluate in, ``numpy.float32`` selects the reduced precision mode,
+        by default the type of the given values
+    :param codes: whether to return the mechanisms as codes of :py:class:`RecrystallizationMechanism`
+    :param backend: kinetics backend or its name, the JMAK equations by default
+    """
+    backend = get_backend(backend)
+    (
+        previous_mechanism,
+        strain,
+        strain_rate,
+        grain_size,
+        recrystallized_fraction,
+        duration,
+        temperature,
+    ) = np.broadcast_arrays(
+        RecrystallizationMechanism.encode(previous_mechanism),
+        *(
+            np.asarray(v, dtype=dtype)
+            for v in (
+                strain,
+                strain_rate,
+                grain_size,
+                recrystallized_fraction,
+                duration,
+                temperature,
+            )
+        ),
+    )
+
+    m = RecrystallizationMechanism
+    after_deformation = m.mask(previous_mechanism, m.DYNAMIC, m.METADYNAMIC)
+    full = (
+        recrystallization_state_codes(recrystallized_fraction)
+        == RecrystallizationState.FULL.code
+    )
+
+    static_available = available(static_parameters)
+    metadynamic = after_deformation & available(metadynamic_parameters)
+    mechanism = np.where(
+        metadynamic,
+        m.METADYNAMIC.code,
+        np.where(
+            ~after_deformation & full,
+            np.where(
+                available(grain_growth_parameters), m.GRAIN_GROWTH.code, m.NONE.code
+            ),
+            np.where(static_available, m.STATIC.code, m.NONE.code),
+        ),
+    ).astype(np.int8)
+
+    if dtype is not None:
+        metadynamic_parameters = cast_parameters(metadynamic_parameters, dtype)
+        static_parameters = cast_parameters(static_parameters, dtype)
+        grain_growth_parameters = cast_parameters(grain_growth_parameters, dtype)
+
+    default = (
+        _DEFAULT_PARAMETERS
+        if dtype is None
+        else cast_parameters(_DEFAULT_PARAMETERS, dtype)
+    )
+    p = _select(
+        metadynamic,
+        metadynamic_parameters or default,
+        static_parameters or default,
+    )
+    has_parameters = metadynamic | static_available
+
+    with np.errstate(all="ignore"):
+        critical = backend.critical_value(
+            p, strain, strain_rate, grain_size, temperature
+        )
+        reference = backend.reference_value(
+            p, strain, strain_rate, grain_size, temperature
+        )
+        finished = backend.finished_time(p, reference)
+
+        fraction = (
+            backend.recrystallized_fraction(
+                p,
+                duration
+                + backend.virtual_time(p, recrystallized_fraction, critical, reference),
+                critical,
+                reference,
+            )
+            - recrystallized_fraction
+        )
+        fraction = np.where(
+            (mechanism != m.NONE.code)
+            & has_parameters
+            & (critical <= reference)
+            & np.isfinite(fraction)
+            & (fraction > 0),
+            fraction,
+            0.0,
+        )
+        out_fraction = (
+            recrystallized_fraction + (1 - recrystallized_fraction) * fraction
+        )
+
+        rx_grain_size = backend.recrystallized_grain_size(
+            p, strain, strain_rate, grain_size, temperature
+        )
+        grown_in = _grown(
+            backend, grain_growth_parameters, grain_size, duration, temperature
+        )
+        grown_rx = _grown(
+            backend,
+            grain_growth_parameters,
+            rx_grain_size,
+            duration - finished,
+            temperature,
+        )
+        d = np.where(
+            mechanism == m.STATIC.code,
+            fraction ** (4 / 3) * grown_rx + (1 - fraction) ** 2 * grown_in,
+            grown_in + (grown_rx - grown_in) * fraction,
+        )
+        d = np.where(np.isclose(d, 0), grain_size, d)
+
+    out_grain_size = np.where(
+        mechanism == m.NONE.code,
+        grain_size,
+        np.where(mechanism == m.GRAIN_GROWTH.code, grown_in, d),
+    )
+    out_strain = np.where(
+        recrystallization_state_codes(out_fraction) == RecrystallizationState.FULL.code,
+        0.0,
+        strain * (1 - fraction),
+    )
+
+    return TransportKinetics(
+        recrystallization_mechanism=_mechanisms(mechanism, codes),
+        recrystallization_critical_time=critical,
+        recrystallization_reference_time=reference,
+        recrystallization_finished_time=finished,
+        recrystallized_fraction=fraction,
+        recrystallized_grain_size=rx_grain_size,
+        out_recrystallized_fraction=out_fraction,
+        out_grain_size=out_grain_size,
+        out_strain=out_strain,
+    )
+
+
+class TransportCurveValues(NamedTuple):
+    """Values of :py:class:`TransportCurves` at the sample times."""
+
+    time: np.ndarray
+    recrystallized_fraction: np.ndarray
+    """Recrystallized fraction of the profile, as in ``Transport.OutProfile.recrystallized_fraction``."""
+    grain_size: np.ndarray
+    strain: np.ndarray
+    """Retained strain."""
+
+
+@dataclasses.dataclass(frozen=True)
+class TransportCurves:
+    """
+    Evolution of the microstructure over the time within a transport, based on its solved coefficients.
+    Holds only scalar values, the curves are evaluated on call at the requested sample times.
+    """
+
+    recrystallization_mechanism: str
+    parameters: Optional[JMAKRecrystallizationParameters]
+    """Parameters of static resp. metadynamic recrystallization, ``None`` if not available."""
+    grain_growth_parameters: Optional[JMAKGrainGrowthParameters]
+    critical_time: float
+    reference_time: float
+    finished_time: float
+    recrystallized_grain_size: float
+    in_strain: float
+    in_grain_size: float
+    in_recrystallized_fraction: float
+    temperature: float
+    """Mean temperature of the transport."""
+    backend: KineticsBackend = BACKENDS[DEFAULT_BACKEND]
+    """Kinetics backend of the material."""
+
+    def __call__(self, times) -> TransportCurveValues:
+        """Evaluate the curves at ``times`` measured from the beginning of the transport."""
+        times = np.asarray(times, dtype=float)
+        mechanism = self.recrystallization_mechanism
+        m = RecrystallizationMechanism
+        x = self.in_recrystallized_fraction
+        d = self.in_grain_size
+        p = self.parameters
+        backend = self.backend
+
+        with np.errstate(all="ignore"):
+            fraction = np.zeros_like(times)
+            if (
+                mechanism != m.NONE
+                and p is not None
+                and self.critical_time <= self.reference_time
+            ):
+                fraction = (
+                    backend.recrystallized_fraction(
+                        p,
+                        times
+                        + backend.virtual_time(
+                            p, x, self.critical_time, self.reference_time
+                        ),
+                        self.critical_time,
+                        self.reference_time,
+                    )
+                    - x
+                )
+                fraction = np.where(
+                    np.isfinite(fraction) & (fraction > 0), fraction, 0.0
+                )
+
+            if mechanism == m.GRAIN_GROWTH:
+                grain_size = _grown(
+                    backend,
+                    self.grain_growth_parameters,
+                    np.full_like(times, d),
+                    times,
+                    self.temperature,
+                )
+            elif mechanism == m.NONE or p is None:
+                grain_size = np.full_like(times, d)
+            else:
+                grown_in = _grown(
+                    backend, self.grain_growth_parameters, d, times, self.temperature
+                )
+                grown_rx = _grown(
+                    backend,
+                    self.grain_growth_parameters,
+                    self.recrystallized_grain_size,
+                    times - self.finished_time,
+                    self.temperature,
+                )
+                if mechanism == m.STATIC:
+                    grain_size = (
+                        fraction ** (4 / 3) * grown_rx + (1 - fraction) ** 2 * grown_in
+                    )
+                else:
+                    grain_size = grown_in + (grown_rx - grown_in) * fraction
+                grain_size = np.where(np.isclose(grain_size, 0), d, grain_size)
+
+        recrystallized_fraction = x + (1 - x) * fraction
+
+        return TransportCurveValues(
+            time=times,
+            recrystallized_fraction=recrystallized_fraction,
+            grain_size=np.broadcast_to(grain_size, times.shape),
+            strain=np.where(
+                recrystallization_state_codes(recrystallized_fraction)
+                == RecrystallizationState.FULL.code,
+                0.0,
+                self.in_strain * (1 - fraction),
+            ),
+        )
@@ -0,0 +1,140 @@
+"""
+Memory-lean solution of pass sequences keeping only a compact record of the microstructure evolution.
+
+The units are solved one after another, each repeatedly until its solution is stable, which yields the same state
+as the repeated solution of all units by ``PassSequence.solve``, as units depend only on their predecessors.
+Once a unit's successor is solved, its scalar values are pinned as explicit values and the heavy objects
+(profiles, disk elements, cached geometries) are released, so the retained memory does not grow with the count of
+units.
+"""
+
+import numbers
+from typing import NamedTuple, Tuple
+
+import numpy as np
+from pyroll.core import PassSequence, Profile, Unit, Hook
+from pyroll.core.hooks import HookHost
+
+PINNED_HOOKS = ["recrystallization_mechanism", "strain_rate"]
+"""Names of hooks whose values are pinned on each unit before release, as they are needed by succeeding units."""
+
+
+class MicrostructureRecord(NamedTuple):
+    """Compact record of the microstructure evolution in a pass sequence, holding one array entry per unit."""
+
+    labels: Tuple[str, ...]
+    recrystallization_mechanism: np.ndarray
+    recrystallized_fraction: np.ndarray
+    recrystallized_grain_size: np.ndarray
+    out_recrystallized_fraction: np.ndarray
+    out_grain_size: np.ndarray
+    out_strain: np.ndarray
+    out_profile: Profile
+    """Outgoing profile of the last unit."""
+
+
+def _is_scalar(value):
+    return isinstance(value, (numbers.Number, str, np.generic))
+
+
+def _value(unit: Unit, name: str, default=np.nan):
+    return getattr(unit, name) if unit.has_value(name) else default
+
+
+def _release(unit: Unit):
+    """Pin the scalar values of ``unit`` as explicit values and drop its heavy objects."""
+    for name in PINNED_HOOKS:
+        if unit.has_value(name):
+            unit.__dict__[name] = getattr(unit, name)
+
+    for name, value in unit.__cache__.items():
+        if _is_scalar(value):
+            unit.__dict__.setdefault(name, value)
+
+    unit.in_profile = None
+    unit.out_profile = None
+
+    for name, value in list(unit.__dict__.items()):
+        if isinstance(value, HookHost):  # e.g. rolls, keeping their explicit values
+            value.__cache__.clear()
+        elif isinstance(getattr(type(unit), name, None), Hook) and not _is_scalar(
+            value
+        ):
+            del unit.__dict__[name]  # e.g. geometries set by root hooks
+
+    unit.__cache__.clear()
+    unit.convergence_history.clear()
+    unit.subunits.clear()
+
+
+def _scalars(profile: Profile) -> dict:
+    return {k: v for k, v in profile.__dict__.items() if isinstance(v, numbers.Real)}
+
+
+def _solve_stable(unit: Unit, in_profile: Profile) -> Profile:
+    """Solve ``unit`` repeatedly, starting from the previous state, until the outgoing profile is stable."""
+    out_profile = unit.solve(in_profile)
+
+    for _ in range(unit.max_iteration_count):
+        previous = _scalars(out_profile)
+        out_profile = unit.solve(in_profile)
+        current = _scalars(out_profile)
+
+        if current.keys() == previous.keys() and np.allclose(
+            list(current.values()),
+            list(previous.values()),
+            rtol=unit.iteration_precision,
+            atol=0,
+        ):
+            break
+
+    return out_profile
+
+
+def solve_lean(sequence: PassSequence, in_profile: Profile) -> MicrostructureRecord:
+    """
+    Solve the units of ``sequence`` one after another, releasing the heavy objects of each unit once its successor is
+    solved.
+    The units are left with their scalar values only and can not be inspected in detail or solved again afterwards.
+    The sequence itself is not solved, so its own hooks are not available.
+
+    :param sequence: the pass sequence to solve
+    :param in_profile: the incoming profile of the sequence
+    :return: the record of the microstructure evolution
+    """
+    labels = []
+    rows = []
+    profile = in_profile
+    previous = None
+
+    for unit in sequence:
+        profile = _solve_stable(unit, profile)
+        op = unit.out_profile
+
+        labels.append(unit.label)
+        rows.append(
+            (
+                _value(unit, "recrystallization_mechanism", "none"),
+                _value(unit, "recrystallized_fraction"),
+                _value(unit, "recrystallized_grain_size"),
+                op.recrystallized_fraction,
+                op.grain_size,
+                op.strain,
+            )
+        )
+
+        if previous is not None:
+            _release(previous)
+        previous = unit
+
+    if previous is not None:
+        _release(previous)
+
+    columns = list(zip(*rows)) if rows else [()] * 6
+
+    return MicrostructureRecord(
+        tuple(labels),
+        np.array(columns[0], dtype=str),
+        *(np.array(c, dtype=float) for c in columns[1:]),
+        out_profile=profile,
+    )
@@ -2,7 +2,7 @@ import dataclasses
 
 import numpy as np
 from pyroll.core import Profile, Hook, Config
-from typing import Optional
+from typing import Optional, NamedTuple, Union, Sequence
 
 LOG_05 = np.log(0.5)
 
@@ -69,6 +69,53 @@ Profile.jmak_static_recrystallization_parameters = Hook[
 ]()
 Profile.jmak_grain_growth_parameters = Hook[JMAKGrainGrowthParameters]()
 
+Profile.recrystallization_kinetics_backend = Hook[str]()
+"""Name of the kinetics backend evaluating the parameter sets of the material, see ``kinetics.register_backend``."""
+
+DEFAULT_BACKEND = "jmak"
+"""Name of the backend of the JMAK equations, used if no other is selected for a material."""
+
+
+class JMAKMaterialParameters(NamedTuple):
+    """Parameter sets of all mechanisms available for a material, ``None`` if not available."""
+
+    dynamic: Optional[JMAKRecrystallizationParameters]
+    metadynamic: Optional[JMAKRecrystallizationParameters]
+    static: Optional[JMAKRecrystallizationParameters]
+    grain_growth: Optional[JMAKGrainGrowthParameters]
+    backend: str = DEFAULT_BACKEND
+    """Name of the kinetics backend evaluating the parameter sets."""
+
+
+MATERIALS = ("S355J2", "C54SICE6", "C20", "C45", "C-Mn", "CuZn30")
+"""Identifiers of the materials whose parameter sets are provided with this package."""
+
+
+def material_parameters(material: Union[str, Sequence[str]]) -> JMAKMaterialParameters:
+    """Resolve the parameter sets of a material from the ``Profile.jmak_*_parameters`` hooks."""
+    return profile_parameters(Profile(material=material))
+
+
+def profile_parameters(profile: Profile) -> JMAKMaterialParameters:
+    """Resolve the parameter sets active in ``profile`` from the ``Profile.jmak_*_parameters`` hooks."""
+
+    def _get(name):
+        return getattr(profile, name) if profile.has_value(name) else None
+
+    return JMAKMaterialParameters(
+        dynamic=_get("jmak_dynamic_recrystallization_parameters"),
+        metadynamic=_get("jmak_metadynamic_recrystallization_parameters"),
+        static=_get("jmak_static_recrystallization_parameters"),
+        grain_growth=_get("jmak_grain_growth_parameters"),
+        backend=profile.recrystallization_kinetics_backend,
+    )
+
+
+@Profile.recrystallization_kinetics_backend
+def default_kinetics_backend(self: Profile):
+    return DEFAULT_BACKEND
+
+
 S355_DYNAMIC = JMAKRecrystallizationParameters(
     k=-1.4952,
     n=1.7347,
@@ -0,0 +1,237 @@
+"""
+Optimization of transport durations and temperatures of a schedule for the final grain size and the cycle time.
+
+The schedule is compiled once into a :py:class:`ScheduleProgram`, whose history is then varied per candidate.
+A population of candidates is evolved by crossover and mutation, selecting by constraint violation, Pareto rank and
+crowding distance.
+The kinetics of all candidates of a generation are evaluated at once as arrays.
+Changed durations do not change the temperatures of the history, as the thermal evolution is not solved again,
+the temperatures of the transports are optional decision variables instead.
+"""
+
+from typing import NamedTuple, Tuple, Optional, Union
+
+import numpy as np
+from pyroll.core import PassSequence, Unit
+
+from . import kinetics
+from .codes import RecrystallizationState
+from .program import ScheduleProgram, compile_schedule
+
+
+class ParetoFront(NamedTuple):
+    """Non-dominated feasible candidates sorted by cycle time, candidates along the first axis of the arrays."""
+
+    transport_labels: Tuple[str, ...]
+    durations: np.ndarray
+    """Durations of the transports, shape (candidates, transports)."""
+    temperatures: np.ndarray
+    """Mean temperatures of the transports, shape (candidates, transports)."""
+    grain_size: np.ndarray
+    """Final grain size."""
+    cycle_time: np.ndarray
+    """Total duration of all units."""
+
+
+def _bounds(bounds, count):
+    low, high = (np.broadcast_to(np.asarray(b, dtype=float), (count,)) for b in bounds)
+    if np.any(low > high):
+        raise ValueError("Lower bounds must not exceed upper bounds.")
+    return low, high
+
+
+def _pareto_ranks(objectives: np.ndarray) -> np.ndarray:
+    """Pareto ranks of the rows of ``objectives`` to be minimized, zero for the non-dominated ones."""
+    no_worse = np.all(objectives[:, None] <= objectives[None, :], axis=-1)
+    better = np.any(objectives[:, None] < objectives[None, :], axis=-1)
+    dominates = no_worse & better  # [i, j]: i dominates j
+
+    ranks = np.full(len(objectives), -1)
+    remaining = np.ones(len(objectives), dtype=bool)
+    rank = 0
+    while remaining.any():
+        front = remaining & ~np.any(dominates[remaining], axis=0)
+        ranks[front] = rank
+        remaining &= ~front
+        rank += 1
+    return ranks
+
+
+def _crowding_distances(objectives: np.ndarray, ranks: np.ndarray) -> np.ndarray:
+    """Crowding distances of the rows of ``objectives`` within their Pareto front."""
+    distances = np.zeros(len(objectives))
+
+    for rank in np.unique(ranks):
+        members = np.flatnonzero(ranks == rank)
+        for values in objectives[members].T:
+            order = np.argsort(values)
+            sorted_values = values[order]
+            span = sorted_values[-1] - sorted_values[0]
+            distances[members[order[[0, -1]]]] = np.inf
+            if span > 0:
+                distances[members[order[1:-1]]] += (
+                    sorted_values[2:] - sorted_values[:-2]
+                ) / span
+
+    return distances
+
+
+def optimize_schedule(
+    schedule: Union[ScheduleProgram, PassSequence],
+    duration_bounds,
+    temperature_bounds=None,
+    max_grain_size: Optional[float] = None,
+    min_grain_size: Optional[float] = None,
+    full_recrystallization_before: Optional[str] = None,
+    population_size: int = 100,
+    generations: int = 50,
+    seed=None,
+) -> ParetoFront:
+    """
+    Search transport durations and temperatures minimizing the final grain size and the total cycle time.
+
+    Bounds are given as pairs of lower and upper bound, each a single value or one value per transport.
+    Infeasible candidates are ranked behind the feasible ones by the amount of constraint violation.
+
+    :param schedule: a compiled schedule, or a solved pass sequence to compile
+    :param duration_bounds: bounds of the transport durations
+    :param temperature_bounds: bounds of the mean transport temperatures, ``None`` to keep the ones of the history
+    :param max_grain_size: upper bound of the final grain size
+    :param min_grain_size: lower bound of the final grain size
+    :param full_recrystallization_before: label of a unit that must be entered in full recrystallization state
+    :param population_size: count of candidates per generation
+    :param generations: count of generations to evolve
+    :param seed: seed of the random number generator, see :py:func:`numpy.random.default_rng`
+    :return: the Pareto front of the final generation, empty if no feasible candidate was found
+    :raises ValueError: if bounds are inconsistent or the unit label is not part of the schedule
+    """
+    program = compile_schedule(schedule) if isinstance(schedule, Unit) else schedule
+    history = program.history
+    transports = np.flatnonzero(~history.is_roll_pass)
+    count = len(transports)
+
+    entry = None
+    if full_recrystallization_before is not None:
+        if full_recrystallization_before not in history.labels:
+            raise ValueError(
+                f"Unit {full_recrystallization_before!r} is not part of the schedule."
+            )
+        entry = history.labels.index(full_recrystallization_before) - 1
+
+    low, high = _bounds(duration_bounds, count)
+    if temperature_bounds is not None:
+        low_temperature, high_temperature = _bounds(temperature_bounds, count)
+        low = np.concatenate([low, low_temperature])
+        high = np.concatenate([high, high_temperature])
+
+    def _decode(x):
+        values = low + x * (high - low)
+        durations = np.array(
+            np.broadcast_to(history.duration, (len(x), len(history.labels)))
+        )
+        temperatures = np.array(np.broadcast_to(history.temperature, durations.shape))
+        durations[:, transports] = values[:, :count]
+        if temperature_bounds is not None:
+            temperatures[:, transports] = values[:, count:]
+        return durations, temperatures
+
+    def _evaluate(x):
+        durations, temperatures = _decode(x)
+        result = ScheduleProgram(
+            history._replace(duration=durations, temperature=temperatures),
+            program.parameters,
+        ).evaluate(grain_size=np.full(len(durations), history.in_grain_size))
+
+        grain_size = result.out_grain_size[:, -1]
+        violation = np.zeros(len(durations))
+        if max_grain_size is not None:
+            violation += np.maximum(grain_size - max_grain_size, 0) / max_grain_size
+        if min_grain_size is not None:
+            violation += np.maximum(min_grain_size - grain_size, 0) / min_grain_size
+        if entry is not None:
+            fraction = (
+                result.out_recrystallized_fraction[:, entry]
+                if entry >= 0
+                else history.in_recrystallized_fraction
+            )
+            full = (
+                kinetics.recrystallization_state_codes(fraction)
+                == RecrystallizationState.FULL.code
+            )
+            violation += np.where(full, 0, 1 - fraction)
+
+        objectives = np.stack([grain_size, durations.sum(axis=-1)], axis=-1)
+        return objectives, np.where(np.isfinite(violation), violation, np.inf)
+
+    def _order(objectives, violation):
+        feasible = violation == 0
+        ranks = np.full(len(objectives), np.iinfo(int).max)
+        distances = np.zeros(len(objectives))
+        if feasible.any():
+            ranks[feasible] = _pareto_ranks(objectives[feasible])
+            distances[feasible] = _crowding_distances(
+                objectives[feasible], ranks[feasible]
+            )
+        return np.lexsort((-distances, ranks, violation))
+
+    rng = np.random.default_rng(seed)
+    size = len(low)
+    span = np.where(high > low, high - low, 1)
+
+    population = rng.uniform(size=(population_size, size))
+    initial = np.concatenate(
+        [history.duration[transports], history.temperature[transports]]
+    )[:size]
+    population[0] = np.clip((initial - low) / span, 0, 1)
+
+    objectives, violation = _evaluate(population)
+
+    for _ in range(generations):
+        order = _order(objectives, violation)
+        population, objectives, violation = (
+            population[order],
+            objectives[order],
+            violation[order],
+        )
+
+        # binary tournaments on the position in the order, crossover and mutation in normalized space
+        parents = np.min(
+            rng.integers(population_size, size=(2, population_size, 2)), axis=-1
+        )
+        offspring = np.where(
+            rng.uniform(size=(population_size, size)) < 0.5, *population[parents]
+        )
+        mutated = rng.uniform(size=offspring.shape) < max(1 / size, 0.2)
+        offspring = np.clip(
+            offspring + mutated * rng.normal(0, 0.1, offspring.shape), 0, 1
+        )
+
+        offspring_objectives, offspring_violation = _evaluate(offspring)
+        population = np.concatenate([population, offspring])
+        objectives = np.concatenate([objectives, offspring_objectives])
+        violation = np.concatenate([violation, offspring_violation])
+
+        selected = _order(objectives, violation)[:population_size]
+        population, objectives, violation = (
+            population[selected],
+            objectives[selected],
+            violation[selected],
+        )
+
+    feasible = violation == 0
+    front = np.zeros(len(population), dtype=bool)
+    if feasible.any():
+        front[feasible] = _pareto_ranks(objectives[feasible]) == 0
+
+    _, unique = np.unique(objectives[front], axis=0, return_index=True)
+    members = np.flatnonzero(front)[unique]
+    members = members[np.argsort(objectives[members, 1])]
+    durations, temperatures = _decode(population[members])
+
+    return ParetoFront(
+        transport_labels=tuple(history.labels[i] for i in transports),
+        durations=durations[:, transports],
+        temperatures=temperatures[:, transports],
+        grain_size=objectives[members, 0],
+        cycle_time=objectives[members, 1],
+    )
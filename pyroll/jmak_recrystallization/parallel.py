@@ -0,0 +1,132 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Sequence, Union, Mapping, Optional, List
+
+import pyroll.core
+from pyroll.core import PassSequence, Profile, HookFunction
+
+from .config import config_scope, SCOPE_SAFE_VALUES
+from .diagnostics import collect_diagnostics
+
+_cycle_flags = threading.local()
+_cycle_lock = threading.Lock()
+
+
+class _ThreadLocalCycleFlag:
+    """Descriptor storing the cycle detection flag of hook functions per thread instead of per process."""
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(_cycle_flags, "flags", {}).get(id(instance), False)
+
+    def __set__(self, instance, value):
+        flags = getattr(_cycle_flags, "flags", None)
+        if flags is None:
+            flags = _cycle_flags.flags = {}
+
+        if value:
+            flags[id(instance)] = True
+        else:
+            flags.pop(id(instance), None)
+
+
+_cycle_users = 0
+"""Count of running :py:func:`solve_concurrently` calls relying on the thread-local cycle flags."""
+
+# pyroll-core 3 stores the cycle flag of a hook function (``HookFunction.cycle``, set in ``HookFunction.__call__``) as
+# plain instance attribute shared by all threads, so a hook function running in one thread sees the flag raised by
+# another one. Until core tracks the flag per thread, it is replaced by a thread-local one while solving concurrently.
+# The replacement relies on the internals of this major version only, later versions are left untouched.
+_PATCH_HOOK_CYCLES = pyroll.core.VERSION.split(".")[0] == "3"
+
+
+@contextmanager
+def _thread_local_hook_cycles():
+    """Make the cycle detection of ``pyroll.core`` hook functions thread-local within the context."""
+    global _cycle_users
+
+    if not _PATCH_HOOK_CYCLES:
+        yield
+        return
+
+    with _cycle_lock:
+        if _cycle_users == 0:
+            HookFunction.cycle = _ThreadLocalCycleFlag()
+        _cycle_users += 1
+
+    try:
+        yield
+    finally:
+        with _cycle_lock:
+            _cycle_users -= 1
+            if _cycle_users == 0:
+                # plain default for hook functions created meanwhile, which have no own value
+                HookFunction.cycle = False
+
+
+def _solve(sequence: PassSequence, in_profile: Profile, config: Mapping):
+    with config_scope(**config), collect_diagnostics():
+        return sequence.solve(in_profile)
+
+
+def solve_concurrently(
+    sequences: Sequence[PassSequence],
+    in_profiles: Union[Profile, Sequence[Profile]],
+    config: Union[None, Mapping, Sequence[Mapping]] = None,
+    max_workers: Optional[int] = None,
+) -> List[Profile]:
+    """
+    Solve independent pass sequences concurrently using a thread pool.
+
+    The sequences must be distinct instances, while the incoming profiles and the material parameter sets may be shared,
+    as they are only read.
+    Config values of this plugin are scoped to each solution using :py:func:`config_scope`,
+    so concurrently solved sequences may use distinct settings without affecting each other or the process-wide config.
+    Only the values listed in :py:data:`config.SCOPE_SAFE_VALUES` are accepted.
+    Scopes active in the calling context are inherited.
+    Fallback conditions of the model are collected per sequence and logged as one summary each.
+
+    :param sequences: the pass sequences to solve
+    :param in_profiles: a single incoming profile used for all sequences or one per sequence
+    :param config: a mapping of config values used for all sequences or one mapping per sequence
+    :param max_workers: maximum count of worker threads, see :py:class:`concurrent.futures.ThreadPoolExecutor`
+    :return: the outgoing profiles in order of the sequences
+    :raises ValueError: if the count of profiles or configs does not match the count of sequences,
+        or if a config mapping contains a name not safe to scope per solution
+    """
+    if len(set(map(id, sequences))) != len(sequences):
+        raise ValueError(
+            "Pass sequences must be distinct instances to be solved concurrently."
+        )
+
+    if isinstance(in_profiles, Profile):
+        in_profiles = [in_profiles] * len(sequences)
+
+    if config is None:
+        config = {}
+    if isinstance(config, Mapping):
+        config = [config] * len(sequences)
+
+    if not len(in_profiles) == len(config) == len(sequences):
+        raise ValueError(
+            "Count of incoming profiles and configs must match the count of sequences."
+        )
+
+    unsafe = sorted({name for c in config for name in c} - SCOPE_SAFE_VALUES)
+    if unsafe:
+        raise ValueError(
+            f"Config values {unsafe} cannot be set per sequence, allowed are {sorted(SCOPE_SAFE_VALUES)}."
+        )
+
+    with (
+        _thread_local_hook_cycles(),
+        ThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        futures = [
+            executor.submit(contextvars.copy_context().run, _solve, s, p, c)
+            for s, p, c in zip(sequences, in_profiles, config)
+        ]
+        return [f.result() for f in futures]
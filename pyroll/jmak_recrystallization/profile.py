@@ -5,3 +5,9 @@ Profile.recrystallization_state = Hook[str]()
 
 Profile.recrystallized_fraction = Hook[float]()
 """Fraction of microstructure which is recrystallized"""
+
+Profile.previous_recrystallization_mechanism = Hook[str]()
+"""Recrystallization mechanism of the unit preceding this profile, used if there is no preceding unit in the sequence, e.g. when resuming from a :py:class:`JMAKState`."""
+
+Profile.previous_strain_rate = Hook[float]()
+"""Strain rate of the roll pass preceding this profile, used if there is no preceding roll pass in the sequence, e.g. when resuming from a :py:class:`JMAKState`."""
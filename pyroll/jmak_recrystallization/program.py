@@ -0,0 +1,268 @@
+"""
+Compilation of the JMAK chain of a solved pass sequence into an array program.
+
+The thermomechanical history of the roll passes and transports is taken once from the solved sequence.
+The program then evaluates the kinetics of all units in order for whole arrays of initial states or parameter sets
+at once, without PyRolL objects.
+The mechanism of each unit is decided per array entry by masks, as it depends on the state,
+e.g. grain growth is only active after full static recrystallization.
+"""
+
+from typing import NamedTuple, Tuple, Optional, Dict, Union
+
+import numpy as np
+from pyroll.core import PassSequence, BaseRollPass, Transport
+
+from . import kinetics
+from .codes import RecrystallizationMechanism
+from .common import average_temperature
+from .config import Config
+from .material_data import JMAKMaterialParameters, profile_parameters
+
+MECHANISMS = (
+    RecrystallizationMechanism.DYNAMIC,
+    RecrystallizationMechanism.METADYNAMIC,
+    RecrystallizationMechanism.STATIC,
+    RecrystallizationMechanism.GRAIN_GROWTH,
+    RecrystallizationMechanism.NONE,
+)
+"""Recrystallization mechanisms a unit can exhibit."""
+
+
+class ThermomechanicalHistory(NamedTuple):
+    """
+    Process conditions of the roll passes and transports of a pass sequence, one array entry per unit.
+    The arrays of process conditions may have leading axes to describe variants of the history, e.g. of durations.
+    """
+
+    labels: Tuple[str, ...]
+    is_roll_pass: np.ndarray
+    strain: np.ndarray
+    """Strain applied in roll passes, zero for transports."""
+    strain_rate: np.ndarray
+    """Strain rate of roll passes, of the preceding roll pass for transports, NaN if there is none."""
+    duration: np.ndarray
+    temperature: np.ndarray
+    """Mean temperature of the units."""
+
+    in_strain: float
+    in_grain_size: float
+    in_recrystallized_fraction: float
+    in_previous_mechanism: str
+    """Recrystallization mechanism preceding the first unit."""
+
+    @classmethod
+    def from_sequence(cls, sequence: PassSequence) -> "ThermomechanicalHistory":
+        """
+        Take the history from a solved pass sequence.
+        Only roll passes and transports are regarded, other units are skipped.
+
+        :raises ValueError: if dynamic recrystallization is integrated over disk elements,
+            see ``Config.INCREMENTAL_DYNAMIC_RECRYSTALLIZATION``, as the history holds one entry per roll pass only
+        """
+        units = [u for u in sequence if isinstance(u, (BaseRollPass, Transport))]
+        if Config.INCREMENTAL_DYNAMIC_RECRYSTALLIZATION and any(
+            isinstance(u, BaseRollPass) and u.disk_elements for u in units
+        ):
+            raise ValueError(
+                "The history of roll passes with disk elements can not be taken with incremental dynamic "
+                "recrystallization enabled, as it is evaluated per roll pass."
+            )
+        ip = units[0].in_profile
+
+        strain_rates = []
+        strain_rate = (
+            ip.previous_strain_rate if ip.has_value("previous_strain_rate") else np.nan
+        )
+        for u in units:
+            if isinstance(u, BaseRollPass):
+                strain_rate = u.strain_rate
+            strain_rates.append(strain_rate)
+
+        return cls(
+            labels=tuple(u.label for u in units),
+            is_roll_pass=np.array([isinstance(u, BaseRollPass) for u in units]),
+            strain=np.array(
+                [u.strain if isinstance(u, BaseRollPass) else 0 for u in units],
+                dtype=float,
+            ),
+            strain_rate=np.array(strain_rates, dtype=float),
+            duration=np.array([u.duration for u in units], dtype=float),
+            temperature=np.array([average_temperature(u) for u in units], dtype=float),
+            in_strain=float(ip.strain),
+            in_grain_size=float(ip.grain_size),
+            in_recrystallized_fraction=float(ip.recrystallized_fraction),
+            in_previous_mechanism=(
+                ip.previous_recrystallization_mechanism
+                if ip.has_value("previous_recrystallization_mechanism")
+                else RecrystallizationMechanism.NONE
+            ),
+        )
+
+
+class ProgramResult(NamedTuple):
+    """Microstructure evolution per unit, the arrays have the shape of the evaluated states plus one axis of units."""
+
+    labels: Tuple[str, ...]
+    recrystallization_mechanism: np.ndarray
+    """Mechanisms as strings, or as codes of :py:class:`RecrystallizationMechanism` if evaluated with ``codes=True``."""
+    recrystallized_fraction: np.ndarray
+    recrystallized_grain_size: np.ndarray
+    out_recrystallized_fraction: np.ndarray
+    out_grain_size: np.ndarray
+    out_strain: np.ndarray
+
+    def masks(self) -> Dict[str, np.ndarray]:
+        """Boolean arrays marking where each of the :py:data:`MECHANISMS` is active."""
+        codes = RecrystallizationMechanism.encode(self.recrystallization_mechanism)
+        return {m: codes == m.code for m in MECHANISMS}
+
+
+class ScheduleProgram(NamedTuple):
+    """Array program of the JMAK chain of a pass sequence, created by :py:func:`compile_schedule`."""
+
+    history: ThermomechanicalHistory
+    parameters: JMAKMaterialParameters
+    """Parameter sets used by default."""
+
+    def evaluate_unit(
+        self,
+        index: int,
+        strain,
+        grain_size,
+        recrystallized_fraction,
+        previous_mechanism,
+        temperature=None,
+        parameters: Optional[JMAKMaterialParameters] = None,
+        dtype=None,
+    ) -> Union[kinetics.RollPassKinetics, kinetics.TransportKinetics]:
+        """
+        Evaluate the kinetics of a single unit for arrays of incoming states, the mechanisms given and returned as codes.
+
+        :param index: index of the unit in the history
+        :param previous_mechanism: codes of the recrystallization mechanism of the preceding unit
+        :param temperature: mean temperature of the unit to use instead of the one of the history
+        """
+        h = self.history
+        p = parameters if parameters is not None else self.parameters
+        temperature = h.temperature[..., index] if temperature is None else temperature
+
+        if h.is_roll_pass[index]:
+            return kinetics.roll_pass_kinetics(
+                p.dynamic,
+                strain,
+                h.strain[..., index],
+                h.strain_rate[..., index],
+                grain_size,
+                temperature,
+                dtype=dtype,
+                codes=True,
+                backend=p.backend,
+            )
+
+        return kinetics.transport_kinetics(
+            p.metadynamic,
+            p.static,
+            p.grain_growth,
+            previous_mechanism,
+            strain,
+            h.strain_rate[..., index],
+            grain_size,
+            recrystallized_fraction,
+            h.duration[..., index],
+            temperature,
+            dtype=dtype,
+            codes=True,
+            backend=p.backend,
+        )
+
+    def evaluate(
+        self,
+        grain_size=None,
+        recrystallized_fraction=None,
+        strain=None,
+        parameters: Optional[JMAKMaterialParameters] = None,
+        dtype=None,
+        codes: bool = False,
+    ) -> ProgramResult:
+        """
+        Evaluate the microstructure evolution for arrays of initial states.
+        The initial values and the fields of the parameter sets are broadcast against each other,
+        so perturbed coefficients can be given as arrays, too.
+
+        :param grain_size: incoming grain size, defaults to the one of the compiled sequence
+        :param recrystallized_fraction: incoming recrystallized fraction, defaults to the one of the compiled sequence
+        :param strain: incoming strain, defaults to the one of the compiled sequence
+        :param parameters: parameter sets to use instead of the compiled ones
+        :param dtype: floating point type to evaluate in, see :py:func:`kinetics.roll_pass_kinetics`
+        :param codes: whether to return the mechanisms as codes of :py:class:`RecrystallizationMechanism`,
+            as used during evaluation
+        """
+        h = self.history
+        p = parameters if parameters is not None else self.parameters
+
+        strain, grain_size, recrystallized_fraction = np.broadcast_arrays(
+            h.in_strain if strain is None else strain,
+            h.in_grain_size if grain_size is None else grain_size,
+            (
+                h.in_recrystallized_fraction
+                if recrystallized_fraction is None
+                else recrystallized_fraction
+            ),
+        )
+        mechanism = np.full(
+            strain.shape,
+            RecrystallizationMechanism(h.in_previous_mechanism).code,
+            dtype=np.int8,
+        )
+
+        columns = []
+        for i in range(len(h.labels)):
+            result = self.evaluate_unit(
+                i,
+                strain,
+                grain_size,
+                recrystallized_fraction,
+                mechanism,
+                parameters=p,
+                dtype=dtype,
+            )
+
+            mechanism = result.recrystallization_mechanism
+            strain = result.out_strain
+            grain_size = result.out_grain_size
+            recrystallized_fraction = result.out_recrystallized_fraction
+            columns.append(result)
+
+        def _stack(name):
+            return np.stack(
+                [np.broadcast_to(getattr(c, name), strain.shape) for c in columns],
+                axis=-1,
+            )
+
+        mechanisms = _stack("recrystallization_mechanism")
+
+        return ProgramResult(
+            labels=h.labels,
+            recrystallization_mechanism=(
+                mechanisms if codes else RecrystallizationMechanism.decode(mechanisms)
+            ),
+            recrystallized_fraction=_stack("recrystallized_fraction"),
+            recrystallized_grain_size=_stack("recrystallized_grain_size"),
+            out_recrystallized_fraction=_stack("out_recrystallized_fraction"),
+            out_grain_size=_stack("out_grain_size"),
+            out_strain=_stack("out_strain"),
+        )
+
+
+def compile_schedule(sequence: PassSequence) -> ScheduleProgram:
+    """
+    Compile the JMAK chain of a solved pass sequence into an array program.
+    The parameter sets are taken from the incoming profile of the sequence.
+
+    :raises ValueError: if the history can not be taken, see :py:meth:`ThermomechanicalHistory.from_sequence`
+    """
+    return ScheduleProgram(
+        history=ThermomechanicalHistory.from_sequence(sequence),
+        parameters=profile_parameters(sequence.in_profile),
+    )
@@ -1,7 +1,15 @@
 import numpy as np
 from pyroll.core import BaseRollPass, Hook
 
-from .common import critical_value_function, reference_value_function
+from . import kinetics
+from .codes import RecrystallizationMechanism
+from .common import (
+    critical_value_function,
+    reference_value_function,
+    average_temperature,
+    kinetics_backend,
+)
+from .config import Config as LocalConfig
 
 BaseRollPass.recrystallization_critical_strain = Hook[float]()
 """Critical strain for start of dynamic recrystallization."""
@@ -9,6 +17,11 @@ BaseRollPass.recrystallization_critical_strain = Hook[float]()
 BaseRollPass.recrystallization_reference_strain = Hook[float]()
 """Reference strain of dynamic recrystallization. Typically strain of half recrystallization or strain of steady state. Depends on used parameter set."""
 
+BaseRollPass.incremental_dynamic_recrystallization = Hook[
+    kinetics.IncrementalDynamicKinetics
+]()
+"""Results of dynamic recrystallization integrated over the disk elements, used if enabled in the config."""
+
 
 @BaseRollPass.OutProfile.recrystallized_fraction
 def roll_pass_out_recrystallized_fraction(self: BaseRollPass.OutProfile):
@@ -44,36 +57,37 @@ def roll_pass_jmak_recrystallization_parameters(self: BaseRollPass):
 @BaseRollPass.recrystallization_mechanism
 def roll_pass_recrystallization_mechanism(self: BaseRollPass):
     if not self.has_value("jmak_recrystallization_parameters"):
-        return "none"
+        return RecrystallizationMechanism.NONE
+
+    if LocalConfig.INCREMENTAL_DYNAMIC_RECRYSTALLIZATION:
+        return RecrystallizationMechanism(
+            str(self.incremental_dynamic_recrystallization.recrystallization_mechanism)
+        )
 
     if self.in_profile.strain + self.strain > self.recrystallization_critical_strain:
-        return "dynamic"
-    return "none"
+        return RecrystallizationMechanism.DYNAMIC
+    return RecrystallizationMechanism.NONE
 
 
 @BaseRollPass.recrystallized_fraction
 def roll_pass_recrystallized_fraction(self: BaseRollPass):
     """Fraction of microstructure which is recrystallized"""
-    if not self.recrystallization_mechanism == "dynamic":
+    if not self.recrystallization_mechanism == RecrystallizationMechanism.DYNAMIC:
         return 0
 
+    if LocalConfig.INCREMENTAL_DYNAMIC_RECRYSTALLIZATION:
+        return float(
+            self.incremental_dynamic_recrystallization.recrystallized_fraction[-1]
+        )
+
     if self.recrystallization_critical_strain > self.recrystallization_reference_strain:
         return 0
 
-    recrystallized = 1 - np.exp(
-        self.jmak_recrystallization_parameters.k
-        * (
-            (
-                self.in_profile.strain
-                + self.strain
-                - self.recrystallization_critical_strain
-            )
-            / (
-                self.recrystallization_reference_strain
-                - self.recrystallization_critical_strain
-            )
-        )
-        ** self.jmak_recrystallization_parameters.n
+    recrystallized = kinetics_backend(self).recrystallized_fraction(
+        self.jmak_recrystallization_parameters,
+        self.in_profile.strain + self.strain,
+        self.recrystallization_critical_strain,
+        self.recrystallization_reference_strain,
     )
     if np.isfinite(recrystallized) and recrystallized > 0:
         return recrystallized
@@ -91,3 +105,60 @@ def roll_pass_recrystallization_critical_strain(self: BaseRollPass):
 def roll_pass_recrystallization_recrystallization_reference_strain(self: BaseRollPass):
     """Calculation of strain for steady state flow during dynamic recrystallization"""
     return reference_value_function(self, self.strain_rate)
+
+
+@BaseRollPass.recrystallized_grain_size
+def roll_pass_recrystallized_grain_size(self: BaseRollPass):
+    """Mean grain size of the grains recrystallized over the disk elements, if enabled in the config."""
+    if LocalConfig.INCREMENTAL_DYNAMIC_RECRYSTALLIZATION:
+        return float(
+            self.incremental_dynamic_recrystallization.mean_recrystallized_grain_size
+        )
+
+
+def _element_strain_rate(element) -> float:
+    """Strain rate of a disk element, zero if it does not provide one."""
+    try:
+        return element.strain_rate or 0
+    except (AttributeError, ValueError):
+        return 0
+
+
+@BaseRollPass.incremental_dynamic_recrystallization
+def roll_pass_incremental_dynamic_recrystallization(self: BaseRollPass):
+    """
+    Gather the conditions of all disk elements and integrate dynamic recrystallization over them in one sweep.
+    The strain of the roll pass is distributed by the strains of the disk elements, or by their durations,
+    if these do not provide own strains. The strain rate of each disk element is used if it provides a nonzero one,
+    otherwise it is derived from the distributed strain increment and the duration of the element.
+    Without disk elements, the roll pass is treated as one element.
+    """
+    elements = self.disk_elements
+    if not elements:
+        return kinetics.incremental_dynamic_kinetics(
+            self.jmak_recrystallization_parameters,
+            self.in_profile.strain,
+            [self.strain],
+            [self.strain_rate],
+            self.in_profile.grain_size,
+            [average_temperature(self)],
+            backend=kinetics_backend(self),
+        )
+
+    durations = np.array([e.duration for e in elements])
+    strains = np.array([e.strain for e in elements])
+    total = np.sum(strains)
+    weights = strains / total if total > 0 else durations / np.sum(durations)
+    increments = self.strain * weights
+    strain_rates = np.array([_element_strain_rate(e) for e in elements])
+    strain_rates = np.where(strain_rates > 0, strain_rates, increments / durations)
+
+    return kinetics.incremental_dynamic_kinetics(
+        self.jmak_recrystallization_parameters,
+        self.in_profile.strain,
+        increments,
+        strain_rates,
+        self.in_profile.grain_size,
+        [average_temperature(e) for e in elements],
+        backend=kinetics_backend(self),
+    )
@@ -0,0 +1,85 @@
+"""
+Screening of the microstructure evolution of several materials for one thermomechanical history.
+
+The history of strains, strain rates, durations and temperatures is taken once from a solved pass sequence and the
+kinetics are evaluated for all materials at once with their parameter sets stacked into arrays, without solving the
+sequence again per material.
+The history is assumed to be independent of the material, material dependent effects on temperatures or geometry
+are not regarded.
+"""
+
+from typing import NamedTuple, Tuple, Optional, Sequence, Union, Dict
+
+import numpy as np
+from pyroll.core import PassSequence, Unit
+
+from . import kinetics
+from .codes import RecrystallizationMechanism
+from .material_data import MATERIALS, material_parameters
+from .program import ThermomechanicalHistory, ScheduleProgram
+
+
+class ScreeningResult(NamedTuple):
+    """Microstructure evolution per material and unit, the arrays have the shape (materials, units)."""
+
+    materials: Tuple
+    labels: Tuple[str, ...]
+    recrystallization_mechanism: np.ndarray
+    recrystallized_fraction: np.ndarray
+    recrystallized_grain_size: np.ndarray
+    out_recrystallized_fraction: np.ndarray
+    out_grain_size: np.ndarray
+    out_strain: np.ndarray
+
+    def table(self, name: str = "out_grain_size") -> Dict[str, Dict[str, float]]:
+        """Values of the field ``name`` as nested mapping of material and unit label."""
+        values = getattr(self, name)
+        return {
+            str(m): {label: v.item() for label, v in zip(self.labels, row)}
+            for m, row in zip(self.materials, values)
+        }
+
+
+def screen_materials(
+    history: Union[ThermomechanicalHistory, PassSequence],
+    materials: Optional[Sequence[Union[str, Sequence[str]]]] = None,
+) -> ScreeningResult:
+    """
+    Evaluate the microstructure evolution of several materials for one thermomechanical history.
+
+    :param history: the history, or a solved pass sequence to take it from
+    :param materials: the materials to evaluate, defaults to the ones provided with this package
+    """
+    if isinstance(history, Unit):
+        history = ThermomechanicalHistory.from_sequence(history)
+    materials = tuple(materials if materials is not None else MATERIALS)
+
+    # materials are stacked per kinetics backend, as each backend evaluates its own arrays
+    backends = [material_parameters(m).backend for m in materials]
+    groups = [
+        [i for i, b in enumerate(backends) if b == backend]
+        for backend in dict.fromkeys(backends)
+    ]
+    results = [
+        ScheduleProgram(
+            history, kinetics.stack_material_parameters([materials[i] for i in rows])
+        ).evaluate(grain_size=np.full(len(rows), history.in_grain_size), codes=True)
+        for rows in groups
+    ]
+    order = np.argsort(np.concatenate(groups))
+
+    def _merge(name):
+        return np.concatenate([getattr(r, name) for r in results])[order]
+
+    return ScreeningResult(
+        materials=materials,
+        labels=history.labels,
+        recrystallization_mechanism=RecrystallizationMechanism.decode(
+            _merge("recrystallization_mechanism")
+        ),
+        recrystallized_fraction=_merge("recrystallized_fraction"),
+        recrystallized_grain_size=_merge("recrystallized_grain_size"),
+        out_recrystallized_fraction=_merge("out_recrystallized_fraction"),
+        out_grain_size=_merge("out_grain_size"),
+        out_strain=_merge("out_strain"),
+    )
@@ -0,0 +1,492 @@
+"""
+Local prediction server answering microstructure queries by micro-batched evaluation of the JMAK kinetics.
+
+The server keeps the material parameter sets loaded and collects concurrently arriving queries into micro-batches,
+which are evaluated with the array functions in :py:mod:`pyroll.jmak_recrystallization.kinetics`.
+It communicates by newline-delimited JSON over a local TCP or Unix domain socket.
+Each request line is a JSON object describing one unit, for example::
+
+    {"id": 1, "material": "C45", "unit": "roll_pass",
+     "strain": 0, "pass_strain": 0.5, "strain_rate": 10, "grain_size": 50e-6, "temperature": 1273.15}
+
+    {"id": 2, "material": "C45", "unit": "transport", "previous_mechanism": "dynamic",
+     "strain": 0.5, "strain_rate": 10, "grain_size": 50e-6, "recrystallized_fraction": 0,
+     "duration": 1, "temperature": 1273.15}
+
+The values ``unit``, ``material`` (a name or a list of names as in :py:func:`material_parameters`) and the process
+conditions of the unit are required, except for the following defaults applying if omitted:
+``strain`` (the retained strain entering the unit) is 0, ``recrystallized_fraction`` is 0 and ``previous_mechanism`` is
+``"dynamic"``, i.e. a transport following a roll pass with dynamic recrystallization.
+The ``id`` is optional and may be any JSON value.
+
+The response line holds the echoed ``id``, the ``result`` mapping with the fields of
+:py:class:`~pyroll.jmak_recrystallization.kinetics.RollPassKinetics` resp.
+:py:class:`~pyroll.jmak_recrystallization.kinetics.TransportKinetics`,
+the ``latency`` in seconds and the ``batch_size`` the query was evaluated in, or an ``error`` message.
+The request ``{"command": "metrics"}`` returns the current :py:class:`ServerMetrics`.
+
+Run it with ``python -m pyroll.jmak_recrystallization.server --port 8765`` or ``--path /tmp/jmak.sock``.
+This protocol is the supported client interface, clients can implement it with any JSON and socket library.
+Importing :py:class:`PredictionClient` imports PyRolL itself, so it is meant for tests and applications which do so
+anyway.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import itertools
+import json
+import time
+from typing import Mapping, Optional, Dict, Any, List, Tuple
+
+import numpy as np
+
+from . import kinetics
+from .codes import RecrystallizationMechanism
+from .material_data import material_parameters, JMAKMaterialParameters
+
+_DEFAULTS = {
+    "strain": 0,
+    "recrystallized_fraction": 0,
+    "previous_mechanism": "dynamic",
+}
+
+_INPUTS = {
+    "roll_pass": ["strain", "pass_strain", "strain_rate", "grain_size", "temperature"],
+    "transport": [
+        "previous_mechanism",
+        "strain",
+        "strain_rate",
+        "grain_size",
+        "recrystallized_fraction",
+        "duration",
+        "temperature",
+    ],
+}
+
+
+@dataclasses.dataclass
+class ServerMetrics:
+    """Snapshot of the performance metrics of a :py:class:`PredictionServer`."""
+
+    request_count: int = 0
+    """Count of answered queries."""
+
+    error_count: int = 0
+    """Count of queries answered with an error."""
+
+    batch_count: int = 0
+    """Count of evaluated micro-batches."""
+
+    max_batch_size: int = 0
+    """Size of the largest micro-batch."""
+
+    mean_batch_size: float = 0
+    """Mean count of queries per micro-batch."""
+
+    mean_latency: float = 0
+    """Mean time between receiving and answering a query in seconds."""
+
+    max_latency: float = 0
+    """Maximum time between receiving and answering a query in seconds."""
+
+    evaluation_time: float = 0
+    """Total time spent evaluating micro-batches in seconds."""
+
+    throughput: float = 0
+    """Count of answered queries per second of evaluation time."""
+
+
+class PredictionServer:
+    """Server evaluating microstructure queries in micro-batches. See the module docstring for the protocol."""
+
+    def __init__(self, max_batch_size: int = 1024, max_delay: float = 1e-3):
+        """
+        :param max_batch_size: maximum count of queries evaluated in one micro-batch
+        :param max_delay: maximum time in seconds to wait for further queries after the first one of a micro-batch
+        """
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+        self._parameters: Dict[Any, JMAKMaterialParameters] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        self._request_count = 0
+        self._error_count = 0
+        self._batch_count = 0
+        self._max_batch_size = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._evaluation_time = 0.0
+
+    @property
+    def metrics(self) -> ServerMetrics:
+        """Current performance metrics."""
+        return ServerMetrics(
+            request_count=self._request_count,
+            error_count=self._error_count,
+            batch_count=self._batch_count,
+            max_batch_size=self._max_batch_size,
+            mean_batch_size=(
+                self._request_count / self._batch_count if self._batch_count else 0
+            ),
+            mean_latency=(
+                self._total_latency / self._request_count if self._request_count else 0
+            ),
+            max_latency=self._max_latency,
+            evaluation_time=self._evaluation_time,
+            throughput=(
+                self._request_count / self._evaluation_time
+                if self._evaluation_time
+                else 0
+            ),
+        )
+
+    @property
+    def sockets(self):
+        """Sockets the server is listening on, if started."""
+        return self._server.sockets if self._server else ()
+
+    def material_parameters(self, material) -> JMAKMaterialParameters:
+        """Parameter sets of the material, resolved once and kept loaded."""
+        key = material if isinstance(material, str) else tuple(material)
+        parameters = self._parameters.get(key, None)
+        if parameters is None:
+            parameters = self._parameters[key] = material_parameters(material)
+        return parameters
+
+    async def predict(self, query: Mapping) -> Dict[str, Any]:
+        """Evaluate a single query within the next micro-batch and return the response mapping."""
+        self._ensure_batcher()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future, time.perf_counter()))
+        return await future
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None
+    ):
+        """
+        Start listening on a TCP socket or, if ``path`` is given, on a Unix domain socket.
+        Use port 0 to choose a free port, retrieve it from :py:attr:`sockets`.
+        """
+        self._ensure_batcher()
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=path
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_connection, host=host, port=port
+            )
+        return self._server
+
+    async def serve_forever(self):
+        """Serve until cancelled, the server must be started before."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening and cancel the micro-batching."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._batcher:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _ensure_batcher(self):
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                self._evaluate_batch(batch)
+            except Exception as e:
+                # keep the batcher alive, answering the affected queries with the error
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_result({"error": f"Evaluation failed: {e!r}"})
+
+    def _evaluate_batch(self, batch: List[Tuple[Mapping, asyncio.Future, float]]):
+        start = time.perf_counter()
+        groups: Dict[Tuple[str, Any], List[int]] = {}
+        inputs: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+
+        for i, (query, _, _) in enumerate(batch):
+            try:
+                unit = query["unit"]
+                if unit not in _INPUTS:
+                    raise ValueError(
+                        f"Unknown unit type {unit!r}, use one of {list(_INPUTS)}."
+                    )
+                missing = [
+                    n for n in _INPUTS[unit] if n not in query and n not in _DEFAULTS
+                ]
+                if missing:
+                    raise ValueError(f"Missing values for {missing}.")
+                inputs[i] = {
+                    n: _input(n, query.get(n, _DEFAULTS.get(n, None)))
+                    for n in _INPUTS[unit]
+                }
+                material = query["material"]
+                key = (unit, material if isinstance(material, str) else tuple(material))
+                groups.setdefault(key, []).append(i)
+            except (KeyError, TypeError, ValueError) as e:
+                responses[i] = {"error": f"Invalid query: {e!r}"}
+
+        for (unit, material), indices in groups.items():
+            try:
+                results = self._evaluate_group(
+                    unit, material, [inputs[i] for i in indices]
+                )
+                for j, i in enumerate(indices):
+                    responses[i] = {
+                        "result": {k: _to_json(v[j]) for k, v in results.items()}
+                    }
+            except Exception as e:
+                for i in indices:
+                    responses[i] = {"error": f"Evaluation failed: {e!r}"}
+
+        end = time.perf_counter()
+        self._batch_count += 1
+        self._max_batch_size = max(self._max_batch_size, len(batch))
+        self._evaluation_time += end - start
+
+        for (query, future, received), response in zip(batch, responses):
+            latency = end - received
+            self._request_count += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            if "error" in response:
+                self._error_count += 1
+
+            if "id" in query:
+                response["id"] = query["id"]
+            response["latency"] = latency
+            response["batch_size"] = len(batch)
+
+            if not future.done():
+                future.set_result(response)
+
+    def _evaluate_group(self, unit: str, material, queries: List[Mapping]):
+        parameters = self.material_parameters(material)
+        inputs = {name: np.array([q[name] for q in queries]) for name in _INPUTS[unit]}
+
+        if unit == "roll_pass":
+            results = kinetics.roll_pass_kinetics(
+                parameters.dynamic, **inputs, backend=parameters.backend
+            )
+        else:
+            results = kinetics.transport_kinetics(
+                parameters.metadynamic,
+                parameters.static,
+                parameters.grain_growth,
+                **inputs,
+                backend=parameters.backend,
+            )
+
+        return results._asdict()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def _answer(line: bytes):
+            query = None
+            try:
+                try:
+                    query = json.loads(line)
+                    if not isinstance(query, dict):
+                        raise ValueError("Query must be a JSON object.")
+                except ValueError as e:
+                    response = {"error": f"Invalid query: {e!r}"}
+                else:
+                    if query.get("command", None) == "metrics":
+                        response = {"result": dataclasses.asdict(self.metrics)}
+                        if "id" in query:
+                            response["id"] = query["id"]
+                    else:
+                        response = await self.predict(query)
+                data = json.dumps(response)
+            except Exception as e:  # every request gets a response
+                response = {"error": f"Internal error: {e!r}"}
+                if isinstance(query, dict) and "id" in query:
+                    response["id"] = query["id"]
+                data = json.dumps(response)
+
+            async with lock:
+                writer.write(data.encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(_answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class PredictionClient:
+    """
+    Client for a :py:class:`PredictionServer`, allowing multiple queries in flight on one connection.
+    Importing it imports PyRolL, applications avoiding its startup time should implement the protocol themselves.
+    """
+
+    def __init__(self):
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count()
+        self._receiver: Optional[asyncio.Task] = None
+
+    async def connect(
+        self,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        path: Optional[str] = None,
+    ):
+        """Connect to a TCP socket or, if ``path`` is given, to a Unix domain socket."""
+        if path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(host, port)
+        self._receiver = asyncio.create_task(self._receive())
+        return self
+
+    async def predict(self, query: Mapping) -> Dict[str, Any]:
+        """Send a query and return the response mapping."""
+        i = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[i] = future
+        self._writer.write(json.dumps(dict(query, id=i)).encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def predict_many(self, queries) -> List[Dict[str, Any]]:
+        """Send multiple queries at once and return the response mappings in order."""
+        return await asyncio.gather(*(self.predict(q) for q in queries))
+
+    async def metrics(self) -> ServerMetrics:
+        """Retrieve the current metrics of the server."""
+        response = await self.predict({"command": "metrics"})
+        return ServerMetrics(**response["result"])
+
+    async def close(self):
+        """Close the connection."""
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _receive(self):
+        while line := await self._reader.readline():
+            response = json.loads(line)
+            future = self._pending.pop(response.get("id", None), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Connection closed by server."))
+
+
+def _input(name: str, value):
+    """Validate a value of a query, numbers must be scalars."""
+    if name == "previous_mechanism":
+        if not isinstance(value, str):
+            raise TypeError(f"Value of {name!r} must be a string.")
+        return RecrystallizationMechanism(value).value
+
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"Value of {name!r} must be a number.")
+    return float(value)
+
+
+def _to_json(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1", help="host to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument(
+        "--path",
+        default=None,
+        help="path of a Unix domain socket to listen on instead of TCP",
+    )
+    parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=1024,
+        help="maximum queries per micro-batch",
+    )
+    parser.add_argument(
+        "--max-delay",
+        type=float,
+        default=1e-3,
+        help="maximum batching delay in seconds",
+    )
+    args = parser.parse_args(args)
+
+    async def _serve():
+        async with PredictionServer(args.max_batch_size, args.max_delay) as server:
+            await server.start(args.host, args.port, args.path)
+            await server.serve_forever()
+
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
 import numpy as np
-from pyroll.core import Transport, BaseRollPass, Hook, Config
-from .config import Config as LocalConfig
-
+from pyroll.core import Transport, BaseRollPass, Hook
+
+from . import kinetics
+from .codes import RecrystallizationMechanism, RecrystallizationState
+from .diagnostics import (
+    report,
+    METADYNAMIC_PARAMETERS_MISSING,
+    STATIC_PARAMETERS_MISSING,
+    GRAIN_GROWTH_PARAMETERS_MISSING,
+)
 from .common import (
     critical_value_function,
     reference_value_function,
     average_temperature,
+    previous_strain_rate,
+    kinetics_backend,
+    microstructure_deferred,
 )
 
 Transport.recrystallization_critical_time = Hook[float]()
@@ -17,49 +27,54 @@ Transport.recrystallization_reference_time = Hook[float]()
 Transport.recrystallization_finished_time = Hook[float]()
 """Time needed to finish recrystallization."""
 
+Transport.recrystallization_curves = Hook[kinetics.TransportCurves]()
+"""Recrystallized fraction, grain size and retained strain against time, evaluated on call at the requested times."""
+
 
 @Transport.recrystallization_mechanism
 def transport_recrystallization_mechanism(self: Transport):
     try:
         prev_mechanism = self.prev.recrystallization_mechanism
     except (IndexError, ValueError):
-        prev_mechanism = "none"
-
-    if prev_mechanism in ["dynamic", "metadynamic"]:
+        if self.in_profile.has_value("previous_recrystallization_mechanism"):
+            prev_mechanism = self.in_profile.previous_recrystallization_mechanism
+        else:
+            prev_mechanism = RecrystallizationMechanism.NONE
+
+    if prev_mechanism in [
+        RecrystallizationMechanism.DYNAMIC,
+        RecrystallizationMechanism.METADYNAMIC,
+    ]:
         if self.in_profile.has_value("jmak_metadynamic_recrystallization_parameters"):
-            return "metadynamic"
-        self.logger.warning(
-            "Conditions for metadynamic recrystallization met, but no coefficients available. "
-            "Falling back to static recrystallization."
-        )
+            return RecrystallizationMechanism.METADYNAMIC
+        report(self, METADYNAMIC_PARAMETERS_MISSING)
 
-    elif self.in_profile.recrystallization_state == "full":
+    elif self.in_profile.recrystallization_state == RecrystallizationState.FULL:
         if self.in_profile.has_value("jmak_grain_growth_parameters"):
-            return "grain_growth"
-        self.logger.warning(
-            "No grain growth parameters available. Falling back to no recrystallization."
-        )
-        return "none"
+            return RecrystallizationMechanism.GRAIN_GROWTH
+        report(self, GRAIN_GROWTH_PARAMETERS_MISSING)
+        return RecrystallizationMechanism.NONE
 
     if self.in_profile.has_value("jmak_static_recrystallization_parameters"):
-        return "static"
-    self.logger.warning(
-        "No static recrystallization parameters available. Falling back to no recrystallization."
-    )
-    return "none"
+        return RecrystallizationMechanism.STATIC
+    report(self, STATIC_PARAMETERS_MISSING)
+    return RecrystallizationMechanism.NONE
 
 
 @Transport.jmak_recrystallization_parameters
 def transport_jmak_recrystallization_parameters(self: BaseRollPass):
     """Use parameters for metadynamic or static recrystallization in roll passes."""
-    if self.recrystallization_mechanism == "metadynamic":
+    if self.recrystallization_mechanism == RecrystallizationMechanism.METADYNAMIC:
         return self.in_profile.jmak_metadynamic_recrystallization_parameters
     return self.in_profile.jmak_static_recrystallization_parameters
 
 
 @Transport.OutProfile.strain
 def transport_out_strain(self: Transport.OutProfile):
-    if self.recrystallization_state == "full":
+    if microstructure_deferred():
+        return None  # keep the solution free of microstructure, set by the deferred evaluation
+
+    if self.recrystallization_state == RecrystallizationState.FULL:
         return 0
 
     return self.transport.in_profile.strain * (
@@ -79,23 +94,23 @@ def transport_out_recrystallized_fraction(self: Transport.OutProfile):
 @Transport.recrystallization_critical_time
 def transport_recrystallization_critical_time(self: Transport):
     """Time needed for half the microstructure to statically recrystallize"""
-    return critical_value_function(self, self.prev_of(BaseRollPass).strain_rate)
+    return critical_value_function(self, previous_strain_rate(self))
 
 
 @Transport.recrystallization_reference_time
 def transport_recrystallization_reference_time(self: Transport):
     """Time needed for half the microstructure to statically recrystallize"""
-    return reference_value_function(self, self.prev_of(BaseRollPass).strain_rate)
+    return reference_value_function(self, previous_strain_rate(self))
 
 
 @Transport.OutProfile.grain_size
 def transport_out_grain_size(self: Transport.OutProfile):
     t = self.transport
 
-    if t.recrystallization_mechanism == "none":
+    if t.recrystallization_mechanism == RecrystallizationMechanism.NONE:
         return t.in_profile.grain_size
 
-    if t.recrystallization_mechanism == "grain_growth":
+    if t.recrystallization_mechanism == RecrystallizationMechanism.GRAIN_GROWTH:
         return transport_grain_growth(t, t.in_profile.grain_size, t.duration)
 
     if not t.has_value("jmak_recrystallization_parameters"):
@@ -105,7 +120,7 @@ def transport_out_grain_size(self: Transport.OutProfile):
     grown_recrystallized_grain_size = transport_grain_growth(
         t, t.recrystallized_grain_size, t.duration - t.recrystallization_finished_time
     )
-    if t.recrystallization_mechanism == "static":
+    if t.recrystallization_mechanism == RecrystallizationMechanism.STATIC:
         d = (
             t.recrystallized_fraction ** (4 / 3) * grown_recrystallized_grain_size
             + (1 - t.recrystallized_fraction) ** 2 * grown_in_grain_size
@@ -124,38 +139,31 @@ def transport_out_grain_size(self: Transport.OutProfile):
 @Transport.recrystallized_fraction
 def transport_recrystallized_fraction(self: Transport):
     """Fraction of microstructure which is recrystallized"""
-    if self.recrystallization_mechanism == "none":
+    if self.recrystallization_mechanism == RecrystallizationMechanism.NONE:
         return 0
 
     if self.recrystallization_critical_time > self.recrystallization_reference_time:
         return 0
 
-    virtual_time = (
-        self.recrystallization_reference_time - self.recrystallization_critical_time
-    ) * (
-        np.log(1 - self.in_profile.recrystallized_fraction)
-        / self.jmak_recrystallization_parameters.k
-    ) ** (
-        1 / self.jmak_recrystallization_parameters.n
-    ) + self.recrystallization_critical_time
+    backend = kinetics_backend(self)
+    virtual_time = backend.virtual_time(
+        self.jmak_recrystallization_parameters,
+        self.in_profile.recrystallized_fraction,
+        self.recrystallization_critical_time,
+        self.recrystallization_reference_time,
+    )
 
     recrystallized = (
-        1
-        - np.exp(
-            self.jmak_recrystallization_parameters.k
-            * (
-                (self.duration + virtual_time - self.recrystallization_critical_time)
-                / (
-                    self.recrystallization_reference_time
-                    - self.recrystallization_critical_time
-                )
-            )
-            ** self.jmak_recrystallization_parameters.n
+        backend.recrystallized_fraction(
+            self.jmak_recrystallization_parameters,
+            self.duration + virtual_time,
+            self.recrystallization_critical_time,
+            self.recrystallization_reference_time,
         )
         - self.in_profile.recrystallized_fraction
     )
 
-    if np.isfinite(recrystallized):
+    if np.isfinite(recrystallized) and recrystallized > 0:
         return recrystallized
     else:
         return 0
@@ -164,13 +172,13 @@ def transport_recrystallized_fraction(self: Transport):
 @Transport.recrystallization_critical_time
 def transport_recrystallization_critical_time(self: Transport):
     """Calculation of the critical strain needed for the onset of dynamic recrystallization"""
-    return critical_value_function(self, self.prev_of(BaseRollPass).strain_rate)
+    return critical_value_function(self, previous_strain_rate(self))
 
 
 @Transport.recrystallization_reference_time
 def transport_recrystallization_reference_time(self: Transport):
     """Calculation of strain for steady state flow during dynamic recrystallization"""
-    return reference_value_function(self, self.prev_of(BaseRollPass).strain_rate)
+    return reference_value_function(self, previous_strain_rate(self))
 
 
 def transport_grain_growth(transport: Transport, grain_size: float, duration: float):
@@ -181,25 +189,49 @@ def transport_grain_growth(transport: Transport, grain_size: float, duration: fl
     if duration < 0:
         return grain_size
 
-    return (
-        (
-            (grain_size * 1e6) ** parameters.d1
-            + parameters.d2
-            * duration
-            * np.exp(
-                parameters.qd
-                / (Config.UNIVERSAL_GAS_CONSTANT * average_temperature(transport))
-            )
-        )
-        ** (1 / parameters.d1)
-    ) / 1e6
+    return kinetics_backend(transport).grain_growth(
+        parameters, grain_size, duration, average_temperature(transport)
+    )
 
 
 @Transport.recrystallization_finished_time
 def transport_recrystallization_finished_time(self: Transport):
-    p = self.in_profile
-    return (
-        np.log(LocalConfig.THRESHOLD) / self.jmak_recrystallization_parameters.k
-    ) ** (
-        1 / self.jmak_recrystallization_parameters.n
-    ) * self.recrystallization_reference_time
+    return kinetics_backend(self).finished_time(
+        self.jmak_recrystallization_parameters, self.recrystallization_reference_time
+    )
+
+
+@Transport.recrystallization_curves
+def transport_recrystallization_curves(self: Transport):
+    ip = self.in_profile
+    has_parameters = (
+        self.recrystallization_mechanism != RecrystallizationMechanism.NONE
+        and self.has_value("jmak_recrystallization_parameters")
+    )
+
+    return kinetics.TransportCurves(
+        recrystallization_mechanism=self.recrystallization_mechanism,
+        parameters=self.jmak_recrystallization_parameters if has_parameters else None,
+        grain_growth_parameters=(
+            ip.jmak_grain_growth_parameters
+            if ip.has_value("jmak_grain_growth_parameters")
+            else None
+        ),
+        critical_time=(
+            self.recrystallization_critical_time if has_parameters else np.nan
+        ),
+        reference_time=(
+            self.recrystallization_reference_time if has_parameters else np.nan
+        ),
+        finished_time=(
+            self.recrystallization_finished_time if has_parameters else np.nan
+        ),
+        recrystallized_grain_size=(
+            self.recrystallized_grain_size if has_parameters else np.nan
+        ),
+        in_strain=ip.strain,
+        in_grain_size=ip.grain_size,
+        in_recrystallized_fraction=ip.recrystallized_fraction,
+        temperature=average_temperature(self),
+        backend=kinetics_backend(self),
+    )
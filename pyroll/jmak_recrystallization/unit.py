@@ -1,8 +1,8 @@
-import numpy as np
-from pyroll.core import Unit, Hook, BaseRollPass, Config
+from pyroll.core import Unit, Hook, BaseRollPass
 from .config import Config as LocalConfig
 
-from .common import average_temperature
+from .codes import RecrystallizationState
+from .common import average_temperature, previous_strain_rate, kinetics_backend
 from .material_data import JMAKRecrystallizationParameters
 
 Unit.recrystallized_grain_size = Hook[float]()
@@ -15,7 +15,10 @@ Unit.jmak_recrystallization_parameters = Hook[JMAKRecrystallizationParameters]()
 """Current set of recrystallization parameters active."""
 
 Unit.recrystallization_mechanism = Hook[str]()
-"""String identifying the acting primary recrystallization mechanism: either 'dynamic', 'metadynamic', 'static' or 'none'."""
+"""
+Acting primary recrystallization mechanism as :py:class:`RecrystallizationMechanism`, equal to one of the strings
+'dynamic', 'metadynamic', 'static', 'grain_growth' or 'none'.
+"""
 
 
 @Unit.OutProfile.recrystallized_fraction
@@ -40,20 +43,15 @@ def recrystallized_grain_size(self: Unit):
     strain_rate = (
         self.strain_rate
         if isinstance(self, BaseRollPass)
-        else self.prev_of(BaseRollPass).strain_rate
+        else previous_strain_rate(self)
+    )
+    return kinetics_backend(self).recrystallized_grain_size(
+        self.jmak_recrystallization_parameters,
+        p.strain,
+        strain_rate,
+        p.grain_size,
+        average_temperature(self),
     )
-    return (
-        self.jmak_recrystallization_parameters.c1
-        * (p.strain + LocalConfig.BASE_STRAIN)
-        ** self.jmak_recrystallization_parameters.c2
-        * (strain_rate + LocalConfig.BASE_STRAIN_RATE)
-        ** self.jmak_recrystallization_parameters.c3
-        * (p.grain_size * 1e6) ** self.jmak_recrystallization_parameters.c4
-        * np.exp(
-            self.jmak_recrystallization_parameters.qc
-            / (Config.UNIVERSAL_GAS_CONSTANT * average_temperature(self))
-        )
-    ) / 1e6
 
 
 @Unit.Profile.recrystallization_state
@@ -64,8 +62,8 @@ def recrystallization_state(self: Unit.Profile):
     if return = 'none' -> dynamic recrystallization didn't happen
     """
     if self.recrystallized_fraction > 1 - LocalConfig.THRESHOLD:
-        return "full"
+        return RecrystallizationState.FULL
     elif self.recrystallized_fraction > LocalConfig.THRESHOLD:
-        return "partial"
+        return RecrystallizationState.PARTIAL
     else:
-        return "none"
+        return RecrystallizationState.NONE
@@ -0,0 +1,174 @@
+"""Standard schedules shared by the tests."""
+
+from pyroll.core import (
+    Profile,
+    PassSequence,
+    RollPass,
+    Roll,
+    CircularOvalGroove,
+    Transport,
+    RoundGroove,
+    ThreeRollPass,
+)
+
+MATERIALS = ["S355J2", "C20", "C54SICE6", "C45", "C-Mn", "CuZn30"]
+
+
+def create_sequence(durations=(1, 1)):
+    return PassSequence(
+        [
+            RollPass(
+                label="Oval I",
+                roll=Roll(
+                    groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            Transport(label="I => II", duration=durations[0]),
+            RollPass(
+                label="Round II",
+                roll=Roll(
+                    groove=RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            Transport(label="II", duration=durations[1]),
+        ]
+    )
+
+
+def create_in_profile(material_id, **kwargs):
+    return Profile.round(
+        **{
+            "diameter": 30e-3,
+            "temperature": 1000 + 273.15,
+            "strain": 0,
+            "material": [material_id, "steel"],
+            "flow_stress": 100e6,
+            "density": 7.5e3,
+            "thermal_capacity": 690,
+            "grain_size": 50e-6,
+            "recrystallized_fraction": 0,
+        }
+        | kwargs
+    )
+
+
+def create_three_roll_sequence():
+    return PassSequence(
+        [
+            ThreeRollPass(
+                label="Oval I",
+                roll=Roll(
+                    groove=CircularOvalGroove(
+                        depth=8e-3, r1=6e-3, r2=40e-3, pad_angle=30
+                    ),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            Transport(label="I => II", duration=1),
+            ThreeRollPass(
+                label="Round II",
+                roll=Roll(
+                    groove=RoundGroove(r1=3e-3, r2=25e-3, depth=11e-3, pad_angle=30),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+        ]
+    )
+
+
+def create_four_pass_sequence():
+    return PassSequence(
+        [
+            RollPass(
+                label="Oval I",
+                roll=Roll(
+                    groove=CircularOvalGroove(depth=8e-3, r1=6e-3, r2=40e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            Transport(label="I => II", duration=0.5),
+            RollPass(
+                label="Round II",
+                roll=Roll(
+                    groove=RoundGroove(r1=1e-3, r2=12.5e-3, depth=11.5e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            Transport(label="II => III", duration=0.05),
+            RollPass(
+                label="Oval III",
+                roll=Roll(
+                    groove=CircularOvalGroove(depth=6e-3, r1=6e-3, r2=35e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=2e-3,
+            ),
+            Transport(label="III => IV", duration=2),
+            RollPass(
+                label="Round IV",
+                roll=Roll(
+                    groove=RoundGroove(r1=1e-3, r2=10e-3, depth=9.5e-3),
+                    nominal_radius=160e-3,
+                    rotational_frequency=1,
+                ),
+                gap=1e-3,
+            ),
+            Transport(label="Cooling 1", duration=1),
+            Transport(label="Cooling 2", duration=5),
+            Transport(label="Cooling 3", duration=20),
+        ]
+    )
+
+
+SCHEDULES = {
+    "two_pass": (lambda: create_sequence((1, 1)), {}),
+    "two_pass_short_interpass": (lambda: create_sequence((0.01, 10)), {}),
+    "three_roll": (
+        create_three_roll_sequence,
+        {"diameter": 55e-3, "temperature": 1200 + 273.15},
+    ),
+    "four_pass_cooling": (
+        create_four_pass_sequence,
+        {"temperature": 1100 + 273.15, "grain_size": 80e-6},
+    ),
+}
+"""Library of standard schedules as pairs of sequence factory and keyword arguments to ``create_in_profile``."""
+
+
+def solve_settled(unit, in_profile):
+    """Solve ``unit`` twice to settle the root hook values lagging behind, collecting fallbacks silently."""
+    import pyroll.jmak_recrystallization as prj
+
+    with prj.collect_diagnostics(emit_summary=False):
+        unit.solve(in_profile)
+        unit.solve(in_profile)
+    return unit
+
+
+def solve_schedule(schedule, material_id, sequence=None, **kwargs):
+    """
+    Solve a schedule of ``SCHEDULES`` settled, see :py:func:`solve_settled`.
+
+    :param sequence: instance of the schedule to solve, a new one by default
+    :param kwargs: values of the incoming profile overriding the ones of the schedule
+    """
+    factory, schedule_kwargs = SCHEDULES[schedule]
+    return solve_settled(
+        sequence or factory(),
+        create_in_profile(material_id, **(schedule_kwargs | kwargs)),
+    )
@@ -0,0 +1,207 @@
+import numpy as np
+import pytest
+from pyroll.core import Profile, Transport
+from schedules import create_in_profile, solve_schedule
+
+
+@pytest.fixture
+def slow_backend():
+    """Backend doubling the reference values of the JMAK equations, selected for C45."""
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import kinetics
+
+    class SlowBackend(prj.JMAKBackend):
+        def reference_value(
+            self, parameters, strain, strain_rate, grain_size, temperature
+        ):
+            return 2 * super().reference_value(
+                parameters, strain, strain_rate, grain_size, temperature
+            )
+
+    def slow_c45(self: Profile):
+        if self.fits_material("C45"):
+            return "slow"
+
+    backend = prj.register_backend("slow", SlowBackend())
+    function = Profile.recrystallization_kinetics_backend.add_function(slow_c45)
+    yield backend
+
+    Profile.recrystallization_kinetics_backend.remove_function(function)
+    del kinetics.BACKENDS["slow"]
+
+
+def out_values(sequence):
+    return [
+        (
+            u.out_profile.grain_size,
+            u.out_profile.recrystallized_fraction,
+            u.out_profile.strain,
+        )
+        for u in sequence
+    ]
+
+
+def test_get_backend():
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import kinetics
+
+    assert isinstance(kinetics.get_backend(), prj.JMAKBackend)
+    assert kinetics.get_backend("jmak") is kinetics.get_backend()
+
+    backend = prj.JMAKBackend()
+    assert kinetics.get_backend(backend) is backend
+
+    with pytest.raises(ValueError):
+        kinetics.get_backend("unknown")
+
+    with pytest.raises(NotImplementedError):
+        prj.KineticsBackend().finished_time(prj.material_parameters("C45").static, 1)
+
+
+def test_backend_per_material(slow_backend):
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import kinetics
+
+    assert prj.material_parameters("C45").backend == "slow"
+    assert prj.material_parameters("S355J2").backend == "jmak"
+
+    with pytest.raises(ValueError):
+        kinetics.stack_material_parameters(["C45", "S355J2"])
+
+
+def test_backend_hooks_and_batch(slow_backend):
+    import pyroll.jmak_recrystallization as prj
+
+    default = solve_schedule(
+        "four_pass_cooling", "C45", recrystallization_kinetics_backend="jmak"
+    )
+    sequence = solve_schedule("four_pass_cooling", "C45")
+    assert not np.allclose(out_values(sequence), out_values(default))
+
+    # the compiled program evaluates the backend of the material, too
+    result = prj.compile_schedule(sequence).evaluate()
+    np.testing.assert_allclose(
+        np.transpose(
+            [
+                result.out_grain_size,
+                result.out_recrystallized_fraction,
+                result.out_strain,
+            ]
+        ),
+        out_values(sequence),
+        rtol=1e-4,
+        atol=1e-12,
+    )
+
+    for u in sequence:
+        if isinstance(u, Transport):
+            np.testing.assert_allclose(
+                u.recrystallization_curves([u.duration]).grain_size[-1],
+                u.out_profile.grain_size,
+                rtol=1e-4,
+            )
+
+    screened = prj.screen_materials(sequence, [["S355J2", "steel"], ["C45", "steel"]])
+    np.testing.assert_allclose(
+        screened.out_grain_size[1], result.out_grain_size, rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        screened.out_grain_size[0],
+        prj.screen_materials(sequence, [["S355J2", "steel"]]).out_grain_size[0],
+        rtol=1e-12,
+    )
+
+
+def test_backend_checkpoint(slow_backend):
+    import pyroll.jmak_recrystallization as prj
+
+    sequence = solve_schedule("four_pass_cooling", "C45")
+    state = prj.JMAKState.from_unit(sequence[1])
+    assert state.parameters.backend == "slow"
+
+    restored = prj.JMAKState.from_dict(state.to_dict())
+    assert restored == state
+    assert (
+        restored.apply(create_in_profile("S355J2")).recrystallization_kinetics_backend
+        == "slow"
+    )
+
+
+def test_backend_negative_fraction_clamped():
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import kinetics
+
+    class ForgetfulBackend(prj.JMAKBackend):
+        def virtual_time(
+            self, parameters, recrystallized_fraction, critical, reference
+        ):
+            return 0 * recrystallized_fraction
+
+    backend = ForgetfulBackend()
+    p = prj.material_parameters("C45")
+    batch = kinetics.transport_kinetics(
+        p.metadynamic,
+        p.static,
+        p.grain_growth,
+        "none",
+        0.3,
+        10,
+        50e-6,
+        0.9,
+        0.01,
+        1273.15,
+        backend=backend,
+    )
+    assert batch.recrystallization_mechanism == "static"
+    assert batch.recrystallized_fraction == 0
+    assert batch.out_recrystallized_fraction == 0.9
+
+    prj.register_backend("forgetful", backend)
+    try:
+        transport = Transport(label="T", duration=0.01)
+        with prj.collect_diagnostics(emit_summary=False):
+            transport.solve(
+                create_in_profile(
+                    "C45",
+                    strain=0.3,
+                    recrystallized_fraction=0.9,
+                    previous_strain_rate=10,
+                    recrystallization_kinetics_backend="forgetful",
+                )
+            )
+    finally:
+        del kinetics.BACKENDS["forgetful"]
+
+    assert transport.recrystallization_mechanism == "static"
+    assert transport.recrystallized_fraction == 0
+    assert transport.out_profile.recrystallized_fraction == pytest.approx(0.9)
+
+
+def test_backend_cumulated_fraction():
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import kinetics
+
+    class LinearBackend(prj.JMAKBackend):
+        """Fraction growing linearly with the strain beyond the critical one, up to the reference strain."""
+
+        def cumulated_fraction(self, parameters, start, end, critical, reference):
+            return np.clip((end - critical) / (reference - critical), 0, 1)
+
+    p = prj.material_parameters("C45").dynamic
+    args = (p, 0.1, np.full(20, 0.02), np.full(20, 5), 50e-6, np.full(20, 1273.15))
+    jmak = kinetics.incremental_dynamic_kinetics(*args)
+    linear = kinetics.incremental_dynamic_kinetics(*args, backend=LinearBackend())
+
+    critical, reference = (
+        jmak.recrystallization_critical_strain,
+        jmak.recrystallization_reference_strain,
+    )
+    end = 0.1 + np.cumsum(np.full(20, 0.02))
+    np.testing.assert_allclose(
+        linear.recrystallized_fraction,
+        np.clip((end - critical) / (reference - critical), 0, 1),
+    )
+    assert not np.allclose(linear.recrystallized_fraction, jmak.recrystallized_fraction)
+
+    with pytest.raises(NotImplementedError):
+        prj.KineticsBackend().cumulated_fraction(p, 0, 1, 0.1, 0.5)
@@ -0,0 +1,95 @@
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+from pyroll.core import PassSequence
+from schedules import SCHEDULES, create_in_profile, solve_settled
+
+
+@pytest.mark.parametrize("material_id", ["C45", "CuZn30", "C20"])
+@pytest.mark.parametrize("boundary", [1, 2, 4, 7])
+def test_resume_from_state(boundary, material_id):
+    import pyroll.jmak_recrystallization as prj
+
+    factory, kwargs = SCHEDULES["four_pass_cooling"]
+    in_profile = create_in_profile(material_id, **kwargs)
+    full = solve_settled(factory(), in_profile)
+
+    upstream = PassSequence(factory()[:boundary])
+    upstream.solve(in_profile)
+    out_profile = upstream.solve(in_profile)
+
+    data = json.loads(json.dumps(prj.JMAKState.from_unit(upstream[-1]).to_dict()))
+    state = prj.JMAKState.from_dict(data)
+    assert state.previous_mechanism == full[boundary - 1].recrystallization_mechanism
+
+    downstream = solve_settled(
+        PassSequence(factory()[boundary:]), state.apply(out_profile)
+    )
+
+    for a, d in zip(downstream, full[boundary:]):
+        assert a.recrystallization_mechanism == d.recrystallization_mechanism
+        np.testing.assert_allclose(
+            [
+                a.out_profile.grain_size,
+                a.out_profile.recrystallized_fraction,
+                a.out_profile.strain,
+            ],
+            [
+                d.out_profile.grain_size,
+                d.out_profile.recrystallized_fraction,
+                d.out_profile.strain,
+            ],
+            rtol=1e-4,
+            atol=1e-12,
+        )
+
+
+def test_state_version():
+    import pyroll.jmak_recrystallization as prj
+
+    sequence = solve_settled(SCHEDULES["two_pass"][0](), create_in_profile("C45"))
+    data = prj.JMAKState.from_unit(sequence[0]).to_dict()
+    assert prj.JMAKState.from_dict(data) == prj.JMAKState.from_unit(sequence[0])
+
+    with pytest.raises(ValueError):
+        prj.JMAKState.from_dict(data | {"version": data["version"] + 1})
+
+
+def test_apply_drops_former_state():
+    import pyroll.jmak_recrystallization as prj
+
+    factory, kwargs = SCHEDULES["four_pass_cooling"]
+    in_profile = create_in_profile("C45", **kwargs)
+    first = PassSequence(factory()[:2])
+    solve_settled(first, in_profile)
+    former = prj.JMAKState.from_unit(first[-1]).apply(first[-1].out_profile)
+    assert former.has_value("previous_strain_rate")
+
+    # upstream input changed: resuming before any roll pass, with the grain growth parameters taken from the material
+    changed = prj.JMAKState.from_dict(
+        prj.JMAKState.from_unit(first[-1]).to_dict()
+        | {
+            "previous_mechanism": "none",
+            "previous_strain_rate": None,
+            "grain_size": 30e-6,
+        }
+    )
+    changed = dataclasses.replace(
+        changed, parameters=changed.parameters._replace(grain_growth=None)
+    )
+    clean = changed.apply(first[-1].out_profile)
+    applied = changed.apply(former)
+
+    assert "previous_strain_rate" not in applied.__dict__
+    assert "jmak_grain_growth_parameters" not in applied.__dict__
+    assert {k: v for k, v in applied.__dict__.items() if not k.startswith("_")} == {
+        k: v for k, v in clean.__dict__.items() if not k.startswith("_")
+    }
+
+    desired = solve_settled(PassSequence(factory()[2:]), clean)
+    actual = solve_settled(PassSequence(factory()[2:]), applied)
+    for a, d in zip(actual, desired):
+        assert a.recrystallization_mechanism == d.recrystallization_mechanism
+        assert a.out_profile.grain_size == d.out_profile.grain_size
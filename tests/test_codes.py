@@ -0,0 +1,118 @@
+import json
+
+import numpy as np
+import pytest
+from schedules import SCHEDULES, solve_schedule
+
+
+def test_codes_equal_strings():
+    from pyroll.jmak_recrystallization import (
+        RecrystallizationMechanism,
+        RecrystallizationState,
+    )
+
+    assert RecrystallizationMechanism.STATIC == "static"
+    assert "metadynamic" in [
+        RecrystallizationMechanism.DYNAMIC,
+        RecrystallizationMechanism.METADYNAMIC,
+    ]
+    assert (
+        f"{RecrystallizationState.FULL}" == str(RecrystallizationState.FULL) == "full"
+    )
+    assert (
+        json.loads(json.dumps(RecrystallizationMechanism.GRAIN_GROWTH))
+        == "grain_growth"
+    )
+
+    for enumeration in [RecrystallizationMechanism, RecrystallizationState]:
+        values = [m.value for m in enumeration]
+        codes = enumeration.encode(values)
+        assert codes.dtype == np.int8
+        np.testing.assert_array_equal(codes, [m.code for m in enumeration])
+        np.testing.assert_array_equal(enumeration.decode(codes), values)
+        np.testing.assert_array_equal(enumeration.encode(codes), codes)
+        assert [enumeration.from_code(c) for c in codes] == list(enumeration)
+
+    with pytest.raises(ValueError):
+        RecrystallizationMechanism.encode(["static", "unknown"])
+    with pytest.raises(ValueError):
+        RecrystallizationMechanism.encode([3, 5])
+    with pytest.raises(ValueError):
+        RecrystallizationState.encode(np.array([-1, 0], dtype=np.int8))
+    with pytest.raises(ValueError):
+        RecrystallizationState.encode([300])
+
+
+def test_state_codes():
+    from pyroll.jmak_recrystallization import kinetics, Config
+
+    fraction = np.array([0, Config.THRESHOLD / 2, 0.5, 1 - Config.THRESHOLD / 2, 1])
+    codes = kinetics.recrystallization_state_codes(fraction)
+    assert codes.dtype == np.int8
+    np.testing.assert_array_equal(codes, [0, 0, 1, 2, 2])
+    np.testing.assert_array_equal(
+        kinetics.recrystallization_state(fraction),
+        ["none", "none", "partial", "full", "full"],
+    )
+
+
+def test_transport_kinetics_codes():
+    from pyroll.jmak_recrystallization import (
+        kinetics,
+        material_parameters,
+        RecrystallizationMechanism,
+    )
+
+    p = material_parameters("S355J2")
+    previous = np.array(["dynamic", "none", "static", "metadynamic"])[:, None]
+    args = (np.full((4, 3), 0.3), 10, 50e-6, np.array([0, 0.5, 1]), 2, 1300)
+
+    strings = kinetics.transport_kinetics(
+        p.metadynamic, p.static, p.grain_growth, previous, *args
+    )
+    codes = kinetics.transport_kinetics(
+        p.metadynamic,
+        p.static,
+        p.grain_growth,
+        RecrystallizationMechanism.encode(previous),
+        *args,
+        codes=True,
+    )
+
+    assert codes.recrystallization_mechanism.dtype == np.int8
+    np.testing.assert_array_equal(
+        RecrystallizationMechanism.decode(codes.recrystallization_mechanism),
+        strings.recrystallization_mechanism,
+    )
+    np.testing.assert_array_equal(codes.out_grain_size, strings.out_grain_size)
+    assert set(strings.recrystallization_mechanism.flat) == {
+        "metadynamic",
+        "static",
+        "grain_growth",
+    }
+
+
+@pytest.mark.parametrize("schedule", SCHEDULES)
+def test_hooks_and_program_codes(schedule):
+    import pyroll.jmak_recrystallization as prj
+
+    sequence = solve_schedule(schedule, "C45")
+
+    for u in sequence:
+        assert isinstance(u.recrystallization_mechanism, prj.RecrystallizationMechanism)
+        assert isinstance(
+            u.out_profile.recrystallization_state, prj.RecrystallizationState
+        )
+
+    program = prj.compile_schedule(sequence)
+    grain_size = np.array([20e-6, 50e-6, 150e-6])
+    strings = program.evaluate(grain_size=grain_size)
+    codes = program.evaluate(grain_size=grain_size, codes=True)
+
+    assert codes.recrystallization_mechanism.dtype == np.int8
+    assert list(codes.recrystallization_mechanism[0]) == [
+        u.recrystallization_mechanism.code for u in sequence
+    ]
+    for name, mask in codes.masks().items():
+        np.testing.assert_array_equal(mask, strings.masks()[name])
+        np.testing.assert_array_equal(mask, strings.recrystallization_mechanism == name)
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from pyroll.core import Transport
+from schedules import (
+    MATERIALS,
+    SCHEDULES,
+    create_in_profile,
+    solve_schedule,
+    solve_settled,
+)
+
+
+@pytest.mark.parametrize("material_id", MATERIALS)
+@pytest.mark.parametrize("schedule", SCHEDULES)
+def test_curves_equal_transport_results(schedule, material_id):
+    sequence = solve_schedule(schedule, material_id)
+
+    for u in sequence:
+        if not isinstance(u, Transport):
+            continue
+
+        assert "recrystallization_curves" not in u.__cache__
+
+        times = np.linspace(0, u.duration, 50)
+        values = u.recrystallization_curves(times)
+        assert values.grain_size.shape == times.shape
+
+        ip = u.in_profile
+        op = u.out_profile
+        np.testing.assert_allclose(
+            [values.recrystallized_fraction[0], values.grain_size[0]],
+            [ip.recrystallized_fraction, ip.grain_size],
+            rtol=1e-9,
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            [
+                values.recrystallized_fraction[-1],
+                values.grain_size[-1],
+                values.strain[-1],
+            ],
+            [op.recrystallized_fraction, op.grain_size, op.strain],
+            rtol=1e-4,
+            atol=1e-12,
+        )
+        assert np.all(np.diff(values.recrystallized_fraction) >= -1e-12)
+
+
+@pytest.mark.parametrize("material_id", ["C45", "S355J2"])
+def test_curves_grain_growth(material_id):
+    import pyroll.jmak_recrystallization as prj
+
+    transport = Transport(label="T", duration=2)
+    in_profile = create_in_profile(
+        material_id, strain=0.1, recrystallized_fraction=0.97, previous_strain_rate=10
+    )
+    solve_settled(transport, in_profile)
+
+    assert (
+        transport.recrystallization_mechanism
+        == prj.RecrystallizationMechanism.GRAIN_GROWTH
+    )
+
+    values = transport.recrystallization_curves([0, transport.duration])
+    op = transport.out_profile
+    np.testing.assert_allclose(
+        [values.recrystallized_fraction[-1], values.grain_size[-1], values.strain[-1]],
+        [op.recrystallized_fraction, op.grain_size, op.strain],
+        rtol=1e-9,
+        atol=1e-12,
+    )
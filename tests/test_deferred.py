@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from schedules import SCHEDULES, create_in_profile, solve_schedule
+
+
+def microstructure(sequence):
+    return [
+        (
+            u.out_profile.grain_size,
+            u.out_profile.recrystallized_fraction,
+            u.out_profile.strain,
+            u.recrystallized_fraction,
+        )
+        for u in sequence
+    ]
+
+
+def mechanisms(sequence):
+    return [u.recrystallization_mechanism for u in sequence]
+
+
+@pytest.mark.parametrize("material_id", ["C45", "CuZn30"])
+@pytest.mark.parametrize("schedule", SCHEDULES)
+def test_deferred_equals_solution(schedule, material_id, monkeypatch):
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import kinetics
+
+    desired = solve_schedule(schedule, material_id)
+
+    calls = []
+    jmak_fraction = kinetics.jmak_fraction
+    monkeypatch.setattr(
+        kinetics,
+        "jmak_fraction",
+        lambda *args: calls.append(args) or jmak_fraction(*args),
+    )
+
+    with prj.config_scope(DEFERRED_MICROSTRUCTURE=True):
+        explicit = solve_schedule(schedule, material_id)
+        lazy = solve_schedule(schedule, material_id)
+        assert not calls
+
+        with prj.collect_diagnostics(emit_summary=False):
+            prj.evaluate_microstructure(explicit)
+            assert mechanisms(lazy) == mechanisms(desired)
+
+        for actual in [explicit, lazy]:
+            np.testing.assert_allclose(
+                microstructure(actual), microstructure(desired), rtol=1e-4, atol=1e-12
+            )
+            assert mechanisms(actual) == mechanisms(desired)
+            assert actual.out_profile.grain_size == actual[-1].out_profile.grain_size
+
+
+def test_deferred_solved_again():
+    import pyroll.jmak_recrystallization as prj
+
+    desired = solve_schedule("four_pass_cooling", "C45", grain_size=30e-6)
+
+    with (
+        prj.config_scope(DEFERRED_MICROSTRUCTURE=True),
+        prj.collect_diagnostics(emit_summary=False),
+    ):
+        sequence = solve_schedule("four_pass_cooling", "C45")
+        microstructure(sequence)
+        solve_schedule("four_pass_cooling", "C45", grain_size=30e-6, sequence=sequence)
+        np.testing.assert_allclose(
+            microstructure(sequence), microstructure(desired), rtol=1e-4, atol=1e-12
+        )
+
+
+def test_deferred_registration_unchanged():
+    from pyroll.core import Unit, root_hooks
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import deferred
+
+    def registered():
+        return (
+            list(root_hooks),
+            list(Unit.pre_processors),
+            list(Unit.post_processors),
+            [list(h.functions) for h in deferred.ROOT_HOOKS + deferred.UNIT_HOOKS],
+        )
+
+    before = registered()
+    assert deferred._clear_deferred in Unit.pre_processors
+    assert [h for h in root_hooks if h in deferred.ROOT_HOOKS] == deferred.ROOT_HOOKS
+
+    with prj.config_scope(DEFERRED_MICROSTRUCTURE=True):
+        assert registered() == before
+    prj.Config.DEFERRED_MICROSTRUCTURE = True
+    try:
+        assert registered() == before
+    finally:
+        del prj.Config.DEFERRED_MICROSTRUCTURE
+    assert registered() == before
+
+
+def test_deferred_solved_concurrently():
+    import pyroll.jmak_recrystallization as prj
+
+    desired = solve_schedule("four_pass_cooling", "C45")
+
+    sequences = [SCHEDULES["four_pass_cooling"][0]() for _ in range(8)]
+    in_profile = create_in_profile("C45", **SCHEDULES["four_pass_cooling"][1])
+    config = [{"DEFERRED_MICROSTRUCTURE": i % 2 == 0} for i in range(len(sequences))]
+    for _ in range(2):
+        prj.solve_concurrently(sequences, in_profile, config=config, max_workers=8)
+
+    for sequence, c in zip(sequences, config):
+        with prj.config_scope(**c), prj.collect_diagnostics(emit_summary=False):
+            np.testing.assert_allclose(
+                microstructure(sequence), microstructure(desired), rtol=1e-4, atol=1e-12
+            )
+            assert mechanisms(sequence) == mechanisms(desired)
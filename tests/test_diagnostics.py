@@ -0,0 +1,79 @@
+import logging
+
+from schedules import create_sequence, create_in_profile
+
+
+def plugin_warnings(caplog):
+    return [
+        r
+        for r in caplog.records
+        if r.levelno == logging.WARNING and "recrystallization" in r.getMessage()
+    ]
+
+
+def test_collect_diagnostics(caplog):
+    from pyroll.jmak_recrystallization import collect_diagnostics
+    from pyroll.jmak_recrystallization.diagnostics import METADYNAMIC_PARAMETERS_MISSING
+
+    caplog.set_level(logging.WARNING, logger="pyroll")
+
+    sequence = create_sequence()
+    with collect_diagnostics() as diagnostics:
+        sequence.solve(create_in_profile("CuZn30"))
+
+    assert diagnostics.count(METADYNAMIC_PARAMETERS_MISSING) > 0
+    assert diagnostics.count() == sum(diagnostics.by_condition().values())
+    assert set(diagnostics.by_unit()) <= {str(u) for u in sequence}
+    assert diagnostics.count(unit=str(sequence[1])) > 0
+
+    warnings = plugin_warnings(caplog)
+    assert len(warnings) == 1
+    assert str(sequence[1]) in warnings[0].getMessage()
+
+
+def test_collect_diagnostics_without_fallbacks(caplog):
+    from pyroll.jmak_recrystallization import collect_diagnostics
+
+    caplog.set_level(logging.WARNING, logger="pyroll")
+
+    with collect_diagnostics() as diagnostics:
+        create_sequence().solve(create_in_profile("S355J2"))
+
+    assert not diagnostics
+    assert diagnostics.count() == 0
+    assert not plugin_warnings(caplog)
+
+
+def test_report_once_per_unit(caplog):
+    import pyroll.jmak_recrystallization  # noqa: F401
+
+    caplog.set_level(logging.WARNING, logger="pyroll")
+
+    sequence = create_sequence()
+    sequence.solve(create_in_profile("CuZn30"))
+
+    warnings = plugin_warnings(caplog)
+    assert 0 < len(warnings) <= len(sequence)
+    assert len({(r.name, r.getMessage()) for r in warnings}) == len(warnings)
+
+
+def test_diagnostics_distinct_units_of_equal_name():
+    from pyroll.core import Transport
+    from pyroll.jmak_recrystallization import Diagnostics
+    from pyroll.jmak_recrystallization.diagnostics import STATIC_PARAMETERS_MISSING
+
+    first, second = Transport(label="T"), Transport(label="T")
+    diagnostics = Diagnostics()
+    diagnostics.record(STATIC_PARAMETERS_MISSING, first)
+    diagnostics.record(STATIC_PARAMETERS_MISSING, second)
+    diagnostics.record(STATIC_PARAMETERS_MISSING, second)
+
+    assert diagnostics.count(unit=first) == 1
+    assert diagnostics.count(unit=second) == 2
+    assert diagnostics.count(unit=str(first)) == 3
+    assert diagnostics.by_unit() == {str(first): {STATIC_PARAMETERS_MISSING: 3}}
+    assert "in 2 units" in diagnostics.summary()
+
+    assert diagnostics.first_report(STATIC_PARAMETERS_MISSING, first)
+    assert not diagnostics.first_report(STATIC_PARAMETERS_MISSING, first)
+    assert diagnostics.first_report(STATIC_PARAMETERS_MISSING, second)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from schedules import solve_schedule
+
+
+@pytest.fixture(scope="module")
+def program():
+    import pyroll.jmak_recrystallization as prj
+
+    return prj.compile_schedule(solve_schedule("four_pass_cooling", "C45"))
+
+
+def test_filter_without_measurements(program):
+    import pyroll.jmak_recrystallization as prj
+
+    pf = prj.ParticleFilter(
+        program,
+        particles=100,
+        grain_size_deviation=0,
+        temperature_deviation=0,
+        temperature_drift=0,
+    )
+    estimate = pf.advance(until=program.history.labels[-1])
+    assert estimate.label == program.history.labels[-1]
+    assert estimate.effective_sample_size == pytest.approx(100)
+
+    result = program.evaluate()
+    np.testing.assert_allclose(
+        [estimate.grain_size, estimate.recrystallized_fraction, estimate.strain],
+        [
+            result.out_grain_size[-1],
+            result.out_recrystallized_fraction[-1],
+            result.out_strain[-1],
+        ],
+        rtol=1e-12,
+    )
+    assert np.all(
+        pf.mechanism
+        == prj.RecrystallizationMechanism.encode(result.recrystallization_mechanism[-1])
+    )
+
+
+def test_filter_grain_size_measurement(program):
+    import pyroll.jmak_recrystallization as prj
+
+    pf = prj.ParticleFilter(program, particles=2000, grain_size_deviation=0.5, seed=0)
+    prior = pf.estimate()
+    estimate = pf.measure(grain_size=150e-6)
+
+    assert abs(estimate.grain_size - 150e-6) < 0.2 * abs(prior.grain_size - 150e-6)
+    assert estimate.grain_size_deviation < 0.5 * prior.grain_size_deviation
+    assert estimate.effective_sample_size == pytest.approx(2000)  # resampled
+
+
+def test_filter_temperature_measurements(program):
+    import pyroll.jmak_recrystallization as prj
+
+    history = program.history
+    truth = program._replace(
+        history=history._replace(temperature=history.temperature + 30)
+    ).evaluate()
+    nominal = program.evaluate()
+
+    pf = prj.ParticleFilter(program, particles=2000, temperature_deviation=30, seed=0)
+    for temperature in history.temperature + 30:
+        estimate = pf.advance()
+        estimate = pf.measure(temperature=temperature)
+
+    assert estimate.temperature_offset == pytest.approx(30, abs=5)
+    error = abs(estimate.grain_size - truth.out_grain_size[-1])
+    assert error < 0.25 * abs(nominal.out_grain_size[-1] - truth.out_grain_size[-1])
+
+
+def test_filter_errors(program):
+    import pyroll.jmak_recrystallization as prj
+
+    pf = prj.ParticleFilter(program, particles=10)
+    with pytest.raises(ValueError):
+        pf.measure(temperature=1300)
+    with pytest.raises(ValueError):
+        pf.advance(until="unknown")
+
+    pf.advance(until=program.history.labels[-1])
+    with pytest.raises(ValueError):
+        pf.advance()
@@ -0,0 +1,131 @@
+"""
+Regression harness comparing per-unit outputs of the model against stored reference results.
+
+The references are stored in ``tests/golden`` as one JSON file per schedule from :py:data:`schedules.SCHEDULES`,
+holding the outputs of each unit for each material in :py:data:`schedules.MATERIALS`.
+The cases are solved in parallel worker processes.
+Regenerate the references after intended changes of the model by running ``python tests/test_golden.py``.
+"""
+
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from schedules import MATERIALS, SCHEDULES, create_in_profile
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+RTOL = 1e-7
+ATOL = 1e-15
+
+UNIT_VALUES = [
+    "recrystallization_mechanism",
+    "recrystallized_fraction",
+    "recrystallized_grain_size",
+    "recrystallization_critical_strain",
+    "recrystallization_reference_strain",
+    "recrystallization_critical_time",
+    "recrystallization_reference_time",
+]
+
+PROFILE_VALUES = [
+    "grain_size",
+    "recrystallized_fraction",
+    "recrystallization_state",
+    "strain",
+]
+
+CASES = [(s, m) for s in SCHEDULES for m in MATERIALS]
+
+
+def compute_case(schedule: str, material: str):
+    """Solve a case and return the per-unit outputs as list of mappings."""
+    import pyroll.jmak_recrystallization as prj
+
+    factory, kwargs = SCHEDULES[schedule]
+    sequence = factory()
+
+    with prj.collect_diagnostics(emit_summary=False):
+        sequence.solve(create_in_profile(material, **kwargs))
+
+    def _value(instance, name):
+        if not instance.has_value(name):
+            return None
+        value = getattr(instance, name)
+        return value if isinstance(value, str) else float(value)
+
+    return [
+        {"label": u.label, "type": type(u).__name__}
+        | {n: _value(u, n) for n in UNIT_VALUES}
+        | {"out_" + n: _value(u.out_profile, n) for n in PROFILE_VALUES}
+        for u in sequence
+    ]
+
+
+def compute_cases(cases, max_workers=None):
+    """Compute the given cases in parallel worker processes, returning a mapping from case to outputs."""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {c: executor.submit(compute_case, *c) for c in cases}
+        return {c: f.result() for c, f in futures.items()}
+
+
+def load_reference(schedule: str):
+    return json.loads((GOLDEN_DIR / f"{schedule}.json").read_text(encoding="utf-8"))
+
+
+def compare(actual, desired, rtol=RTOL, atol=ATOL):
+    """Return a list of human-readable deviations between actual and desired per-unit outputs."""
+    if len(actual) != len(desired):
+        return [f"count of units differs: {len(actual)} != {len(desired)}"]
+
+    deviations = []
+    for a, d in zip(actual, desired):
+        for name, dv in d.items():
+            av = a.get(name, None)
+            if isinstance(dv, float) and isinstance(av, float):
+                if not math.isclose(av, dv, rel_tol=rtol, abs_tol=atol):
+                    deviations.append(f"{a['label']}.{name}: {av!r} != {dv!r}")
+            elif av != dv:
+                deviations.append(f"{a['label']}.{name}: {av!r} != {dv!r}")
+    return deviations
+
+
+@pytest.fixture(scope="module")
+def results():
+    return compute_cases(CASES)
+
+
+@pytest.mark.parametrize("schedule,material", CASES)
+def test_golden(results, schedule, material):
+    desired = load_reference(schedule)[material]
+    deviations = compare(results[(schedule, material)], desired)
+    assert not deviations, "\n".join(deviations)
+
+
+def test_compare_detects_deviations():
+    desired = load_reference("two_pass")["C45"]
+    actual = [dict(u) for u in desired]
+    actual[1]["out_grain_size"] *= 1 + 1e-6
+    actual[2]["recrystallization_mechanism"] = "none"
+
+    assert not compare(desired, desired)
+    assert len(compare(actual, desired)) == 2
+    assert compare(actual[:-1], desired)
+
+
+def update_references():
+    results = compute_cases(CASES)
+    GOLDEN_DIR.mkdir(exist_ok=True)
+
+    for schedule in SCHEDULES:
+        data = {m: results[(schedule, m)] for m in MATERIALS}
+        (GOLDEN_DIR / f"{schedule}.json").write_text(
+            json.dumps(data, indent=1) + "\n", encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    update_references()
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+PLUGIN = "pyroll.jmak_recrystallization"
+
+DEFERRED_MODULES = [
+    f"{PLUGIN}.parallel",
+    f"{PLUGIN}.server",
+    f"{PLUGIN}.lean",
+    f"{PLUGIN}.program",
+    f"{PLUGIN}.optimization",
+    f"{PLUGIN}.estimation",
+    "asyncio",
+]
+
+
+def import_times(module: str):
+    """Self and cumulative import times in microseconds per module as reported by ``python -X importtime``."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        # measure with cached bytecode, as installed packages are
+        env={k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"},
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def test_import_time():
+    runs = [
+        import_times(PLUGIN) for _ in range(3)
+    ]  # first run may include byte-compilation
+
+    own = min(sum(t[0] for n, t in r.items() if n.startswith(PLUGIN)) for r in runs)
+    core = min(r["pyroll.core"][1] for r in runs)
+
+    assert (
+        own < 0.03 * core
+    ), f"Import of {PLUGIN} takes {own / 1e3:.1f} ms on top of {core / 1e3:.1f} ms for pyroll.core"
+
+
+def test_optional_modules_deferred():
+    times = import_times(PLUGIN)
+
+    for m in DEFERRED_MODULES:
+        assert m not in times, f"{m} is imported eagerly"
+
+
+def test_lazy_attributes():
+    import pyroll.jmak_recrystallization as prj
+
+    assert "solve_concurrently" in dir(prj)
+    assert callable(prj.solve_concurrently)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from schedules import MATERIALS, create_sequence, create_in_profile
+
+
+def solve(material_id, disk_element_count, incremental):
+    import pyroll.core as pr
+    import pyroll.jmak_recrystallization as prj
+
+    sequence = create_sequence()
+    for u in sequence.roll_passes:
+        u.disk_element_count = disk_element_count
+
+    with prj.config_scope(INCREMENTAL_DYNAMIC_RECRYSTALLIZATION=incremental):
+        with prj.collect_diagnostics(emit_summary=False):
+            sequence.solve(create_in_profile(material_id, strain=0.5))
+
+    return [
+        (
+            u.recrystallized_fraction,
+            u.out_profile.grain_size,
+            u.recrystallization_mechanism,
+        )
+        for u in sequence
+        if isinstance(u, pr.BaseRollPass)
+    ]
+
+
+@pytest.mark.parametrize("material_id", MATERIALS)
+def test_incremental_equals_whole_pass(material_id):
+    desired = solve(material_id, 0, False)
+
+    for disk_element_count, rtol in [(0, 1e-12), (10, 1e-3)]:
+        actual = solve(material_id, disk_element_count, True)
+        for a, d in zip(actual, desired):
+            np.testing.assert_allclose(a[:2], d[:2], rtol=rtol)
+            assert a[2] == d[2]
+
+
+def test_incremental_kinetics():
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    p = material_parameters(["C45", "steel"]).dynamic
+    strain = np.array([0, 0.1, 0.5])
+    increments = np.full((3, 20), 0.02)
+    strain_rates = np.full((3, 20), 5)
+    temperatures = np.full((3, 20), 1273.15)
+
+    result = kinetics.incremental_dynamic_kinetics(
+        p, strain, increments, strain_rates, 50e-6, temperatures
+    )
+    whole = kinetics.roll_pass_kinetics(p, strain, 0.4, 5, 50e-6, 1273.15)
+
+    assert result.recrystallized_fraction.shape == (3, 20)
+    assert np.all(np.diff(result.recrystallized_fraction, axis=-1) >= 0)
+    np.testing.assert_allclose(
+        result.recrystallized_fraction[..., -1],
+        whole.recrystallized_fraction,
+        rtol=1e-12,
+    )
+    np.testing.assert_allclose(
+        result.mean_recrystallized_grain_size,
+        whole.recrystallized_grain_size,
+        rtol=1e-12,
+    )
+    assert list(result.recrystallization_mechanism) == list(
+        whole.recrystallization_mechanism
+    )
+
+    cooling = kinetics.incremental_dynamic_kinetics(
+        p, strain, increments, strain_rates, 50e-6, np.linspace(1273.15, 1173.15, 20)
+    )
+    assert np.all(
+        cooling.recrystallized_fraction[..., -1]
+        <= result.recrystallized_fraction[..., -1]
+    )
+
+
+def test_incremental_element_strain_rates():
+    import pyroll.core as pr
+
+    desired = solve("C45", 0, False)
+
+    def strain_rate(self: pr.BaseRollPass.DiskElement):
+        index = self.parent.disk_elements.index(self)
+        return self.parent.strain_rate * (
+            20 if index < len(self.parent.disk_elements) / 2 else 0.05
+        )
+
+    function = pr.BaseRollPass.DiskElement.strain_rate.add_function(strain_rate)
+    try:
+        actual = solve("C45", 10, True)
+    finally:
+        pr.BaseRollPass.DiskElement.strain_rate.remove_function(function)
+
+    assert any(
+        not np.allclose(a[:2], d[:2], rtol=1e-2) for a, d in zip(actual, desired)
+    )
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from pyroll.core import BaseRollPass, Transport
+from schedules import MATERIALS, create_sequence, create_in_profile
+
+
+def evaluate(instance, name):
+    """Evaluate the hook functions, as root hook values are set lagging one iteration behind."""
+    return getattr(type(instance), name).get_result(instance)
+
+
+def mean_temperature(unit):
+    return (unit.in_profile.temperature + unit.out_profile.temperature) / 2
+
+
+@pytest.mark.parametrize("durations", [(1, 1), (0.01, 10), (1e-4, 1e-3)])
+@pytest.mark.parametrize("material_id", MATERIALS)
+def test_batch_kinetics_equal_hooks(material_id, durations):
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    sequence = create_sequence(durations)
+    sequence.solve(create_in_profile(material_id))
+    parameters = material_parameters([material_id, "steel"])
+
+    for u in sequence:
+        ip = u.in_profile
+
+        if isinstance(u, BaseRollPass):
+            result = kinetics.roll_pass_kinetics(
+                parameters.dynamic,
+                ip.strain,
+                u.strain,
+                u.strain_rate,
+                ip.grain_size,
+                mean_temperature(u),
+            )
+        else:
+            try:
+                previous_mechanism = u.prev.recrystallization_mechanism
+            except IndexError:
+                previous_mechanism = "none"
+
+            result = kinetics.transport_kinetics(
+                parameters.metadynamic,
+                parameters.static,
+                parameters.grain_growth,
+                previous_mechanism,
+                ip.strain,
+                u.prev_of(BaseRollPass).strain_rate,
+                ip.grain_size,
+                ip.recrystallized_fraction,
+                u.duration,
+                mean_temperature(u),
+            )
+            assert result.recrystallization_critical_time == pytest.approx(
+                u.recrystallization_critical_time, rel=1e-12
+            )
+
+        op = u.out_profile
+        assert result.recrystallization_mechanism == u.recrystallization_mechanism
+        assert result.recrystallized_fraction == pytest.approx(
+            u.recrystallized_fraction, rel=1e-12
+        )
+        assert result.out_grain_size == pytest.approx(
+            evaluate(op, "grain_size"), rel=1e-12
+        )
+        assert result.out_recrystallized_fraction == pytest.approx(
+            evaluate(op, "recrystallized_fraction"), rel=1e-12
+        )
+        if isinstance(u, Transport):
+            assert result.out_strain == pytest.approx(evaluate(op, "strain"), rel=1e-12)
+
+
+def test_batch_kinetics_broadcasting():
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    parameters = material_parameters("C45")
+    temperatures = np.linspace(1100, 1400, 7)
+
+    batch = kinetics.roll_pass_kinetics(
+        parameters.dynamic, 0, 0.8, 10, 50e-6, temperatures
+    )
+    single = [
+        kinetics.roll_pass_kinetics(parameters.dynamic, 0, 0.8, 10, 50e-6, t)
+        for t in temperatures
+    ]
+
+    assert batch.out_grain_size.shape == temperatures.shape
+    np.testing.assert_allclose(batch.out_grain_size, [s.out_grain_size for s in single])
+    np.testing.assert_array_equal(
+        batch.recrystallization_mechanism,
+        [s.recrystallization_mechanism for s in single],
+    )
+
+    no_parameters = kinetics.roll_pass_kinetics(None, 0, 0.8, 10, 50e-6, temperatures)
+    assert np.all(no_parameters.recrystallization_mechanism == "none")
+    np.testing.assert_array_equal(no_parameters.out_grain_size, 50e-6)
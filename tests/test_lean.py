@@ -0,0 +1,43 @@
+import gc
+
+import numpy as np
+import pytest
+from pyroll.core import Unit
+from schedules import SCHEDULES, create_in_profile, solve_schedule
+
+
+def count_unit_profiles():
+    gc.collect()
+    return sum(1 for o in gc.get_objects() if isinstance(o, Unit.Profile))
+
+
+@pytest.mark.parametrize("material_id", ["C45", "CuZn30"])
+@pytest.mark.parametrize("schedule", SCHEDULES)
+def test_solve_lean(schedule, material_id):
+    import pyroll.jmak_recrystallization as prj
+
+    factory, kwargs = SCHEDULES[schedule]
+
+    desired = solve_schedule(schedule, material_id)
+
+    sequence = factory()
+    profiles = count_unit_profiles()
+    with prj.collect_diagnostics(emit_summary=False):
+        record = prj.solve_lean(sequence, create_in_profile(material_id, **kwargs))
+
+    assert count_unit_profiles() == profiles
+    for u in sequence:
+        assert u.in_profile is None and not u.subunits and not u.__cache__
+
+    assert record.labels == tuple(u.label for u in desired)
+    assert list(record.recrystallization_mechanism) == [
+        u.recrystallization_mechanism for u in desired
+    ]
+    for name in ["recrystallized_fraction", "grain_size", "strain"]:
+        np.testing.assert_allclose(
+            getattr(record, "out_" + name),
+            [getattr(u.out_profile, name) for u in desired],
+            rtol=1e-4,
+            atol=1e-12,
+        )
+    assert record.out_profile.grain_size == record.out_grain_size[-1]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from schedules import solve_schedule
+
+
+@pytest.fixture(scope="module")
+def program():
+    import pyroll.jmak_recrystallization as prj
+
+    return prj.compile_schedule(solve_schedule("four_pass_cooling", "C45"))
+
+
+def test_optimize_schedule(program):
+    import pyroll.jmak_recrystallization as prj
+
+    history = program.history
+    options = dict(
+        duration_bounds=(0.1, 20),
+        temperature_bounds=(1173.15, 1373.15),
+        max_grain_size=100e-6,
+        full_recrystallization_before=history.labels[-1],
+        population_size=40,
+        generations=20,
+        seed=0,
+    )
+    front = prj.optimize_schedule(program, **options)
+
+    assert len(front.grain_size) > 0
+    assert (
+        len(front.transport_labels)
+        == front.durations.shape[1]
+        == np.count_nonzero(~history.is_roll_pass)
+    )
+    assert np.all((front.durations >= 0.1) & (front.durations <= 20))
+    assert np.all((front.temperatures >= 1173.15) & (front.temperatures <= 1373.15))
+    assert np.all(front.grain_size <= 100e-6)
+
+    # sorted by cycle time and non-dominated
+    assert np.all(np.diff(front.cycle_time) > 0)
+    assert np.all(np.diff(front.grain_size) < 0)
+
+    # results reproduce with the history varied accordingly
+    transports = np.flatnonzero(~history.is_roll_pass)
+    durations = np.array(
+        np.broadcast_to(history.duration, (len(front.grain_size), len(history.labels)))
+    )
+    temperatures = np.array(np.broadcast_to(history.temperature, durations.shape))
+    durations[:, transports] = front.durations
+    temperatures[:, transports] = front.temperatures
+
+    result = program._replace(
+        history=history._replace(duration=durations, temperature=temperatures)
+    ).evaluate()
+    np.testing.assert_allclose(
+        result.out_grain_size[:, -1], front.grain_size, rtol=1e-12
+    )
+    np.testing.assert_allclose(durations.sum(axis=-1), front.cycle_time, rtol=1e-12)
+    assert np.all(result.out_recrystallized_fraction[:, -2] > 0.95)
+
+    # reproducible by the seed
+    again = prj.optimize_schedule(program, **options)
+    np.testing.assert_array_equal(again.grain_size, front.grain_size)
+
+
+def test_optimize_schedule_errors(program):
+    import pyroll.jmak_recrystallization as prj
+
+    with pytest.raises(ValueError):
+        prj.optimize_schedule(
+            program, (0.1, 20), full_recrystallization_before="unknown"
+        )
+
+    with pytest.raises(ValueError):
+        prj.optimize_schedule(program, (20, 0.1))
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+from schedules import MATERIALS, create_sequence, create_in_profile
+
+
+def results(sequence):
+    return [
+        (
+            u.out_profile.grain_size,
+            u.out_profile.recrystallized_fraction,
+            u.out_profile.strain,
+            u.recrystallization_mechanism,
+        )
+        for u in sequence
+    ]
+
+
+def assert_results_equal(actual, desired):
+    for a, d in zip(actual, desired):
+        np.testing.assert_allclose(a[:3], d[:3], rtol=1e-9)
+        assert a[3] == d[3]
+
+
+def test_solve_concurrently():
+    from pyroll.core import HookFunction
+    import pyroll.jmak_recrystallization as prj
+
+    materials = MATERIALS * 4
+    in_profiles = [create_in_profile(m) for m in materials]
+
+    serial = [create_sequence() for _ in materials]
+    for s, p in zip(serial, in_profiles):
+        s.solve(p)
+
+    concurrent = [create_sequence() for _ in materials]
+    out_profiles = prj.solve_concurrently(concurrent, in_profiles, max_workers=8)
+
+    assert len(out_profiles) == len(materials)
+    assert (
+        vars(HookFunction).get("cycle", False) is False
+    )  # thread-local flags only while solving
+    for s, c in zip(serial, concurrent):
+        assert_results_equal(results(c), results(s))
+
+
+def test_solve_concurrently_scoped_config():
+    import pyroll.jmak_recrystallization as prj
+
+    thresholds = [0.01, 0.2, 0.45] * 4
+    in_profile = create_in_profile("C45")
+
+    serial = [create_sequence() for _ in thresholds]
+    for s, t in zip(serial, thresholds):
+        with prj.config_scope(THRESHOLD=t):
+            s.solve(in_profile)
+
+    concurrent = [create_sequence() for _ in thresholds]
+    prj.solve_concurrently(
+        concurrent,
+        in_profile,
+        config=[{"THRESHOLD": t} for t in thresholds],
+        max_workers=6,
+    )
+
+    assert prj.Config.THRESHOLD == 0.05
+    for s, c in zip(serial, concurrent):
+        assert_results_equal(results(c), results(s))
+
+
+def test_config_scope(monkeypatch):
+    import pyroll.jmak_recrystallization as prj
+
+    monkeypatch.setenv("PYROLL_JMAK_RECRYSTALLIZATION_BASE_STRAIN", "0.03")
+    assert prj.Config.BASE_STRAIN == 0.03
+    monkeypatch.delenv("PYROLL_JMAK_RECRYSTALLIZATION_BASE_STRAIN")
+
+    with prj.config_scope(THRESHOLD=0.1, BASE_STRAIN=0.02):
+        assert prj.Config.THRESHOLD == 0.1
+        with prj.config_scope(THRESHOLD=0.2):
+            assert prj.Config.THRESHOLD == 0.2
+            assert prj.Config.BASE_STRAIN == 0.02
+        assert prj.Config.THRESHOLD == 0.1
+
+    assert prj.Config.THRESHOLD == 0.05
+
+    with pytest.raises(AttributeError):
+        with prj.config_scope(UNKNOWN=1):
+            pass
+
+
+def test_solve_concurrently_requires_distinct_sequences():
+    import pyroll.jmak_recrystallization as prj
+
+    s = create_sequence()
+    with pytest.raises(ValueError):
+        prj.solve_concurrently([s, s], create_in_profile("C45"))
+
+
+def test_solve_concurrently_rejects_unsafe_config(monkeypatch):
+    import pyroll.jmak_recrystallization as prj
+    from pyroll.jmak_recrystallization import config, parallel
+
+    assert all(hasattr(prj.Config, n) for n in config.SCOPE_SAFE_VALUES)
+
+    sequences = [create_sequence(), create_sequence()]
+    with pytest.raises(ValueError):
+        prj.solve_concurrently(
+            sequences, create_in_profile("C45"), config=[{}, {"UNKNOWN": 1}]
+        )
+
+    monkeypatch.setattr(
+        parallel, "SCOPE_SAFE_VALUES", config.SCOPE_SAFE_VALUES - {"THRESHOLD"}
+    )
+    with pytest.raises(ValueError):
+        prj.solve_concurrently(
+            sequences, create_in_profile("C45"), config={"THRESHOLD": 0.1}
+        )
+    assert all(s.in_profile is None for s in sequences)
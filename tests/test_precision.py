@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from schedules import MATERIALS
+
+WELL_CONDITIONED = [m for m in MATERIALS if m != "C-Mn"]
+
+
+def conditions(count):
+    rng = np.random.default_rng(42)
+    return dict(
+        strain=rng.uniform(0, 2, count),
+        pass_strain=rng.uniform(0, 1, count),
+        strain_rate=10 ** rng.uniform(-1, 2, count),
+        grain_size=10 ** rng.uniform(-5, np.log10(300e-6), count),
+        recrystallized_fraction=rng.uniform(0, 1, count),
+        duration=10 ** rng.uniform(-3, 2, count),
+        temperature=rng.uniform(1073.15, 1523.15, count),
+        previous_mechanism=rng.choice(
+            ["dynamic", "metadynamic", "static", "grain_growth", "none"], count
+        ),
+    )
+
+
+def assert_within_tolerance(actual, desired, mask=True):
+    from pyroll.jmak_recrystallization.kinetics import REDUCED_PRECISION_TOLERANCE
+
+    for name in desired._fields:
+        a = getattr(actual, name)
+        d = getattr(desired, name)
+        if name == "out_grain_size":
+            a, d = a[mask], d[mask]
+
+        if d.dtype.kind == "U":
+            np.testing.assert_array_equal(a, d)
+            continue
+
+        assert a.dtype == np.float32, name
+        if "fraction" in name:
+            np.testing.assert_allclose(
+                a, d, rtol=0, atol=REDUCED_PRECISION_TOLERANCE, err_msg=name
+            )
+        else:
+            np.testing.assert_allclose(
+                a, d, rtol=REDUCED_PRECISION_TOLERANCE, atol=0, err_msg=name
+            )
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("material_id", WELL_CONDITIONED)
+def test_reduced_precision_within_tolerance(material_id):
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    p = material_parameters([material_id, "steel"])
+    c = conditions(100_000)
+
+    for dtype in [None, np.float32]:
+        roll_pass = kinetics.roll_pass_kinetics(
+            p.dynamic,
+            c["strain"],
+            c["pass_strain"],
+            c["strain_rate"],
+            c["grain_size"],
+            c["temperature"],
+            dtype=dtype,
+        )
+        transport = kinetics.transport_kinetics(
+            p.metadynamic,
+            p.static,
+            p.grain_growth,
+            c["previous_mechanism"],
+            c["strain"],
+            c["strain_rate"],
+            c["grain_size"],
+            c["recrystallized_fraction"],
+            c["duration"],
+            c["temperature"],
+            dtype=dtype,
+        )
+
+        if dtype is None:
+            desired = roll_pass, transport
+        else:
+            assert_within_tolerance(roll_pass, desired[0])
+            # growth of recrystallized grains from zero size right after the finished time is ill-conditioned
+            finished = desired[1].recrystallization_finished_time
+            assert_within_tolerance(
+                transport,
+                desired[1],
+                np.abs(c["duration"] - finished) > 1e-3 * finished,
+            )
+
+
+def test_reduced_precision_stacked():
+    from pyroll.jmak_recrystallization import kinetics
+
+    p = kinetics.stack_material_parameters([[m, "steel"] for m in WELL_CONDITIONED])
+    strain = np.linspace(0.1, 1, len(WELL_CONDITIONED))
+
+    desired = kinetics.transport_kinetics(
+        p.metadynamic,
+        p.static,
+        p.grain_growth,
+        "dynamic",
+        strain,
+        5,
+        50e-6,
+        0.3,
+        0.5,
+        1273.15,
+    )
+    actual = kinetics.transport_kinetics(
+        p.metadynamic,
+        p.static,
+        p.grain_growth,
+        "dynamic",
+        strain,
+        5,
+        50e-6,
+        0.3,
+        0.5,
+        1273.15,
+        dtype=np.float32,
+    )
+    assert_within_tolerance(actual, desired)
+
+
+def test_protected_terms():
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    p = material_parameters("C20")
+
+    # d2 * duration exceeds the range of single precision without evaluating d2 * exp(q/RT) first
+    grown = kinetics.grain_growth(
+        p.grain_growth, np.float32(50e-6), np.float32(10), np.float32(1273.15)
+    )
+    assert grown.dtype == np.float32
+    np.testing.assert_allclose(
+        grown, kinetics.grain_growth(p.grain_growth, 50e-6, 10, 1273.15), rtol=1e-6
+    )
+
+    # log(1 - X) loses all significant digits for small X in single precision
+    t = kinetics.virtual_time(p.static, np.float32(1e-9), np.float32(0), np.float32(1))
+    np.testing.assert_allclose(
+        t, kinetics.virtual_time(p.static, 1e-9, 0, 1), rtol=1e-6
+    )
@@ -0,0 +1,91 @@
+import dataclasses
+
+import numpy as np
+import pytest
+from schedules import SCHEDULES, solve_schedule
+
+STATES = [(20e-6, 0), (50e-6, 0.5), (150e-6, 1)]
+
+
+@pytest.mark.parametrize("material_id", ["C45", "CuZn30"])
+@pytest.mark.parametrize("schedule", SCHEDULES)
+def test_program_equals_solution(schedule, material_id):
+    import pyroll.jmak_recrystallization as prj
+
+    sequences = [
+        solve_schedule(schedule, material_id, grain_size=g, recrystallized_fraction=f)
+        for g, f in STATES
+    ]
+    program = prj.compile_schedule(sequences[0])
+
+    grain_size, fraction = np.transpose(STATES)
+    result = program.evaluate(grain_size=grain_size, recrystallized_fraction=fraction)
+    assert result.out_grain_size.shape == (len(STATES), len(sequences[0]))
+
+    for i, sequence in enumerate(sequences):
+        units = sequence.units
+        assert list(result.recrystallization_mechanism[i]) == [
+            u.recrystallization_mechanism for u in units
+        ]
+        for name in ["grain_size", "recrystallized_fraction", "strain"]:
+            np.testing.assert_allclose(
+                getattr(result, "out_" + name)[i],
+                [getattr(u.out_profile, name) for u in units],
+                rtol=1e-4,
+                atol=1e-12,
+            )
+
+    masks = result.masks()
+    assert sum(m.astype(int) for m in masks.values()).min() == 1
+
+
+def test_program_parameter_perturbation():
+    import pyroll.jmak_recrystallization as prj
+
+    program = prj.compile_schedule(
+        solve_schedule(
+            "four_pass_cooling", "C45", grain_size=80e-6, recrystallized_fraction=0
+        )
+    )
+    p = program.parameters
+    factors = np.array([0.8, 1, 1.2])
+
+    perturbed = p._replace(
+        static=dataclasses.replace(p.static, b1=p.static.b1 * factors)
+    )
+    result = program.evaluate(
+        grain_size=np.full((1000, 1), 80e-6), parameters=perturbed
+    )
+    assert result.out_grain_size.shape == (1000, 3, len(program.history.labels))
+
+    for j, f in enumerate(factors):
+        single = program.evaluate(
+            parameters=p._replace(
+                static=dataclasses.replace(p.static, b1=p.static.b1 * f)
+            )
+        )
+        np.testing.assert_allclose(
+            result.out_grain_size[0, j], single.out_grain_size, rtol=1e-12
+        )
+
+    np.testing.assert_allclose(
+        result.out_grain_size[0, 1], program.evaluate().out_grain_size, rtol=1e-12
+    )
+
+
+def test_compile_incremental():
+    import pyroll.jmak_recrystallization as prj
+
+    sequence = solve_schedule("four_pass_cooling", "C45")
+
+    with prj.config_scope(INCREMENTAL_DYNAMIC_RECRYSTALLIZATION=True):
+        prj.compile_schedule(sequence)
+
+        for u in sequence.roll_passes:
+            u.disk_element_count = 5
+        solve_schedule("four_pass_cooling", "C45", sequence=sequence)
+
+        with pytest.raises(ValueError):
+            prj.compile_schedule(sequence)
+        with pytest.raises(ValueError):
+            prj.screen_materials(sequence)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from schedules import MATERIALS, SCHEDULES, create_in_profile, solve_schedule
+
+
+@pytest.mark.parametrize("schedule", SCHEDULES)
+def test_screen_materials(schedule):
+    import pyroll.jmak_recrystallization as prj
+
+    sequences = {m: solve_schedule(schedule, m) for m in MATERIALS}
+
+    result = prj.screen_materials(sequences["C45"], [[m, "steel"] for m in MATERIALS])
+    assert result.out_grain_size.shape == (len(MATERIALS), len(sequences["C45"]))
+
+    for i, m in enumerate(MATERIALS):
+        units = sequences[m].units
+        assert list(result.recrystallization_mechanism[i]) == [
+            u.recrystallization_mechanism for u in units
+        ]
+        for name in ["grain_size", "recrystallized_fraction", "strain"]:
+            np.testing.assert_allclose(
+                getattr(result, "out_" + name)[i],
+                [getattr(u.out_profile, name) for u in units],
+                rtol=1e-4,
+                atol=1e-12,
+            )
+
+
+def test_stack_parameters():
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    stacked = kinetics.stack_material_parameters(["C45", "S355J2", "unknown"])
+    assert list(kinetics.available(stacked.dynamic)) == [True, True, False]
+    assert list(kinetics.available(stacked.metadynamic)) == [False, True, False]
+    assert stacked.static.b1[0] == material_parameters("C45").static.b1
+
+    assert kinetics.stack_material_parameters(["unknown"]).dynamic is None
+    assert kinetics.available(material_parameters("C45").dynamic)
+    assert not kinetics.available(None)
+
+
+def test_screening_table():
+    import pyroll.jmak_recrystallization as prj
+
+    sequence = SCHEDULES["two_pass"][0]()
+    with prj.collect_diagnostics(emit_summary=False):
+        sequence.solve(create_in_profile("C45"))
+
+    table = prj.screen_materials(sequence).table("out_grain_size")
+    assert list(table) == list(prj.MATERIALS)
+    assert list(table["C45"]) == [u.label for u in sequence]
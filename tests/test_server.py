@@ -0,0 +1,197 @@
+import asyncio
+import sys
+
+import numpy as np
+import pytest
+
+ROLL_PASS_QUERY = {
+    "material": "C45",
+    "unit": "roll_pass",
+    "strain": 0,
+    "pass_strain": 0.8,
+    "strain_rate": 10,
+    "grain_size": 50e-6,
+    "temperature": 1273.15,
+}
+
+TRANSPORT_QUERY = {
+    "material": "S355J2",
+    "unit": "transport",
+    "previous_mechanism": "dynamic",
+    "strain": 0.5,
+    "strain_rate": 10,
+    "grain_size": 50e-6,
+    "recrystallized_fraction": 0,
+    "duration": 1,
+    "temperature": 1273.15,
+}
+
+
+def queries(count):
+    temperatures = np.linspace(1100, 1400, count)
+    for i, t in enumerate(temperatures):
+        yield dict(ROLL_PASS_QUERY if i % 2 else TRANSPORT_QUERY, temperature=t)
+
+
+def expected(query):
+    from pyroll.jmak_recrystallization import kinetics, material_parameters
+
+    parameters = material_parameters(query["material"])
+    inputs = {k: v for k, v in query.items() if k not in ["material", "unit"]}
+    if query["unit"] == "roll_pass":
+        return kinetics.roll_pass_kinetics(parameters.dynamic, **inputs)
+    return kinetics.transport_kinetics(
+        parameters.metadynamic, parameters.static, parameters.grain_growth, **inputs
+    )
+
+
+def check_responses(qs, responses):
+    for q, r in zip(qs, responses):
+        assert "error" not in r
+        e = expected(q)
+        assert (
+            r["result"]["recrystallization_mechanism"] == e.recrystallization_mechanism
+        )
+        assert r["result"]["out_grain_size"] == pytest.approx(
+            float(e.out_grain_size), rel=1e-12
+        )
+        assert r["result"]["recrystallized_fraction"] == pytest.approx(
+            float(e.recrystallized_fraction), rel=1e-12, abs=1e-15
+        )
+        assert r["latency"] >= 0
+
+
+def test_server_tcp():
+    from pyroll.jmak_recrystallization.server import PredictionServer, PredictionClient
+
+    qs = list(queries(200))
+
+    async def run():
+        async with PredictionServer(max_batch_size=64, max_delay=5e-3) as server:
+            await server.start(port=0)
+            port = server.sockets[0].getsockname()[1]
+
+            async with await PredictionClient().connect(port=port) as client:
+                responses = await client.predict_many(qs)
+                metrics = await client.metrics()
+
+                invalid = await client.predict({"material": "C45", "unit": "furnace"})
+                incomplete = await client.predict(
+                    {"material": "C45", "unit": "roll_pass"}
+                )
+                non_scalar = await client.predict(
+                    dict(ROLL_PASS_QUERY, temperature=[1200, 1300])
+                )
+                unknown = await client.predict(
+                    dict(TRANSPORT_QUERY, previous_mechanism="furnace")
+                )
+                after = await client.predict(ROLL_PASS_QUERY)
+
+        return responses, metrics, [invalid, incomplete, non_scalar, unknown], after
+
+    responses, metrics, errors, after = asyncio.run(run())
+
+    check_responses(qs, responses)
+
+    assert metrics.request_count == len(qs)
+    assert metrics.batch_count < len(qs)
+    assert metrics.max_batch_size <= 64
+    assert metrics.mean_batch_size > 1
+    assert metrics.throughput > 0
+
+    for r in errors:
+        assert "error" in r
+    check_responses([ROLL_PASS_QUERY], [after])
+
+
+def test_server_plain_protocol():
+    import json
+    from pyroll.jmak_recrystallization.server import PredictionServer
+
+    # previous mechanism and recrystallized fraction equal the defaults
+    defaults = ["previous_mechanism", "recrystallized_fraction"]
+    query = {k: v for k, v in TRANSPORT_QUERY.items() if k not in defaults}
+    query["id"] = "first"
+
+    async def run():
+        async with PredictionServer() as server:
+            await server.start(port=0)
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", server.sockets[0].getsockname()[1]
+            )
+            writer.write(json.dumps(query).encode() + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            writer.close()
+            await writer.wait_closed()
+        return response
+
+    response = asyncio.run(run())
+
+    assert response["id"] == "first"
+    check_responses([TRANSPORT_QUERY], [response])
+
+
+def test_client_closed_by_server():
+    from pyroll.jmak_recrystallization.server import PredictionClient
+
+    async def run():
+        closed = asyncio.Event()
+
+        async def handle(reader, writer):
+            await closed.wait()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        async with server:
+            client = await PredictionClient().connect(
+                port=server.sockets[0].getsockname()[1]
+            )
+            cancelled = asyncio.get_running_loop().create_future()
+            cancelled.cancel()
+            pending = asyncio.get_running_loop().create_future()
+            client._pending.update({-1: cancelled, -2: pending})
+
+            closed.set()
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(pending, 5)
+            await client.close()
+
+    asyncio.run(run())
+
+
+def test_server_in_process_batching():
+    from pyroll.jmak_recrystallization.server import PredictionServer
+
+    qs = list(queries(50))
+
+    async def run():
+        async with PredictionServer(max_delay=5e-3) as server:
+            return (
+                await asyncio.gather(*(server.predict(q) for q in qs)),
+                server.metrics,
+            )
+
+    responses, metrics = asyncio.run(run())
+
+    check_responses(qs, responses)
+    assert metrics.batch_count == 1
+    assert all(r["batch_size"] == len(qs) for r in responses)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix domain sockets not available."
+)
+def test_server_unix_socket(tmp_path):
+    from pyroll.jmak_recrystallization.server import PredictionServer, PredictionClient
+
+    path = str(tmp_path / "jmak.sock")
+    qs = list(queries(20))
+
+    async def run():
+        async with PredictionServer() as server:
+            await server.start(path=path)
+            async with await PredictionClient().connect(path=path) as client:
+                return await client.predict_many(qs)
+
+    check_responses(qs, asyncio.run(run()))